@@ -23,8 +23,9 @@ import logging
 
 # Import debate system components
 from src.config import DebateConfig
-from src.graph import stream_debate, run_debate
+from src.graph import stream_debate_events, run_debate
 from src.models import DebateTurn
+from src.telemetry import debate_report
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -248,7 +249,12 @@ def render_agent_message(turn: Dict[str, Any], index: int):
             st.markdown(content)
         
         # Footer with metadata
-        st.caption(f"📝 {word_count} words")
+        caption = f"📝 {word_count} words"
+        if turn.get("prompt_tokens"):
+            caption += f" • 📥 {turn['prompt_tokens']} prompt tokens"
+        if turn.get("reasoning_tokens"):
+            caption += f" • 🧠 {turn['reasoning_tokens']} reasoning / {turn.get('answer_tokens', 0)} answer tokens"
+        st.caption(caption)
 
 
 def render_thinking_indicator(role: str, placeholder):
@@ -307,6 +313,22 @@ def render_verdict_panel(verdict: Dict[str, Any]):
     if summary:
         st.info(f"📋 {summary}")
     
+    # Scores per dimension
+    proponent_scores = verdict.get("proponent_scores") or {}
+    opposition_scores = verdict.get("opposition_scores") or {}
+    if proponent_scores or opposition_scores:
+        rows = []
+        for dimension in dict.fromkeys([*proponent_scores, *opposition_scores]):
+            proponent = proponent_scores.get(dimension, {})
+            opposition = opposition_scores.get(dimension, {})
+            rows.append({
+                "Dimension": dimension.title(),
+                "Proponent": proponent.get("score"),
+                "Opposition": opposition.get("score"),
+                "Notes": proponent.get("justification") or opposition.get("justification", ""),
+            })
+        st.table(rows)
+    
     # Detailed reasoning
     reasoning = verdict.get("reasoning", "")
     if reasoning:
@@ -318,11 +340,44 @@ def render_verdict_panel(verdict: Dict[str, Any]):
 # Debate Execution (Using Placeholders - No Rerun)
 # ============================================================================
 
+def render_live_message(role: str, phase: str, round_num: int, content: str, placeholder):
+    """
+    Render a message that is still being generated.
+    
+    Args:
+        role: Agent role generating the message
+        phase: Debate phase of the turn
+        round_num: Round number of the turn
+        content: Text received so far
+        placeholder: Streamlit placeholder to render in
+    """
+    config = AGENT_CONFIG.get(role, AGENT_CONFIG["proponent"])
+    phase_label, phase_class = PHASE_BADGES.get(phase, ("Unknown", ""))
+    
+    header = f"{config['icon']} **{config['name']}**"
+    if phase == "rebuttal" and round_num > 0:
+        header += f" • Round {round_num}"
+    
+    with placeholder.container():
+        with st.chat_message(role, avatar=config["avatar"]):
+            col1, col2 = st.columns([3, 1])
+            with col1:
+                st.markdown(f"### {header}")
+            with col2:
+                st.markdown(f"<span class='phase-badge {phase_class}'>{phase_label}</span>", 
+                           unsafe_allow_html=True)
+            
+            # Trailing cursor shows the turn is still streaming
+            st.markdown(content + "▌")
+
+
 def run_debate_with_ui(topic: str, max_rounds: int, model: str, message_container):
     """
-    Execute a debate, rendering each message as it completes.
+    Execute a debate, rendering tokens as agents generate them.
     
-    Uses placeholders to update UI without triggering reruns.
+    Each turn streams into a live placeholder, which is replaced by the
+    final formatted message once the agent node completes. Uses
+    placeholders to update UI without triggering reruns.
     
     Args:
         topic: The debate proposition
@@ -340,69 +395,73 @@ def run_debate_with_ui(topic: str, max_rounds: int, model: str, message_containe
         st.error(f"Configuration error: {e}")
         return
     
-    # Track which agents we expect next
-    debate_flow = []
-    
-    # Opening
-    debate_flow.append(("proponent", "opening", 0))
-    debate_flow.append(("opposition", "opening", 0))
-    
-    # Rebuttals
-    for r in range(1, max_rounds + 1):
-        debate_flow.append(("proponent", "rebuttal", r))
-        debate_flow.append(("opposition", "rebuttal", r))
-    
-    # Closing
-    debate_flow.append(("proponent", "closing", 0))
-    debate_flow.append(("opposition", "closing", 0))
-    
-    # Judge
-    debate_flow.append(("judge", "verdict", 0))
-    
     try:
-        # Use streaming to get messages one by one
         message_index = 0
+        live_turn = None  # (role, phase, round_number) currently streaming
+        live_text = ""
+        live_placeholder = None
         
-        for event in stream_debate(topic=topic, max_rounds=max_rounds, config=config):
-            for node_name, node_output in event.items():
-                # Handle new turns
-                new_turns = node_output.get("history", [])
-                for turn in new_turns:
-                    # Convert DebateTurn to dict for storage
-                    turn_dict = {
-                        "role": turn.role,
-                        "phase": turn.phase,
-                        "round_number": turn.round_number,
-                        "content": turn.content,
-                        "word_count": turn.word_count,
-                        "timestamp": turn.timestamp.isoformat(),
-                    }
-                    
-                    # Store in session state
-                    st.session_state.debate_messages.append(turn_dict)
-                    
-                    # Update current round
-                    if turn.round_number > st.session_state.current_round:
-                        st.session_state.current_round = turn.round_number
-                    
-                    # Render the message immediately
+        for event in stream_debate_events(topic=topic, max_rounds=max_rounds, config=config):
+            if event.kind == "token":
+                turn_key = (event.role, event.phase, event.round_number)
+                if turn_key != live_turn:
+                    live_turn = turn_key
+                    live_text = ""
                     with message_container:
-                        render_agent_message(turn_dict, message_index)
-                    
-                    message_index += 1
-                    
-                    # Show who's thinking next (if not judge verdict)
-                    if message_index < len(debate_flow):
-                        next_role, next_phase, _ = debate_flow[message_index]
-                        config = AGENT_CONFIG.get(next_role, AGENT_CONFIG["proponent"])
-                        with message_container:
-                            with st.status(config["thinking_text"], expanded=True) as status:
-                                st.write(f"Preparing {next_phase} arguments...")
+                        live_placeholder = st.empty()
+                
+                live_text += event.delta
+                render_live_message(*live_turn, live_text, live_placeholder)
+                continue
+            
+            if event.kind == "reset":
+                # The call failed mid-stream and is retried; drop its partial text
+                live_text = ""
+                if live_placeholder is not None:
+                    live_placeholder.empty()
+                continue
+            
+            node_output = event.update
+            
+            # Handle new turns
+            new_turns = node_output.get("history", [])
+            for turn in new_turns:
+                # Convert DebateTurn to dict for storage
+                turn_dict = {
+                    "role": turn.role,
+                    "phase": turn.phase,
+                    "round_number": turn.round_number,
+                    "content": turn.content,
+                    "word_count": turn.word_count,
+                    "prompt_tokens": turn.prompt_tokens,
+                    "reasoning_tokens": turn.reasoning_tokens,
+                    "answer_tokens": turn.answer_tokens,
+                    "metrics": turn.metrics.model_dump(),
+                    "timestamp": turn.timestamp.isoformat(),
+                }
                 
-                # Handle verdict
-                if "verdict" in node_output and node_output["verdict"]:
-                    st.session_state.final_verdict = node_output["verdict"]
-                    
+                # Store in session state
+                st.session_state.debate_messages.append(turn_dict)
+                
+                # Update current round
+                if turn.round_number > st.session_state.current_round:
+                    st.session_state.current_round = turn.round_number
+                
+                # Replace the live placeholder with the final message
+                if live_placeholder is not None:
+                    live_placeholder.empty()
+                    live_placeholder = None
+                live_turn = None
+                
+                with message_container:
+                    render_agent_message(turn_dict, message_index)
+                
+                message_index += 1
+            
+            # Handle verdict
+            if "verdict" in node_output and node_output["verdict"]:
+                st.session_state.final_verdict = node_output["verdict"]
+    
     except Exception as e:
         st.error(f"Debate error: {e}")
         logger.exception("Debate failed")
@@ -471,6 +530,51 @@ def export_transcript_json() -> str:
 # Sidebar UI
 # ============================================================================
 
+def render_performance():
+    """Show where the debate's time, tokens and money went, per node."""
+    turns = [
+        DebateTurn.model_validate(message)
+        for message in st.session_state.debate_messages
+        if "metrics" in message
+    ]
+    if not turns:
+        return
+    
+    report = debate_report(turns)
+    totals = report["totals"]
+    
+    st.markdown("---")
+    st.subheader("⏱️ Performance")
+    col1, col2 = st.columns(2)
+    col1.metric("Node time", f"{totals['node_latency_ms'] / 1000:.1f}s")
+    col2.metric("Mean TTFT", "-" if totals["ttft_ms"] is None else f"{totals['ttft_ms']:.0f} ms")
+    col1.metric("LLM calls", totals["llm_calls"], help=f"{totals['retries']} retried, {totals['cache_hits']} cached")
+    col2.metric("Cost", "n/a" if totals["cost_usd"] is None else f"${totals['cost_usd']:.4f}")
+    st.caption(
+        f"{totals['prompt_tokens']} prompt / {totals['completion_tokens']} completion tokens "
+        f"({totals['reasoning_tokens']} reasoning), queue wait {totals['queue_wait_ms'] / 1000:.1f}s"
+    )
+    
+    with st.expander("Per node"):
+        st.dataframe(
+            [
+                {
+                    "node": row["node"],
+                    "node ms": round(row["node_latency_ms"]),
+                    "queue ms": round(row["queue_wait_ms"]),
+                    "ttft ms": None if row["ttft_ms"] is None else round(row["ttft_ms"]),
+                    "llm ms": round(row["llm_latency_ms"]),
+                    "prompt": row["prompt_tokens"],
+                    "completion": row["completion_tokens"],
+                    "retries": row["retries"],
+                }
+                for row in report["nodes"]
+            ],
+            use_container_width=True,
+            hide_index=True,
+        )
+
+
 def render_sidebar():
     """Render the sidebar with controls and settings."""
     with st.sidebar:
@@ -540,6 +644,8 @@ def render_sidebar():
                     use_container_width=True,
                 )
         
+        render_performance()
+        
         # Debate status
         st.markdown("---")
         if st.session_state.debate_in_progress:
@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmark for the Multi-Agent Debate System.
+
+Runs complete debates against a deterministic fake LLM and measures how the
+system scales with concurrent debates and debate length:
+
+- invoke: run_debate on a thread pool (one thread per concurrent debate)
+- stream: stream_debate on a thread pool, consuming every node update
+- batch:  run_tournament (async graph path, one event loop)
+
+Two fake LLM backends separate graph overhead from the HTTP layer:
+
+- inprocess: a chat model answering in-process (no network, no HTTP client)
+- http:      the local mock server (src/mock_server.py) with zero latency,
+             so requests go through the real OpenAI client and httpx pools
+
+--ttft-ms gives every fake LLM call a fixed time to first token, which makes
+the cost of waiting visible; --scorer-ttft-ms overrides it for round scorer
+calls (in-process backend only). Compare a run with --incremental-judging
+and a slow scorer against one without to check that background round
+scoring adds no debate latency.
+
+Each cell reports debate latency p50/p95/p99, per-node latency p50/p95/p99,
+debates/sec, CPU% (process CPU time over wall time; >100% means more than
+one core) and peak RSS, and the whole run is written to JSON. Pass an
+earlier run with --compare to print throughput and p95 ratios against it.
+
+Usage:
+    python benchmarks/end_to_end.py --concurrency 1 8 64 256 --rounds 1 3 10
+    python benchmarks/end_to_end.py --llm http --modes batch --out after.json --compare before.json
+    python benchmarks/end_to_end.py --ttft-ms 100 --scorer-ttft-ms 500 --rounds 5 --incremental-judging
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.tracers.context import register_configure_hook
+
+import src.registry
+from src.config import DebateConfig
+from src.graph import run_debate, stream_debate
+from src.mock_server import (
+    MockLLMServer,
+    MockServerSettings,
+    detect_role,
+    generate_response,
+    prompt_text,
+    tokenize,
+)
+from src.models import DebateResult
+from src.registry import close_registry
+from src.tournament import run_tournament
+
+MODES = ("invoke", "stream", "batch")
+BACKENDS = ("inprocess", "http")
+
+
+# ============================================================================
+# Fake LLM
+# ============================================================================
+
+class BenchmarkChatModel(BaseChatModel):
+    """Deterministic in-process chat model answering like the mock server."""
+    
+    ttft_seconds: float = 0.0
+    scorer_ttft_seconds: Optional[float] = None
+    
+    @property
+    def _llm_type(self) -> str:
+        return "benchmark"
+    
+    def _reply(self, messages: List[BaseMessage], kwargs: Dict[str, Any]) -> str:
+        body = {
+            "messages": [{"content": message.content} for message in messages],
+            "response_format": kwargs.get("response_format"),
+        }
+        return generate_response(body)
+    
+    def _ttft(self, messages: List[BaseMessage]) -> float:
+        """Time to first token for a prompt (round scorer calls may differ)."""
+        if self.scorer_ttft_seconds is not None:
+            if detect_role(prompt_text([{"content": m.content} for m in messages])) == "scorer":
+                return self.scorer_ttft_seconds
+        return self.ttft_seconds
+    
+    def _result(self, messages: List[BaseMessage], kwargs: Dict[str, Any]) -> ChatResult:
+        message = AIMessage(content=self._reply(messages, kwargs))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+    
+    def _chunks(self, messages: List[BaseMessage], kwargs: Dict[str, Any]):
+        for token in tokenize(self._reply(messages, kwargs)):
+            yield ChatGenerationChunk(message=AIMessageChunk(content=token))
+    
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        time.sleep(self._ttft(messages))
+        return self._result(messages, kwargs)
+    
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        await asyncio.sleep(self._ttft(messages))
+        return self._result(messages, kwargs)
+    
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        time.sleep(self._ttft(messages))
+        yield from self._chunks(messages, kwargs)
+    
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        await asyncio.sleep(self._ttft(messages))
+        for chunk in self._chunks(messages, kwargs):
+            yield chunk
+
+
+def use_inprocess_llm(ttft_seconds: float = 0.0, scorer_ttft_seconds: Optional[float] = None) -> None:
+    """Make the registry hand out BenchmarkChatModel instead of OpenRouter clients."""
+    src.registry.create_llm_client = lambda config, *args, **kwargs: BenchmarkChatModel(
+        ttft_seconds=ttft_seconds, scorer_ttft_seconds=scorer_ttft_seconds
+    )
+
+
+# ============================================================================
+# Instrumentation
+# ============================================================================
+
+class NodeTimer(BaseCallbackHandler):
+    """
+    Records the wall time of every graph node run.
+    
+    Installed process-wide through a configure hook, so it sees nodes of
+    debates running on any thread or event loop without changing the
+    public API. Only node runs (tagged graph:step:N) are timed.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._started: Dict[UUID, Tuple[str, float]] = {}
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+    
+    def reset(self) -> None:
+        with self._lock:
+            self._started.clear()
+            self.samples = defaultdict(list)
+    
+    def on_chain_start(self, serialized, inputs, *, run_id, tags=None, metadata=None, **kwargs) -> None:
+        if not any(tag.startswith("graph:step:") for tag in tags or ()):
+            return
+        node = (metadata or {}).get("langgraph_node") or kwargs.get("name") or "?"
+        with self._lock:
+            self._started[run_id] = (node, time.perf_counter())
+    
+    def on_chain_end(self, outputs, *, run_id, **kwargs) -> None:
+        with self._lock:
+            started = self._started.pop(run_id, None)
+            if started is not None:
+                node, start = started
+                self.samples[node].append(time.perf_counter() - start)
+    
+    on_chain_error = on_chain_end
+
+
+class PeakRSS:
+    """Samples resident memory on a background thread and keeps the peak."""
+    
+    def __init__(self, interval: float = 0.02):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+    
+    @staticmethod
+    def current() -> int:
+        """Resident set size in bytes (lifetime peak where /proc is unavailable)."""
+        try:
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except OSError:
+            scale = 1 if sys.platform == "darwin" else 1024
+            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+    
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.peak = max(self.peak, self.current())
+            self._stop.wait(self.interval)
+    
+    def __enter__(self) -> "PeakRSS":
+        self.peak = self.current()
+        self._thread.start()
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, self.current())
+
+
+def percentiles(values: List[float]) -> Dict[str, float]:
+    """p50/p95/p99 of a sample, in milliseconds."""
+    if not values:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+    if len(values) == 1:
+        ms = values[0] * 1000
+        return {"p50": ms, "p95": ms, "p99": ms}
+    cuts = statistics.quantiles(values, n=100, method="inclusive")
+    return {"p50": cuts[49] * 1000, "p95": cuts[94] * 1000, "p99": cuts[98] * 1000}
+
+
+# ============================================================================
+# Drivers
+# ============================================================================
+
+def on_threads(run_one: Callable[[str], Any], topics: List[str], concurrency: int) -> Tuple[List[float], int]:
+    """Run one debate per topic on a thread pool; returns (latencies, failures)."""
+    def timed(topic: str) -> Optional[float]:
+        start = time.perf_counter()
+        try:
+            run_one(topic)
+        except Exception as e:
+            logging.getLogger(__name__).error(f"Debate failed: {e}")
+            return None
+        return time.perf_counter() - start
+    
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(timed, topics))
+    latencies = [seconds for seconds in results if seconds is not None]
+    return latencies, len(results) - len(latencies)
+
+
+def drive(mode: str, topics: List[str], concurrency: int, rounds: int, config: DebateConfig) -> Tuple[List[float], int]:
+    """Run the topics in one mode; returns (per-debate latencies, failures)."""
+    if mode == "invoke":
+        return on_threads(lambda topic: run_debate(topic, max_rounds=rounds, config=config), topics, concurrency)
+    
+    if mode == "stream":
+        def consume(topic: str) -> None:
+            deque(stream_debate(topic, max_rounds=rounds, config=config), maxlen=0)
+        return on_threads(consume, topics, concurrency)
+    
+    results: List[DebateResult] = []
+    run_tournament(topics, concurrency=concurrency, max_rounds=rounds, config=config, on_result=results.append)
+    return [r.elapsed_seconds for r in results if r.error is None], sum(r.error is not None for r in results)
+
+
+# ============================================================================
+# Measurement
+# ============================================================================
+
+def measure(
+    backend: str,
+    mode: str,
+    concurrency: int,
+    rounds: int,
+    debates: int,
+    config: DebateConfig,
+    timer: NodeTimer,
+) -> Dict[str, Any]:
+    """Run one cell of the grid and summarize it."""
+    topics = [f"Benchmark proposition {index}: automation raises median wages" for index in range(debates)]
+    timer.reset()
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    
+    with PeakRSS() as rss:
+        latencies, failures = drive(mode, topics, concurrency, rounds, config)
+    
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    # Sync clients are cached per process; start every cell from a cold registry
+    close_registry()
+    
+    return {
+        "llm": backend,
+        "mode": mode,
+        "concurrency": concurrency,
+        "rounds": rounds,
+        "debates": debates,
+        "failed": failures,
+        "wall_seconds": wall,
+        "debates_per_second": len(latencies) / wall if wall else 0.0,
+        "cpu_percent": 100.0 * cpu / wall if wall else 0.0,
+        "peak_rss_mb": rss.peak / 2**20,
+        "latency_ms": percentiles(latencies),
+        "node_latency_ms": {
+            node: {**percentiles(samples), "count": len(samples)}
+            for node, samples in sorted(timer.samples.items())
+        },
+    }
+
+
+def git_commit() -> Optional[str]:
+    """Short hash of the checked-out commit, if this is a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_cell(cell: Dict[str, Any]) -> None:
+    """One table row, plus p50/p95 per node."""
+    latency = cell["latency_ms"]
+    print(
+        f"{cell['llm']:<10}{cell['mode']:<8}{cell['concurrency']:>6}{cell['rounds']:>7}{cell['debates']:>8}"
+        f"{cell['debates_per_second']:>10.2f}{latency['p50']:>10.0f}{latency['p95']:>10.0f}{latency['p99']:>10.0f}"
+        f"{cell['cpu_percent']:>8.0f}{cell['peak_rss_mb']:>9.0f}"
+    )
+    nodes = "  ".join(
+        f"{node} {stats['p50']:.1f}/{stats['p95']:.1f}" for node, stats in cell["node_latency_ms"].items()
+    )
+    print(f"{'':<10}nodes p50/p95 ms: {nodes}")
+
+
+def compare(results: List[Dict[str, Any]], baseline_path: str) -> None:
+    """Print throughput and p95 latency ratios against an earlier run."""
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    
+    def key(cell: Dict[str, Any]) -> tuple:
+        return cell["llm"], cell["mode"], cell["concurrency"], cell["rounds"]
+    
+    before = {key(cell): cell for cell in baseline["results"]}
+    print(f"\nCompared with {baseline_path} (commit {baseline['meta'].get('commit')}):")
+    print(f"{'llm':<10}{'mode':<8}{'conc':>6}{'rounds':>7}{'deb/s x':>10}{'p95 x':>10}")
+    for cell in results:
+        old = before.get(key(cell))
+        if old is None:
+            continue
+        throughput = cell["debates_per_second"] / old["debates_per_second"] if old["debates_per_second"] else 0.0
+        p95 = cell["latency_ms"]["p95"] / old["latency_ms"]["p95"] if old["latency_ms"]["p95"] else 0.0
+        print(f"{cell['llm']:<10}{cell['mode']:<8}{cell['concurrency']:>6}{cell['rounds']:>7}{throughput:>10.2f}{p95:>10.2f}")
+
+
+def main() -> None:
+    """Run the benchmark grid, print it and write it to JSON."""
+    parser = argparse.ArgumentParser(description="End-to-end debate benchmark against a fake LLM")
+    parser.add_argument("--llm", choices=BACKENDS + ("both",), default="inprocess", help="Fake LLM backend")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 8, 64, 256])
+    parser.add_argument("--rounds", nargs="+", type=int, default=[1, 3, 10])
+    parser.add_argument(
+        "--debates",
+        type=int,
+        default=None,
+        help="Debates per cell (default: twice the concurrency, at least 8)",
+    )
+    parser.add_argument("--words", type=int, default=300, help="Words per fake debater turn")
+    parser.add_argument("--ttft-ms", type=float, default=0.0, help="Fixed time to first token of every fake LLM call")
+    parser.add_argument(
+        "--scorer-ttft-ms",
+        type=float,
+        default=None,
+        help="Time to first token of round scorer calls (default: --ttft-ms; in-process backend only)",
+    )
+    parser.add_argument(
+        "--incremental-judging",
+        action="store_true",
+        help="Score rounds in the background and judge from the scorecards",
+    )
+    parser.add_argument("--out", default="benchmarks/results/end_to_end.json", help="JSON results file")
+    parser.add_argument("--compare", default=None, metavar="JSON", help="Earlier results to compare against")
+    args = parser.parse_args()
+    
+    # Agents log every call at INFO
+    logging.disable(logging.INFO)
+    
+    timer = NodeTimer()
+    register_configure_hook(ContextVar("benchmark_node_timer", default=timer), inheritable=True)
+    
+    base_config = DebateConfig(
+        openrouter_api_key="benchmark",
+        max_response_length=max(100, int(args.words / 0.8)),
+        judge_models=[],
+        incremental_judging=args.incremental_judging,
+        cache_enabled=False,
+        checkpoint_enabled=False,
+        rate_limit_requests_per_minute=None,
+        rate_limit_tokens_per_minute=None,
+        circuit_breaker_threshold=0,
+    )
+    
+    backends = BACKENDS if args.llm == "both" else (args.llm,)
+    results = []
+    print(f"{'llm':<10}{'mode':<8}{'conc':>6}{'rounds':>7}{'debates':>8}{'deb/s':>10}"
+          f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'cpu %':>8}{'rss MB':>9}")
+    
+    original_client_factory = src.registry.create_llm_client
+    for backend in backends:
+        server = None
+        if backend == "inprocess":
+            scorer_ttft = None if args.scorer_ttft_ms is None else args.scorer_ttft_ms / 1000
+            use_inprocess_llm(args.ttft_ms / 1000, scorer_ttft)
+            config = base_config
+        else:
+            src.registry.create_llm_client = original_client_factory
+            server = MockLLMServer(
+                MockServerSettings(port=0, ttft_ms=args.ttft_ms, ttft_distribution="fixed", tokens_per_second=0)
+            ).start()
+            config = base_config.model_copy(update={"mock_llm_url": server.url})
+        
+        try:
+            for mode in args.modes:
+                for rounds in args.rounds:
+                    for concurrency in args.concurrency:
+                        debates = args.debates or max(2 * concurrency, 8)
+                        cell = measure(backend, mode, concurrency, rounds, debates, config, timer)
+                        results.append(cell)
+                        print_cell(cell)
+        finally:
+            if server is not None:
+                server.stop()
+    
+    output = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "args": vars(args),
+        },
+        "results": results,
+    }
+    directory = os.path.dirname(args.out)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(output, f, indent=2)
+    print(f"\nResults written to {args.out}")
+    
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Prompt builder and text utility micro-benchmark for the Multi-Agent Debate System.
+
+Times the functions whose cost grows with the transcript -- the debater
+and judge prompt builders, which scan the whole history, and the text
+utilities run over a whole transcript (truncate_response, clean_response,
+extract_winner_from_text) -- on synthetic histories of 10 to 10,000 turns.
+Reports time per call and peak memory allocated during one call
+(tracemalloc), and checks both against benchmarks/thresholds.json: any
+case over its limit is reported and the script exits with status 1, so a
+slowdown is caught before release.
+
+Times are checked relative to a fixed calibration workload timed in the
+same run, so limits recorded on one machine carry over to another of a
+different speed. The builders that only read a bounded part of the
+history (the debater prompts, and the judge prompt under a token
+ceiling) must also allocate the same peak memory at every history length;
+that check needs no recorded limits.
+
+Usage:
+    python benchmarks/prompt_builders.py
+    python benchmarks/prompt_builders.py --update-thresholds
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import timeit
+import tracemalloc
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import WORDS, synthetic_history, transcript_text
+from src.models import DebateTurn
+from src.prompts import build_judge_prompt, build_opposition_prompt, build_proponent_prompt
+from src.utils import clean_response, extract_winner_from_text, truncate_response
+
+SIZES = (10, 100, 1_000, 10_000)
+
+# Judge prompt ceiling for the bounded judge case
+JUDGE_PROMPT_TOKENS = 8_000
+
+TOPIC = "Automation will raise median wages within a decade"
+
+THRESHOLDS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "thresholds.json")
+
+
+# ============================================================================
+# Cases
+# ============================================================================
+
+# Case name -> function of (history, transcript text)
+CASES: Dict[str, Callable[[List[DebateTurn], str], object]] = {
+    "build_proponent_prompt": lambda history, text: build_proponent_prompt(
+        TOPIC, "rebuttal", len(history) // 2, history
+    ),
+    "build_opposition_prompt": lambda history, text: build_opposition_prompt(
+        TOPIC, "rebuttal", len(history) // 2, history
+    ),
+    "build_judge_prompt": lambda history, text: build_judge_prompt(TOPIC, history),
+    "build_judge_prompt_bounded": lambda history, text: build_judge_prompt(
+        TOPIC, history, max_prompt_tokens=JUDGE_PROMPT_TOKENS
+    ),
+    "truncate_response": lambda history, text: truncate_response(text, 500),
+    "clean_response": lambda history, text: clean_response(text),
+    "extract_winner_from_text": lambda history, text: extract_winner_from_text(text),
+}
+
+# Cases whose peak memory must not grow with the history
+BOUNDED_CASES = ("build_proponent_prompt", "build_opposition_prompt", "build_judge_prompt_bounded")
+
+# Metrics compared against recorded limits ("seconds" depends on the machine)
+CHECKED_METRICS = ("relative", "peak_bytes")
+
+
+# ============================================================================
+# Measurement
+# ============================================================================
+
+def peak_bytes(case: Callable[[List[DebateTurn], str], object], history: List[DebateTurn], text: str) -> int:
+    """Peak memory allocated during one call."""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    case(history, text)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def time_per_call(case: Callable[[List[DebateTurn], str], object], history: List[DebateTurn], text: str) -> float:
+    """Best-of-5 seconds per call, with enough calls per run to take ~0.1s."""
+    timer = timeit.Timer(lambda: case(history, text))
+    number, _ = timer.autorange()
+    number = max(number // 2, 1)
+    return min(timer.repeat(repeat=5, number=number)) / number
+
+
+def calibration_workload() -> None:
+    """
+    Fixed string workload that times are measured against.
+    
+    Splits, joins and scans text like the cases do, so it speeds up and
+    slows down with the machine (and interpreter) the same way.
+    """
+    text = " ".join(WORDS * 500)
+    words = text.split()
+    "\n".join(" ".join(words[start:start + 15]).capitalize() for start in range(0, len(words), 15)).find("**WINNER")
+
+
+def calibration_seconds(runs: int = 5) -> float:
+    """Fastest of `runs` best-of-5 timings of calibration_workload, in seconds per call."""
+    return min(time_per_call(lambda history, text: calibration_workload(), [], "") for _ in range(runs))
+
+
+def check(results: Dict[str, Dict[str, Dict[str, float]]], thresholds: Dict) -> List[str]:
+    """
+    Compare results with their limits.
+    
+    Args:
+        results: case -> size -> {"seconds", "relative", "peak_bytes"}
+        thresholds: Same shape, holding the maximum allowed "relative" and
+            "peak_bytes" values
+    
+    Returns:
+        One message per value over its limit
+    """
+    failures = []
+    for name, sizes in results.items():
+        for size, measured in sizes.items():
+            limits = thresholds.get(name, {}).get(size)
+            if limits is None:
+                continue
+            for metric in CHECKED_METRICS:
+                value, limit = measured[metric], limits.get(metric)
+                if limit is not None and value > limit:
+                    failures.append(f"{name} @ {size} turns: {metric} {value:.6g} > limit {limit:.6g}")
+    return failures
+
+
+def check_bounded(results: Dict[str, Dict[str, Dict[str, float]]], tolerance: float) -> List[str]:
+    """
+    Check that bounded cases allocate the same peak memory at every size.
+    
+    Args:
+        results: case -> size -> {"seconds", "relative", "peak_bytes"}
+        tolerance: Largest allowed ratio of a peak to the smallest size's peak
+    
+    Returns:
+        One message per size whose peak grew past the tolerance
+    """
+    failures = []
+    for name in BOUNDED_CASES:
+        sizes = sorted(results.get(name, {}).items(), key=lambda item: int(item[0]))
+        if len(sizes) < 2:
+            continue
+        base_size, base = sizes[0]
+        for size, measured in sizes[1:]:
+            ratio = measured["peak_bytes"] / max(base["peak_bytes"], 1)
+            if ratio > tolerance:
+                failures.append(
+                    f"{name} @ {size} turns: peak_bytes {ratio:.2f}x the {base_size}-turn peak "
+                    f"(bounded; limit {tolerance:.2f}x)"
+                )
+    return failures
+
+
+def make_thresholds(
+    results: Dict[str, Dict[str, Dict[str, float]]],
+    time_headroom: float,
+    memory_headroom: float,
+) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """Limits from a run: each relative time and allocation peak times its headroom."""
+    return {
+        name: {
+            size: {
+                "relative": round(measured["relative"] * time_headroom, 6),
+                "peak_bytes": int(measured["peak_bytes"] * memory_headroom),
+            }
+            for size, measured in sizes.items()
+        }
+        for name, sizes in results.items()
+    }
+
+
+def main() -> None:
+    """Run the benchmark, print a table and enforce the thresholds."""
+    parser = argparse.ArgumentParser(description="Benchmark prompt builders and text utilities")
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(SIZES), help="History lengths in turns")
+    parser.add_argument("--words", type=int, default=300, help="Words per synthetic turn")
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES))
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--thresholds", default=THRESHOLDS_PATH, help="JSON file of limits")
+    parser.add_argument(
+        "--update-thresholds",
+        action="store_true",
+        help="Write this run's results (times the headroom) as the new limits instead of checking",
+    )
+    parser.add_argument(
+        "--time-headroom",
+        type=float,
+        default=2.0,
+        help="Limit = relative time x this (with --update-thresholds)",
+    )
+    parser.add_argument("--memory-headroom", type=float, default=1.25, help="Limit = peak x this (with --update-thresholds)")
+    parser.add_argument(
+        "--bounded-tolerance",
+        type=float,
+        default=1.5,
+        help="Largest peak memory growth allowed across sizes for bounded builders",
+    )
+    args = parser.parse_args()
+    
+    # Truncation logs at INFO on every call
+    logging.disable(logging.INFO)
+    rng = random.Random(args.seed)
+    results: Dict[str, Dict[str, Dict[str, float]]] = {name: {} for name in args.cases}
+    calibration = calibration_seconds()
+    
+    print(f"Words per turn: {args.words}")
+    print(f"{'turns':>8}  {'function':<28}{'time/call':>14}{'peak alloc':>14}")
+    for size in args.sizes:
+        history = synthetic_history(size, args.words, rng)
+        text = transcript_text(history)
+        for name in args.cases:
+            seconds = time_per_call(CASES[name], history, text)
+            peak = peak_bytes(CASES[name], history, text)
+            results[name][str(size)] = {"seconds": seconds, "peak_bytes": peak}
+            print(f"{size:>8}  {name:<28}{seconds * 1e6:>12.1f}us{peak / 1024:>11.1f} KiB")
+    
+    # Calibrated on both sides of the run, so a slow spell at either end
+    # does not skew every relative time
+    calibration = min(calibration, calibration_seconds())
+    print(f"\nCalibration workload: {calibration * 1e6:.1f}us per call; relative = time / calibration")
+    print(f"{'turns':>8}  {'function':<28}{'relative':>10}")
+    for size in args.sizes:
+        for name in args.cases:
+            measured = results[name][str(size)]
+            measured["relative"] = measured["seconds"] / calibration
+            print(f"{size:>8}  {name:<28}{measured['relative']:>10.3f}")
+    
+    unbounded = check_bounded(results, args.bounded_tolerance)
+    if unbounded:
+        print(f"\n{len(unbounded)} bounded case(s) grew with the history:")
+        for failure in unbounded:
+            print(f"  {failure}")
+        sys.exit(1)
+    
+    if args.update_thresholds:
+        thresholds = {"words": args.words, "limits": {}}
+        if os.path.exists(args.thresholds):
+            with open(args.thresholds, "r", encoding="utf-8") as f:
+                recorded = json.load(f)
+            # Limits recorded for another turn length no longer apply
+            if recorded.get("words") == args.words:
+                thresholds = recorded
+        for name, sizes in make_thresholds(results, args.time_headroom, args.memory_headroom).items():
+            thresholds["limits"].setdefault(name, {}).update(sizes)
+        with open(args.thresholds, "w", encoding="utf-8") as f:
+            json.dump(thresholds, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"\nThresholds written to {args.thresholds}")
+        return
+    
+    if not os.path.exists(args.thresholds):
+        print(f"\nNo thresholds at {args.thresholds}; run with --update-thresholds to record them")
+        return
+    with open(args.thresholds, "r", encoding="utf-8") as f:
+        thresholds = json.load(f)
+    if thresholds.get("words") != args.words:
+        print(f"\nThresholds were recorded for {thresholds.get('words')} words per turn; not checking")
+        return
+    failures = check(results, thresholds["limits"])
+    
+    if failures:
+        print(f"\n{len(failures)} regression(s):")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("\nAll cases within thresholds")
+
+
+if __name__ == "__main__":
+    main()
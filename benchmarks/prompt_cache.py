@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Prompt-cache benchmark for the Multi-Agent Debate System.
+
+Replays a synthetic debate through the prompt builders (no LLM calls) and
+measures, per layout, how many prompt tokens providers could serve from
+their prefix cache instead of prefilling:
+
+- legacy:  system prompt and context fused into one HumanMessage
+- compact: stable SystemMessage (instructions and topic) + one HumanMessage
+
+A call's cacheable prefix is the longest prefix it shares with any earlier
+call of the same debate. Prefixes shorter than --min-cacheable-tokens are
+not cached (OpenAI's automatic caching and Anthropic's cache_control both
+start at 1024 tokens). Savings are reported against the legacy layout's
+prefill, so a layout that sends more tokens cannot look cheaper than it is.
+
+Usage:
+    python benchmarks/prompt_cache.py --rounds 5 --words 400
+"""
+
+import argparse
+import os
+import random
+import sys
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from langchain_core.messages import HumanMessage
+
+from benchmarks.synthetic import debate_schedule, synthetic_turn
+from src.models import DebateTurn
+from src.prompts import (
+    build_judge_prompt,
+    build_messages,
+    build_opposition_prompt,
+    build_proponent_prompt,
+    messages_text,
+)
+from src.utils import estimate_tokens
+
+LAYOUTS = ("legacy", "compact")
+
+
+# ============================================================================
+# Synthetic Debate
+# ============================================================================
+
+def debate_calls(layout: str, topic: str, rounds: int, words: int, seed: int) -> List[str]:
+    """
+    Replay a debate and return every call's prompt, flattened to text.
+    
+    Args:
+        layout: One of LAYOUTS
+        topic: Debate proposition
+        rounds: Rebuttal rounds
+        words: Words per synthetic turn
+        seed: Seed for the synthetic turn text
+    
+    Returns:
+        Flattened prompts in call order (debater turns, then the judge)
+    """
+    rng = random.Random(seed)
+    history: List[DebateTurn] = []
+    calls = []
+    
+    for phase, round_number in debate_schedule(rounds):
+        for role, build in (("proponent", build_proponent_prompt), ("opposition", build_opposition_prompt)):
+            prompt = build(topic, phase, round_number, history, max_words=words)
+            messages = [HumanMessage(content=prompt)] if layout == "legacy" else build_messages(prompt)
+            calls.append(messages_text(messages))
+            history.append(synthetic_turn(role, phase, round_number, words, rng))
+    
+    judge_prompt = build_judge_prompt(topic, history)
+    judge_messages = [HumanMessage(content=judge_prompt)] if layout == "legacy" else build_messages(judge_prompt)
+    calls.append(messages_text(judge_messages))
+    return calls
+
+
+# ============================================================================
+# Measurement
+# ============================================================================
+
+def cacheable_prefix_tokens(calls: List[str], min_cacheable_tokens: int) -> List[int]:
+    """Tokens of each call's longest prefix shared with an earlier call."""
+    cached = []
+    for index, text in enumerate(calls):
+        longest = max((len(os.path.commonprefix([text, earlier])) for earlier in calls[:index]), default=0)
+        tokens = estimate_tokens(text[:longest])
+        cached.append(tokens if tokens >= min_cacheable_tokens else 0)
+    return cached
+
+
+def measure(layout: str, args: argparse.Namespace) -> Dict[str, float]:
+    """Prompt and cacheable-prefix token totals for one debate."""
+    calls = debate_calls(layout, args.topic, args.rounds, args.words, args.seed)
+    prompt_tokens = sum(estimate_tokens(text) for text in calls)
+    cached_tokens = sum(cacheable_prefix_tokens(calls, args.min_cacheable_tokens))
+    return {
+        "calls": len(calls),
+        "prompt_tokens": prompt_tokens,
+        "cached_tokens": cached_tokens,
+        "prefill_tokens": prompt_tokens - cached_tokens,
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description="Measure prefill tokens saved by prompt layout")
+    parser.add_argument("--topic", default="Artificial intelligence will create more jobs than it destroys")
+    parser.add_argument("--rounds", type=int, default=5, help="Rebuttal rounds per debate")
+    parser.add_argument("--words", type=int, default=400, help="Words per synthetic turn")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument(
+        "--min-cacheable-tokens",
+        type=int,
+        default=1024,
+        help="Shortest prefix a provider will cache (0 to count every shared prefix)",
+    )
+    args = parser.parse_args()
+    
+    results = {layout: measure(layout, args) for layout in LAYOUTS}
+    baseline = results["legacy"]["prefill_tokens"]
+    
+    print(f"Debate: {args.rounds} rounds, {args.words} words/turn, min cacheable prefix {args.min_cacheable_tokens}")
+    print("prompt = tokens sent, cached = served from cache, prefill = tokens still prefilled,")
+    print("vs legacy = prefill saved against the legacy layout's prefill (negative = more prefill)")
+    print(f"{'layout':<14}{'calls':>7}{'prompt':>10}{'cached':>10}{'prefill':>10}{'vs legacy':>11}")
+    for layout, r in results.items():
+        saved = (baseline - r["prefill_tokens"]) / baseline if baseline else 0.0
+        print(
+            f"{layout:<14}{r['calls']:>7}{r['prompt_tokens']:>10}{r['cached_tokens']:>10}"
+            f"{r['prefill_tokens']:>10}{saved:>+11.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
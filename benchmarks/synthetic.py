@@ -0,0 +1,85 @@
+"""
+Synthetic debate fixtures shared by the benchmarks.
+
+Builds debater responses, turns and whole histories from a fixed word list,
+so the benchmarks replay the same kind of debate without calling an LLM.
+"""
+
+import os
+import random
+import sys
+from typing import List, Sequence, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.models import DebateTurn
+from src.utils import OPPOSITION_HEADERS, PROPONENT_HEADERS
+
+WORDS = (
+    "evidence policy growth risk labor market automation productivity wages "
+    "history transition regulation innovation cost benefit study data trend"
+).split()
+
+
+# ============================================================================
+# Responses and Turns
+# ============================================================================
+
+def synthetic_sections(headers: Sequence[str], words: int, rng: random.Random) -> str:
+    """
+    Bulleted sections of roughly `words` words under `headers`.
+    
+    The spacing is messy on purpose (CRLF line ends, runs of blank lines)
+    so cleaning and truncation have real work to do.
+    """
+    per_section = max(words // len(headers), 1)
+    sections = []
+    for header in headers:
+        lines = []
+        for start in range(0, per_section, 15):
+            sentence = " ".join(rng.choice(WORDS) for _ in range(min(15, per_section - start)))
+            lines.append(f"- {sentence.capitalize()}.")
+        sections.append(f"## {header}\r\n" + "\r\n".join(lines))
+    return "\n\n\n\n".join(sections)
+
+
+def synthetic_turn(role: str, phase: str, round_number: int, words: int, rng: random.Random) -> DebateTurn:
+    """A debater turn of roughly `words` words under the role's headers."""
+    headers = PROPONENT_HEADERS if role == "proponent" else OPPOSITION_HEADERS
+    content = synthetic_sections(headers, words, rng)
+    return DebateTurn(role=role, phase=phase, round_number=round_number, content=content, word_count=words)
+
+
+# ============================================================================
+# Debates
+# ============================================================================
+
+def debate_schedule(rounds: int) -> List[Tuple[str, int]]:
+    """(phase, round_number) pairs in speaking order: opening, rebuttals, closing."""
+    return [("opening", 0)] + [("rebuttal", r) for r in range(1, rounds + 1)] + [("closing", 0)]
+
+
+def synthetic_history(turns: int, words: int, rng: random.Random) -> List[DebateTurn]:
+    """
+    A debate of `turns` debater turns: openings, rebuttal rounds, closings.
+    
+    Args:
+        turns: Number of turns (rounded down to an even number, at least 2)
+        words: Words per turn
+        rng: Source of the filler words
+    
+    Returns:
+        Turns in debate order, proponent first in every exchange
+    """
+    exchanges = max(turns // 2, 1)
+    schedule = debate_schedule(exchanges - 2) if exchanges > 1 else [("opening", 0)]
+    history = []
+    for phase, round_number in schedule:
+        for role in ("proponent", "opposition"):
+            history.append(synthetic_turn(role, phase, round_number, words, rng))
+    return history
+
+
+def transcript_text(history: List[DebateTurn]) -> str:
+    """All turns joined, ending with a verdict line so winner extraction scans everything."""
+    return "\n\n\n".join(turn.content for turn in history) + "\n\n**WINNER: Opposition**\n"
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Turn post-processing micro-benchmark for the Multi-Agent Debate System.
+
+Compares the step-by-step pipeline agents used to run on every response
+(clean_response, truncate_response, validate_*_output, then a word count)
+with the fused single-pass analyze_turn, on synthetic responses of
+increasing size. Reports time per call and peak memory allocated while
+processing one response (tracemalloc).
+
+Usage:
+    python benchmarks/turn_processing.py --max-words 500
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import timeit
+import tracemalloc
+from typing import Callable, Dict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import synthetic_sections
+from src.utils import (
+    PROPONENT_HEADERS,
+    analyze_turn,
+    clean_response,
+    truncate_response,
+    validate_proponent_output,
+)
+
+SIZES = (500, 5_000, 50_000)
+
+
+# ============================================================================
+# Synthetic Responses
+# ============================================================================
+
+def synthetic_response(words: int, rng: random.Random) -> str:
+    """A proponent-style response of roughly `words` words with messy spacing."""
+    return "\n\n" + synthetic_sections(PROPONENT_HEADERS, words, rng) + "\n\n"
+
+
+# ============================================================================
+# Pipelines
+# ============================================================================
+
+def legacy_pipeline(content: str, max_words: int) -> int:
+    """Clean, truncate, validate and count the way agents used to."""
+    response = clean_response(content)
+    response = truncate_response(response, max_words)
+    validate_proponent_output(response)
+    return len(response.split())
+
+
+def fused_pipeline(content: str, max_words: int) -> int:
+    """The single-pass replacement."""
+    return analyze_turn(content, max_words, PROPONENT_HEADERS).word_count
+
+
+PIPELINES: Dict[str, Callable[[str, int], int]] = {
+    "legacy": legacy_pipeline,
+    "fused": fused_pipeline,
+}
+
+
+# ============================================================================
+# Measurement
+# ============================================================================
+
+def peak_bytes(pipeline: Callable[[str, int], int], content: str, max_words: int) -> int:
+    """Peak memory allocated while processing one response."""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    pipeline(content, max_words)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def time_per_call(pipeline: Callable[[str, int], int], content: str, max_words: int, repeat: int) -> float:
+    """Best-of-5 seconds per call."""
+    timer = timeit.Timer(lambda: pipeline(content, max_words))
+    return min(timer.repeat(repeat=5, number=repeat)) / repeat
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description="Benchmark turn post-processing")
+    parser.add_argument("--max-words", type=int, default=500, help="Word limit applied to each response")
+    parser.add_argument("--repeat", type=int, default=50, help="Calls per timing run")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    
+    # Truncation logs at INFO on every call
+    logging.disable(logging.INFO)
+    rng = random.Random(args.seed)
+    
+    print(f"Word limit: {args.max_words}")
+    print(f"{'words':>8}  {'pipeline':<8}{'time/call':>12}{'peak alloc':>14}")
+    for size in SIZES:
+        content = synthetic_response(size, rng)
+        assert legacy_pipeline(content, args.max_words) == fused_pipeline(content, args.max_words)
+        for name, pipeline in PIPELINES.items():
+            seconds = time_per_call(pipeline, content, args.max_words, args.repeat)
+            peak = peak_bytes(pipeline, content, args.max_words)
+            print(f"{size:>8}  {name:<8}{seconds * 1e6:>10.1f}us{peak / 1024:>11.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
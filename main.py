@@ -10,6 +10,15 @@ Usage:
     
     OR with streaming:
     python main.py --topic "Your topic" --rounds 2 --stream
+    
+    OR resume an interrupted (checkpointed) debate:
+    python main.py --resume <debate-id>
+    
+    OR as a batch over many topics:
+    python main.py batch --topics-file topics.jsonl --parallel 8 --out results.jsonl
+    
+    OR re-judge archived debates with another judge:
+    python main.py rejudge --transcripts results.jsonl --judge-model openai/gpt-4o --out rejudged.jsonl
 
 Requirements:
     - Set OPENROUTER_API_KEY in .env file
@@ -19,12 +28,18 @@ Requirements:
 import argparse
 import logging
 import sys
+import uuid
 from typing import Optional
 
 from src.config import DebateConfig, get_default_config
-from src.graph import run_debate, stream_debate
+from src.graph import resume_debate, run_debate, stream_debate_events
+from src.tournament import load_topics, run_tournament
+from src.rejudge import judge_label, load_transcripts, rejudge
 from src.utils import format_debate_output
-from src.models import DebateTurn
+from src.telemetry import debate_report
+from src.models import DebateResult, DebateTurn, TournamentReport
+from src.ratelimit import get_rate_limiter
+from src.metrics import get_metrics, metrics_address
 
 
 # ============================================================================
@@ -51,6 +66,14 @@ def setup_logging(verbose: bool = False) -> None:
 # Output Formatting
 # ============================================================================
 
+def format_turn_stats(turn: DebateTurn) -> str:
+    """One-line size summary of a turn."""
+    stats = f"Words: {turn.word_count} | Prompt tokens: {turn.prompt_tokens}"
+    if turn.reasoning_tokens:
+        stats += f" | Reasoning tokens: {turn.reasoning_tokens} | Answer tokens: {turn.answer_tokens}"
+    return stats
+
+
 def print_turn(turn: DebateTurn) -> None:
     """Print a single debate turn with formatting."""
     # Role emoji mapping
@@ -68,7 +91,7 @@ def print_turn(turn: DebateTurn) -> None:
     
     print(f"\n{'─' * 60}")
     print(f"{emoji} {turn.role.upper()} - {phase_display}")
-    print(f"   Words: {turn.word_count}")
+    print(f"   {format_turn_stats(turn)}")
     print(f"{'─' * 60}")
     print(turn.content)
 
@@ -89,6 +112,16 @@ def print_verdict(state: dict) -> None:
     print(f"\n{winner_emoji} WINNER: {verdict['winner'].upper()}")
     print(f"📊 CONFIDENCE: {verdict['confidence'].upper()}")
     
+    # Scores per dimension, when the judge's table could be parsed
+    proponent_scores = verdict.get("proponent_scores") or {}
+    opposition_scores = verdict.get("opposition_scores") or {}
+    if proponent_scores or opposition_scores:
+        print("\n🔢 SCORES (proponent vs opposition):")
+        for dimension in dict.fromkeys([*proponent_scores, *opposition_scores]):
+            proponent = proponent_scores.get(dimension, {}).get("score", "-")
+            opposition = opposition_scores.get(dimension, {}).get("score", "-")
+            print(f"   {dimension.title():<12} {proponent:>2} vs {opposition}")
+    
     print(f"\n📝 SUMMARY: {verdict['summary']}")
 
 
@@ -110,13 +143,62 @@ def print_debate_summary(state: dict) -> None:
     
     print(f"\n🟢 Proponent Words: {proponent_words}")
     print(f"🔴 Opposition Words: {opposition_words}")
+    
+    # Completion tokens: reasoning vs answer
+    reasoning_tokens = sum(t.reasoning_tokens for t in history)
+    answer_tokens = sum(t.answer_tokens for t in history)
+    if reasoning_tokens:
+        print(f"🧠 Reasoning Tokens: {reasoning_tokens} | Answer Tokens: {answer_tokens}")
+    
+    print_performance(debate_report(history, state.get("round_scorecards") or []))
+
+
+def format_cost(cost: Optional[float]) -> str:
+    """A USD cost, or 'n/a' when the model has no price."""
+    return "n/a" if cost is None else f"${cost:.4f}"
+
+
+def print_performance(report: dict) -> None:
+    """Print where a debate's time, tokens and money went, per node."""
+    if not report["nodes"]:
+        return
+    
+    def ms(value: Optional[float]) -> str:
+        return "-" if value is None else f"{value:.0f}"
+    
+    print("\n⏱️  Performance (ms)")
+    print(f"   {'node':<24}{'node':>8}{'queue':>8}{'ttft':>8}{'llm':>8}{'prompt':>8}{'compl':>7}{'retry':>6}{'cost':>10}")
+    for row in report["nodes"]:
+        print(
+            f"   {row['node']:<24}{ms(row['node_latency_ms']):>8}{ms(row['queue_wait_ms']):>8}"
+            f"{ms(row['ttft_ms']):>8}{ms(row['llm_latency_ms']):>8}{row['prompt_tokens']:>8}"
+            f"{row['completion_tokens']:>7}{row['retries']:>6}{format_cost(row['cost_usd']):>10}"
+        )
+    
+    totals = report["totals"]
+    print(
+        f"\n   {totals['llm_calls']} LLM calls ({totals['cache_hits']} cached, {totals['retries']} retried) | "
+        f"node time {totals['node_latency_ms'] / 1000:.1f}s | queue wait {totals['queue_wait_ms'] / 1000:.1f}s | "
+        f"mean TTFT {ms(totals['ttft_ms'])} ms"
+    )
+    print(
+        f"   Tokens: {totals['prompt_tokens']} prompt, {totals['completion_tokens']} completion "
+        f"({totals['reasoning_tokens']} reasoning){'' if totals['usage_reported'] else ', partly estimated'} | "
+        f"Estimated cost: {format_cost(totals['cost_usd'])}"
+    )
 
 
 # ============================================================================
 # Main Execution
 # ============================================================================
 
-def run_standard(topic: str, rounds: int, config: DebateConfig) -> dict:
+def print_debate_id(debate_id: str, config: DebateConfig) -> None:
+    """Print the debate id, with a resume hint when checkpointing is on."""
+    if config.checkpoint_enabled:
+        print(f"   Debate ID: {debate_id} (resume with --resume {debate_id})")
+
+
+def run_standard(topic: str, rounds: int, config: DebateConfig, debate_id: str) -> dict:
     """
     Run debate in standard (non-streaming) mode.
     
@@ -125,9 +207,10 @@ def run_standard(topic: str, rounds: int, config: DebateConfig) -> dict:
     print(f"\n🎯 Starting debate: '{topic}'")
     print(f"   Max rounds: {rounds}")
     print(f"   Model: {config.model_name}")
+    print_debate_id(debate_id, config)
     print("\n⏳ Running debate (this may take a few minutes)...\n")
     
-    final_state = run_debate(topic=topic, max_rounds=rounds, config=config)
+    final_state = run_debate(topic=topic, max_rounds=rounds, config=config, debate_id=debate_id)
     
     # Print all turns
     for turn in final_state["history"]:
@@ -142,30 +225,70 @@ def run_standard(topic: str, rounds: int, config: DebateConfig) -> dict:
     return final_state
 
 
-def run_streaming(topic: str, rounds: int, config: DebateConfig) -> dict:
+def print_turn_header(role: str, phase: str, round_number: int) -> None:
+    """Print the header for a turn whose content is about to stream in."""
+    emojis = {
+        "proponent": "🟢",
+        "opposition": "🔴",
+        "judge": "⚖️",
+    }
+    
+    emoji = emojis.get(role, "📝")
+    phase_display = phase.upper()
+    
+    if round_number > 0:
+        phase_display += f" (Round {round_number})"
+    
+    print(f"\n{'─' * 60}")
+    print(f"{emoji} {role.upper()} - {phase_display}")
+    print(f"{'─' * 60}")
+
+
+def run_streaming(topic: str, rounds: int, config: DebateConfig, debate_id: str) -> dict:
     """
     Run debate in streaming mode.
     
-    Prints each turn as it completes.
+    Prints tokens as each agent generates them, followed by the word
+    count of the finished turn.
     """
     print(f"\n🎯 Starting streaming debate: '{topic}'")
     print(f"   Max rounds: {rounds}")
     print(f"   Model: {config.model_name}")
+    print_debate_id(debate_id, config)
     print("\n⏳ Debate in progress...\n")
     
     final_state = None
-    
-    for event in stream_debate(topic=topic, max_rounds=rounds, config=config):
-        # Each event is a dict with node name as key
-        for node_name, node_output in event.items():
-            # Print new turns as they appear
-            new_turns = node_output.get("history", [])
-            for turn in new_turns:
+    live_turn = None  # (role, phase, round_number) currently streaming
+    
+    events = stream_debate_events(topic=topic, max_rounds=rounds, config=config, debate_id=debate_id)
+    for event in events:
+        if event.kind == "token":
+            turn_key = (event.role, event.phase, event.round_number)
+            if turn_key != live_turn:
+                print_turn_header(*turn_key)
+                live_turn = turn_key
+            print(event.delta, end="", flush=True)
+            continue
+        
+        if event.kind == "reset":
+            # The call failed mid-stream and is retried; its text so far is void
+            if live_turn == (event.role, event.phase, event.round_number):
+                print("\n\n   ↻ Stream interrupted, retrying this turn...")
+                live_turn = None
+            continue
+        
+        # Node finished: close the streamed turn with its final word count
+        for turn in event.update.get("history", []):
+            if live_turn == (turn.role, turn.phase, turn.round_number):
+                print(f"\n\n   {format_turn_stats(turn)}")
+            else:
+                # Nothing was streamed for this turn (e.g. empty deltas)
                 print_turn(turn)
-            
-            # Capture final state from judge
-            if node_name == "judge":
-                final_state = node_output
+            live_turn = None
+        
+        # Capture final state from judge
+        if event.node == "judge":
+            final_state = event.update
     
     # Reconstruct full state for summary
     if final_state and "verdict" in final_state:
@@ -174,6 +297,168 @@ def run_streaming(topic: str, rounds: int, config: DebateConfig) -> dict:
     return final_state or {}
 
 
+def run_resume(debate_id: str, config: DebateConfig) -> dict:
+    """
+    Resume a checkpointed debate and print the complete result.
+    
+    Turns completed before the interruption are replayed from the
+    checkpoint rather than regenerated.
+    """
+    print(f"\n🔁 Resuming debate: {debate_id}")
+    print(f"   Checkpoints: {config.checkpoint_path}")
+    print("\n⏳ Continuing from the last completed step...\n")
+    
+    final_state = resume_debate(debate_id, config=config)
+    
+    for turn in final_state["history"]:
+        print_turn(turn)
+    
+    print_verdict(final_state)
+    print_debate_summary(final_state)
+    
+    return final_state
+
+
+def print_tournament_report(report: TournamentReport) -> None:
+    """Print throughput figures for a finished batch."""
+    print("\n" + "=" * 60)
+    print("📊 BATCH SUMMARY")
+    print("=" * 60)
+    
+    print(f"\n📋 Debates: {report.completed} completed, {report.failed} failed (of {report.total})")
+    print(f"🔀 Parallelism: {report.concurrency}")
+    print(f"⏱️  Elapsed: {report.elapsed_seconds:.1f}s")
+    print(f"\n🚀 Throughput: {report.debates_per_minute:.2f} debates/min, "
+          f"{report.turns_per_minute:.2f} turns/min")
+
+
+def run_batch(
+    topics_file: str,
+    out_path: str,
+    parallel: int,
+    rounds: int,
+    config: DebateConfig,
+) -> TournamentReport:
+    """
+    Run debates for every topic in a JSONL file.
+    
+    Results are appended to the output file as each debate finishes.
+    """
+    print(f"\n🎯 Starting batch from '{topics_file}'")
+    print(f"   Parallel debates: {parallel}")
+    print(f"   Max rounds: {rounds}")
+    print(f"   Model: {config.model_name}")
+    print(f"   Output: {out_path}\n")
+    
+    with open(out_path, "w", encoding="utf-8") as out:
+        def write_result(result: DebateResult) -> None:
+            out.write(result.model_dump_json() + "\n")
+            out.flush()
+            
+            status = result.winner.upper() if result.winner else f"FAILED ({result.error})"
+            print(f"   [{result.index}] {status} in {result.elapsed_seconds:.1f}s - {result.topic}")
+        
+        report = run_tournament(
+            load_topics(topics_file),
+            concurrency=parallel,
+            max_rounds=rounds,
+            config=config,
+            on_result=write_result,
+        )
+    
+    print_tournament_report(report)
+    
+    limiter = get_rate_limiter(config)
+    if limiter is not None:
+        stats = limiter.stats()
+        print(f"🚦 Rate limiter: {stats['waited']}/{stats['acquired']} calls waited, "
+              f"{stats['wait_seconds']:.1f}s total (max {stats['max_wait_seconds']:.1f}s)")
+    
+    return report
+
+
+def run_rejudge(
+    transcripts_file: str,
+    out_path: str,
+    parallel: int,
+    force: bool,
+    config: DebateConfig,
+) -> TournamentReport:
+    """
+    Re-judge every archived debate in a JSONL file of batch results.
+    
+    Verdicts already cached for the same transcript, judge and judge
+    prompt are reused; results are written as each transcript finishes.
+    """
+    print(f"\n⚖️  Re-judging debates from '{transcripts_file}'")
+    print(f"   Parallel transcripts: {parallel}")
+    print(f"   Judge: {judge_label(config)}")
+    print(f"   Verdict cache: {config.verdict_cache_path or '(memory)'}{' (ignored: --force)' if force else ''}")
+    print(f"   Output: {out_path}\n")
+    
+    with open(out_path, "w", encoding="utf-8") as out:
+        def write_result(result: DebateResult) -> None:
+            out.write(result.model_dump_json() + "\n")
+            out.flush()
+            
+            status = result.winner.upper() if result.winner else f"FAILED ({result.error})"
+            source = "cached" if result.cached else f"{result.elapsed_seconds:.1f}s"
+            print(f"   [{result.index}] {status} ({source}) - {result.topic}")
+        
+        report = rejudge(
+            load_transcripts(transcripts_file),
+            judge_config=config,
+            concurrency=parallel,
+            force=force,
+            on_result=write_result,
+        )
+    
+    print_tournament_report(report)
+    print(f"💾 Verdict cache: {report.cached}/{report.completed} verdicts reused")
+    
+    return report
+
+
+def add_common_arguments(parser: argparse.ArgumentParser, suppress_defaults: bool = False) -> None:
+    """
+    Add options shared by the single-debate and batch commands.
+    
+    Subcommand copies suppress their defaults so they don't overwrite
+    values given before the subcommand name.
+    """
+    def default(value):
+        return argparse.SUPPRESS if suppress_defaults else value
+    
+    parser.add_argument(
+        "--rounds", "-r",
+        type=int,
+        default=default(2),
+        help="Number of rebuttal rounds (default: 2)",
+    )
+    
+    parser.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        default=default(False),
+        help="Enable verbose logging",
+    )
+    
+    parser.add_argument(
+        "--model", "-m",
+        type=str,
+        default=default(None),
+        help="Override the default model (e.g., 'anthropic/claude-3.5-sonnet')",
+    )
+    
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=default(None),
+        metavar="PORT",
+        help="Serve Prometheus metrics at http://<METRICS_HOST>:PORT/metrics while running",
+    )
+
+
 def main() -> int:
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -184,44 +469,133 @@ Examples:
   python main.py --topic "AI will replace most jobs in 10 years"
   python main.py --topic "Remote work is better than office work" --rounds 2
   python main.py --topic "Social media is harmful" --rounds 3 --stream --verbose
+  python main.py --topic "Nuclear power is essential" --rounds 10 --checkpoint
+  python main.py --resume 3f2a9c...
+  python main.py batch --topics-file topics.jsonl --parallel 8 --out results.jsonl --metrics-port 9100
+  python main.py rejudge --transcripts results.jsonl --judge-model openai/gpt-4o --parallel 16
         """,
     )
     
     parser.add_argument(
         "--topic", "-t",
         type=str,
-        required=True,
+        default=None,
         help="The debate topic or proposition",
     )
     
-    parser.add_argument(
-        "--rounds", "-r",
-        type=int,
-        default=2,
-        help="Number of rebuttal rounds (default: 2)",
-    )
-    
     parser.add_argument(
         "--stream", "-s",
         action="store_true",
-        help="Enable streaming mode (print turns as they complete)",
+        help="Enable streaming mode (print tokens as agents generate them)",
     )
     
     parser.add_argument(
-        "--verbose", "-v",
+        "--checkpoint", "-c",
         action="store_true",
-        help="Enable verbose logging",
+        help="Checkpoint after every step so the debate can be resumed with --resume",
     )
     
     parser.add_argument(
-        "--model", "-m",
+        "--resume",
         type=str,
         default=None,
-        help="Override the default model (e.g., 'anthropic/claude-3.5-sonnet')",
+        metavar="DEBATE_ID",
+        help="Resume a checkpointed debate from its last completed step",
+    )
+    
+    add_common_arguments(parser)
+    
+    subparsers = parser.add_subparsers(dest="command")
+    
+    batch_parser = subparsers.add_parser(
+        "batch",
+        help="Run debates for many topics concurrently",
+        description="Run debates for every topic in a JSONL file, writing results as they finish.",
+    )
+    
+    batch_parser.add_argument(
+        "--topics-file",
+        type=str,
+        required=True,
+        help='JSONL file with one topic per line (a JSON string or {"topic": ...})',
+    )
+    
+    batch_parser.add_argument(
+        "--parallel", "-p",
+        type=int,
+        default=4,
+        help="Maximum debates running at once (default: 4)",
     )
     
+    batch_parser.add_argument(
+        "--out", "-o",
+        type=str,
+        default="results.jsonl",
+        help="Output JSONL file for debate results (default: results.jsonl)",
+    )
+    
+    add_common_arguments(batch_parser, suppress_defaults=True)
+    
+    rejudge_parser = subparsers.add_parser(
+        "rejudge",
+        help="Re-run only the judge over archived debates",
+        description=(
+            "Judge every debate in a JSONL file of batch results again, reusing "
+            "verdicts cached for the same transcript, judge model and judge prompt."
+        ),
+    )
+    
+    rejudge_parser.add_argument(
+        "--transcripts",
+        type=str,
+        required=True,
+        help="JSONL file of debate results (as written by the batch command)",
+    )
+    
+    rejudge_parser.add_argument(
+        "--judge-model",
+        type=str,
+        default=None,
+        help="Judge model (default: --model or DEFAULT_MODEL)",
+    )
+    
+    rejudge_parser.add_argument(
+        "--judge-models",
+        type=str,
+        default=None,
+        help="Comma-separated models for a judge panel (overrides --judge-model)",
+    )
+    
+    rejudge_parser.add_argument(
+        "--parallel", "-p",
+        type=int,
+        default=4,
+        help="Maximum transcripts judged at once (default: 4)",
+    )
+    
+    rejudge_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-judge transcripts that already have a cached verdict",
+    )
+    
+    rejudge_parser.add_argument(
+        "--out", "-o",
+        type=str,
+        default="rejudged.jsonl",
+        help="Output JSONL file for re-judged results (default: rejudged.jsonl)",
+    )
+    
+    add_common_arguments(rejudge_parser, suppress_defaults=True)
+    
     args = parser.parse_args()
     
+    if args.command is None and not (args.topic or args.resume):
+        parser.error("--topic is required unless --resume or a subcommand is given")
+    
+    if args.command in ("batch", "rejudge") and args.parallel < 1:
+        parser.error("--parallel must be at least 1")
+    
     # Setup logging
     setup_logging(args.verbose)
     
@@ -237,18 +611,53 @@ Examples:
     if args.model:
         config = DebateConfig(**{**config.model_dump(), "model_name": args.model})
     
+    # Resuming requires the checkpoint store
+    if args.checkpoint or args.resume:
+        config = DebateConfig(**{**config.model_dump(), "checkpoint_enabled": True})
+    
+    if args.metrics_port is not None:
+        config = DebateConfig(**{**config.model_dump(), "metrics_port": args.metrics_port})
+    
+    # Start the metrics endpoint now, so it can be scraped before the first call
+    if get_metrics(config) is not None and metrics_address() is not None:
+        host, port = metrics_address()
+        print(f"📈 Metrics: http://{host}:{port}/metrics")
+    
+    debate_id = args.resume or uuid.uuid4().hex
+    
     # Run debate
     try:
-        if args.stream:
-            run_streaming(args.topic, args.rounds, config)
+        if args.command == "batch":
+            report = run_batch(args.topics_file, args.out, args.parallel, args.rounds, config)
+            
+            print(f"\n✅ Batch completed ({report.failed} failed)!\n")
+            return 0 if report.failed == 0 else 1
+        
+        if args.command == "rejudge":
+            if args.judge_models:
+                judge_models = [model.strip() for model in args.judge_models.split(",") if model.strip()]
+                config = DebateConfig(**{**config.model_dump(), "judge_models": judge_models})
+            elif args.judge_model:
+                config = DebateConfig(**{**config.model_dump(), "model_name": args.judge_model, "judge_models": []})
+            report = run_rejudge(args.transcripts, args.out, args.parallel, args.force, config)
+            
+            print(f"\n✅ Re-judging completed ({report.failed} failed)!\n")
+            return 0 if report.failed == 0 else 1
+        
+        if args.resume:
+            run_resume(args.resume, config)
+        elif args.stream:
+            run_streaming(args.topic, args.rounds, config, debate_id)
         else:
-            run_standard(args.topic, args.rounds, config)
+            run_standard(args.topic, args.rounds, config, debate_id)
         
         print("\n✅ Debate completed successfully!\n")
         return 0
-        
+    
     except KeyboardInterrupt:
         print("\n\n⚠️  Debate interrupted by user.")
+        if config.checkpoint_enabled and args.command is None:
+            print(f"💡 Resume with: python main.py --resume {debate_id}")
         return 130
     
     except Exception as e:
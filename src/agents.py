@@ -8,30 +8,60 @@ Each node:
 4. Validates output format
 5. Returns additive state update
 
-Nodes follow LangGraph conventions: (state) -> partial state dict
+Nodes follow LangGraph conventions: (state) -> partial state dict.
+Each factory returns a runnable with both a sync and an async body, so the
+same compiled graph serves graph.invoke() and graph.ainvoke().
 """
 
+import asyncio
+import contextlib
+import contextvars
+import functools
 import logging
-from typing import Any, Dict
+import math
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
 from langchain_openai import ChatOpenAI
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import BaseMessage, HumanMessage
+from langchain_core.runnables import RunnableLambda
+from langgraph.config import get_config, get_stream_writer
 
 from .config import DebateConfig
-from .models import DebateState, DebateTurn
+from .cache import get_response_cache, make_cache_key
+from .ratelimit import get_rate_limiter
+from .retry import get_circuit_breaker
+from .metrics import get_metrics
+from .telemetry import CallTimer, merge_metrics, timed_node
+from .memory import update_memory
+from .verdict import parse_verdict, render_verdict
+from .reasoning import ReasoningFilter, reasoning_allowance, reasoning_request, split_reasoning
+from .models import DebateState, DebateTurn, JudgeVerdict, LLMReply, TurnMetrics, TurnStats
 from .prompts import (
     build_proponent_prompt,
     build_opposition_prompt,
     build_judge_prompt,
+    build_round_scorer_prompt,
+    build_section_repair_prompt,
+    build_scorecard_judge_prompt,
+    build_messages,
+    messages_text,
 )
 from .utils import (
     retry_with_backoff,
-    validate_proponent_output,
-    validate_opposition_output,
-    validate_judge_output,
-    truncate_response,
+    async_retry_with_backoff,
+    analyze_turn,
+    splice_sections,
     clean_response,
-    extract_winner_from_text,
-    extract_confidence_from_text,
+    PROPONENT_HEADERS,
+    OPPOSITION_HEADERS,
+    JUDGE_HEADERS,
+    extract_round_scores,
+    estimate_tokens,
+    WordBudget,
 )
 
 logger = logging.getLogger(__name__)
@@ -41,26 +71,35 @@ logger = logging.getLogger(__name__)
 # LLM Client Factory
 # ============================================================================
 
-def create_llm_client(config: DebateConfig) -> ChatOpenAI:
+def create_llm_client(
+    config: DebateConfig,
+    http_client: Any = None,
+    http_async_client: Any = None,
+) -> ChatOpenAI:
     """
     Create a configured LLM client for OpenRouter.
     
     Args:
         config: Debate configuration with API settings
-        
+        http_client: Optional httpx.Client to reuse for sync calls
+        http_async_client: Optional httpx.AsyncClient to reuse for async calls
+    
     Returns:
         Configured ChatOpenAI instance
     """
     return ChatOpenAI(
         model=config.model_name,
-        openai_api_key=config.openrouter_api_key,
-        openai_api_base=config.openrouter_base_url,
+        openai_api_key=config.openrouter_api_key or "mock",
+        openai_api_base=config.llm_base_url(),
         temperature=config.temperature,
-        max_tokens=2000,  # Reasonable limit for debate responses
+        max_retries=0,  # Retries are owned by retry_with_backoff's policy
+        stream_usage=True,  # Streamed responses report their reasoning tokens too
         default_headers={
             "HTTP-Referer": "https://debate-agent.local",
             "X-Title": "Multi-Agent Debate System",
-        }
+        },
+        http_client=http_client,
+        http_async_client=http_async_client,
     )
 
 
@@ -68,233 +107,1463 @@ def create_llm_client(config: DebateConfig) -> ChatOpenAI:
 # Agent Invocation Helper
 # ============================================================================
 
+# Prompt = a flattened prompt string or a chat message list
+Prompt = Union[str, List[BaseMessage]]
+
+# Providers that only cache prompts at explicit cache_control breakpoints;
+# the rest (OpenAI, DeepSeek, ...) cache matching prefixes automatically
+CACHE_CONTROL_MODEL_PREFIXES = ("anthropic/", "google/gemini")
+
+
+def prompt_text(prompt: Prompt) -> str:
+    """Flatten a prompt to text for token estimates and cache keys."""
+    return prompt if isinstance(prompt, str) else messages_text(prompt)
+
+
+class TokenSink:
+    """
+    Receiver for a streamed response's text deltas.
+    
+    A failed attempt may already have streamed part of its answer; before
+    a retry streams the answer again, reset() is called so the consumer
+    can discard the partial text.
+    """
+    
+    def __init__(self, on_delta: Callable[[str], None], on_reset: Optional[Callable[[], None]] = None):
+        """
+        Args:
+            on_delta: Called with each text delta as it arrives
+            on_reset: Called when the deltas received so far are void
+        """
+        self.on_delta = on_delta
+        self.on_reset = on_reset
+    
+    def __call__(self, delta: str) -> None:
+        self.on_delta(delta)
+    
+    def reset(self) -> None:
+        """Void the deltas sent so far."""
+        if self.on_reset is not None:
+            self.on_reset()
+
+
+def use_cache_hints(config: DebateConfig) -> bool:
+    """Whether to add cache_control breakpoints for the configured model."""
+    if config.prompt_cache_hints is not None:
+        return config.prompt_cache_hints
+    return config.model_name.startswith(CACHE_CONTROL_MODEL_PREFIXES)
+
+
+# Completion tokens allowed per response word (English averages ~1.3 tokens
+# per word; markdown headers and bullets add a little)
+TOKENS_PER_WORD = 1.5
+
+# Verdicts and scorecards are not word-limited, so they get fixed caps
+VERDICT_MAX_TOKENS = 2000
+SCORECARD_MAX_TOKENS = 600
+
+
+# OpenAI-style JSON mode; providers without it ignore the parameter and the
+# verdict parser falls back to markdown
+JSON_RESPONSE_FORMAT = {"type": "json_object"}
+
+
+def phase_role(phase: str) -> str:
+    """Reasoning role for a phase: "judge" for verdicts and scoring, else "debater"."""
+    return "judge" if phase in ("verdict", "scoring") else "debater"
+
+
+def response_max_tokens(config: DebateConfig, phase: str) -> int:
+    """
+    Completion token cap for a call in the given phase.
+    
+    Debater phases (opening, rebuttal, closing) get their word budget plus
+    the stop grace window; "verdict" and "scoring" use fixed caps. Either
+    way the role's reasoning allowance is added on top, so reasoning
+    models cannot use up the cap before they answer.
+    
+    Args:
+        config: Debate configuration with the word budget and the model
+            being called
+        phase: Debate phase, "verdict" for judges or "scoring" for the scorer
+    
+    Returns:
+        Value for the request's max_tokens
+    """
+    if phase == "verdict":
+        answer_tokens = VERDICT_MAX_TOKENS
+    elif phase == "scoring":
+        answer_tokens = SCORECARD_MAX_TOKENS
+    else:
+        answer_tokens = math.ceil((config.max_response_length + config.stop_grace_words) * TOKENS_PER_WORD)
+    return answer_tokens + reasoning_allowance(config, phase_role(phase), answer_tokens)
+
+
+def generation_options(config: DebateConfig, phase: str) -> Dict[str, Any]:
+    """
+    Per-call generation settings for a phase.
+    
+    Args:
+        config: Debate configuration for the model being called
+        phase: Debate phase, "verdict" or "scoring"
+    
+    Returns:
+        max_tokens, reasoning and (for JSON verdicts) response_format
+        keyword arguments for invoke_agent
+    """
+    options = {
+        "max_tokens": response_max_tokens(config, phase),
+        "reasoning": reasoning_request(config, phase_role(phase)),
+    }
+    if phase == "verdict" and config.judge_output_format == "json":
+        options["response_format"] = JSON_RESPONSE_FORMAT
+    return options
+
+
+def build_reply(answer: str, reasoning: str, usage: Optional[Dict[str, Any]]) -> LLMReply:
+    """
+    Combine a response's text with its token usage.
+    
+    Reported usage is preferred: it also counts reasoning the provider
+    returned out of band or not at all. Without it (e.g. a stream that was
+    cancelled early) both counts are estimated from the text. The token
+    counts are also recorded in the reply's metrics.
+    
+    Args:
+        answer: Answer text with reasoning removed
+        reasoning: Inline reasoning text that was removed
+        usage: LangChain usage_metadata, if the provider sent it
+    
+    Returns:
+        LLMReply for the call
+    """
+    reasoning_tokens = estimate_tokens(reasoning)
+    answer_tokens = estimate_tokens(answer)
+    reported = bool(usage and usage.get("output_tokens"))
+    
+    if reported:
+        details = usage.get("output_token_details") or {}
+        reasoning_tokens = details.get("reasoning") or reasoning_tokens
+        answer_tokens = max(usage["output_tokens"] - reasoning_tokens, 0)
+    
+    metrics = TurnMetrics(
+        prompt_tokens=(usage or {}).get("input_tokens", 0),
+        completion_tokens=reasoning_tokens + answer_tokens,
+        reasoning_tokens=reasoning_tokens,
+        usage_reported=reported,
+    )
+    return LLMReply(
+        content=answer,
+        reasoning_tokens=reasoning_tokens,
+        answer_tokens=answer_tokens,
+        metrics=metrics,
+    )
+
+
+def estimate_request_tokens(prompt: str, config: DebateConfig) -> int:
+    """
+    Estimate the tokens a call will consume, for rate-limit reservation.
+    
+    Counts the prompt plus a full-length response (~4/3 tokens per word);
+    the reservation is corrected once the real response is known.
+    """
+    return estimate_tokens(prompt) + config.max_response_length * 4 // 3
+
+
+def request_kwargs(
+    max_tokens: Optional[int],
+    reasoning: Optional[Dict[str, Any]],
+    response_format: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Per-call request parameters for ChatOpenAI.invoke/stream."""
+    kwargs: Dict[str, Any] = {}
+    if max_tokens:
+        kwargs["max_tokens"] = max_tokens
+    if response_format:
+        kwargs["response_format"] = response_format
+    if reasoning:
+        # Not an OpenAI parameter, so it goes in the raw request body
+        kwargs["extra_body"] = {"reasoning": reasoning}
+    return kwargs
+
+
+def response_cache_key(
+    config: DebateConfig,
+    text: str,
+    max_tokens: Optional[int],
+    reasoning: Optional[Dict[str, Any]],
+    response_format: Optional[Dict[str, Any]],
+    max_words: Optional[int],
+) -> str:
+    """Response cache key covering every setting that shapes the response."""
+    options = request_kwargs(max_tokens, reasoning, response_format)
+    if max_words:
+        # A response cut short under one word budget is no answer for another
+        options["max_words"] = max_words
+        options["stop_grace_words"] = config.stop_grace_words
+    return make_cache_key(config.model_name, config.temperature, text, options)
+
+
 def invoke_agent(
     llm: ChatOpenAI,
-    prompt: str,
-    config: DebateConfig
-) -> str:
+    prompt: Prompt,
+    config: DebateConfig,
+    on_token: Optional[TokenSink] = None,
+    max_tokens: Optional[int] = None,
+    reasoning: Optional[Dict[str, Any]] = None,
+    max_words: Optional[int] = None,
+    response_format: Optional[Dict[str, Any]] = None,
+) -> LLMReply:
     """
     Invoke LLM with retry logic.
     
     Args:
         llm: Configured LLM client
-        prompt: Complete prompt string
+        prompt: Complete prompt string, or chat messages
         config: Configuration for retry settings
-        
+        on_token: Optional sink; when set, the response is streamed and
+            each text delta is passed to it as it arrives (a retry after
+            a partially streamed attempt resets it first)
+        max_tokens: Completion token cap for this call (None = client default)
+        reasoning: OpenRouter reasoning parameter (None = model default)
+        max_words: Optional word budget; when set, the response is streamed
+            and the request is cancelled once the budget is reached and the
+            sentence is finished (or config.stop_grace_words later)
+        response_format: Optional structured-output mode, e.g. JSON_RESPONSE_FORMAT
+    
     Returns:
-        LLM response content
+        LLMReply with the answer (inline reasoning removed), token split
+        and call metrics
     """
+    timer = CallTimer()
+    metrics = get_metrics(config)
+    text = prompt_text(prompt)
+    messages = [HumanMessage(content=prompt)] if isinstance(prompt, str) else list(prompt)
+    
+    cache = get_response_cache(config)
+    if cache is not None:
+        cache_key = response_cache_key(config, text, max_tokens, reasoning, response_format, max_words)
+        cached = cache.get(cache_key)
+        if metrics is not None:
+            metrics.record_cache("response", cached is not None)
+        if cached is not None:
+            logger.debug("Response cache hit")
+            if on_token is not None:
+                on_token(cached)
+            return timer.cached(LLMReply(content=cached, answer_tokens=estimate_tokens(cached)))
+    
+    limiter = get_rate_limiter(config)
+    reserved_tokens = estimate_request_tokens(text, config)
+    breaker = get_circuit_breaker(config)
+    streamed = False  # Set once an attempt streams; a retry must then reset on_token
+    
+    def _request() -> LLMReply:
+        """Send one attempt's request and read its (streamed) response."""
+        nonlocal streamed
+        timer.send()
+        if metrics is not None:
+            metrics.llm_requests.inc(config.model_name)
+        call_kwargs = request_kwargs(max_tokens, reasoning, response_format)
+        if on_token is None and max_words is None:
+            response = llm.invoke(messages, **call_kwargs)
+            return build_reply(*split_reasoning(response.content), response.usage_metadata)
+        
+        budget = WordBudget(max_words, config.stop_grace_words) if max_words else None
+        reasoning_filter = ReasoningFilter()
+        usage = None
+        stream = llm.stream(messages, **call_kwargs)
+        try:
+            for chunk in stream:
+                usage = chunk.usage_metadata or usage
+                if not chunk.content:
+                    continue
+                timer.first_token()
+                delta = reasoning_filter.feed(chunk.content)
+                if not delta:
+                    continue
+                if on_token is not None:
+                    on_token(delta)
+                    streamed = True
+                if budget is not None and budget.feed(delta):
+                    logger.info(f"Generation stopped at {budget.words} words (budget {max_words})")
+                    break
+        finally:
+            # Closing the stream drops the connection, which cancels generation
+            stream.close()
+        
+        tail = reasoning_filter.flush()
+        if tail and on_token is not None:
+            on_token(tail)
+        return build_reply(reasoning_filter.answer, reasoning_filter.reasoning, usage)
+    
     @retry_with_backoff(
         max_retries=config.max_retries,
         base_delay=config.retry_delay,
+        max_delay=config.retry_max_delay,
+        circuit_breaker=breaker,
+        on_failure=None if metrics is None else functools.partial(metrics.record_llm_failure, config.model_name),
     )
     def _invoke():
-        response = llm.invoke([HumanMessage(content=prompt)])
-        return response.content
+        nonlocal streamed
+        if streamed:
+            on_token.reset()
+            streamed = False
+        
+        if limiter is None:
+            return _request()
+        
+        # Every attempt, including retries, counts against the shared quota
+        waited = time.perf_counter()
+        limiter.acquire(reserved_tokens)
+        timer.queued(waited)
+        try:
+            reply = _request()
+        except BaseException:
+            # Settled per attempt: a failed attempt's tokens are refunded
+            limiter.settle(-reserved_tokens)
+            raise
+        limiter.settle(estimate_tokens(text) + reply.reasoning_tokens + reply.answer_tokens - reserved_tokens)
+        return reply
     
-    return _invoke()
+    reply = _invoke()
+    if cache is not None:
+        cache.set(cache_key, reply.content)
+    reply = timer.finish(reply, config, text)
+    if metrics is not None:
+        metrics.record_llm_call(config.model_name, reply.metrics)
+    return reply
+
+
+async def ainvoke_agent(
+    llm: ChatOpenAI,
+    prompt: Prompt,
+    config: DebateConfig,
+    on_token: Optional[TokenSink] = None,
+    max_tokens: Optional[int] = None,
+    reasoning: Optional[Dict[str, Any]] = None,
+    max_words: Optional[int] = None,
+    response_format: Optional[Dict[str, Any]] = None,
+) -> LLMReply:
+    """
+    Invoke LLM asynchronously with retry logic.
+    
+    Args:
+        llm: Configured LLM client
+        prompt: Complete prompt string, or chat messages
+        config: Configuration for retry settings
+        on_token: Optional sink; when set, the response is streamed and
+            each text delta is passed to it as it arrives (a retry after
+            a partially streamed attempt resets it first)
+        max_tokens: Completion token cap for this call (None = client default)
+        reasoning: OpenRouter reasoning parameter (None = model default)
+        max_words: Optional word budget; when set, the response is streamed
+            and the request is cancelled once the budget is reached and the
+            sentence is finished (or config.stop_grace_words later)
+        response_format: Optional structured-output mode, e.g. JSON_RESPONSE_FORMAT
+    
+    Returns:
+        LLMReply with the answer (inline reasoning removed), token split
+        and call metrics
+    """
+    timer = CallTimer()
+    metrics = get_metrics(config)
+    text = prompt_text(prompt)
+    messages = [HumanMessage(content=prompt)] if isinstance(prompt, str) else list(prompt)
+    
+    cache = get_response_cache(config)
+    if cache is not None:
+        cache_key = response_cache_key(config, text, max_tokens, reasoning, response_format, max_words)
+        cached = await cache.aget(cache_key)
+        if metrics is not None:
+            metrics.record_cache("response", cached is not None)
+        if cached is not None:
+            logger.debug("Response cache hit")
+            if on_token is not None:
+                on_token(cached)
+            return timer.cached(LLMReply(content=cached, answer_tokens=estimate_tokens(cached)))
+    
+    limiter = get_rate_limiter(config)
+    reserved_tokens = estimate_request_tokens(text, config)
+    breaker = get_circuit_breaker(config)
+    streamed = False  # Set once an attempt streams; a retry must then reset on_token
+    
+    async def _arequest() -> LLMReply:
+        """Send one attempt's request and read its (streamed) response."""
+        nonlocal streamed
+        timer.send()
+        if metrics is not None:
+            metrics.llm_requests.inc(config.model_name)
+        call_kwargs = request_kwargs(max_tokens, reasoning, response_format)
+        if on_token is None and max_words is None:
+            response = await llm.ainvoke(messages, **call_kwargs)
+            return build_reply(*split_reasoning(response.content), response.usage_metadata)
+        
+        budget = WordBudget(max_words, config.stop_grace_words) if max_words else None
+        reasoning_filter = ReasoningFilter()
+        usage = None
+        stream = llm.astream(messages, **call_kwargs)
+        try:
+            async for chunk in stream:
+                usage = chunk.usage_metadata or usage
+                if not chunk.content:
+                    continue
+                timer.first_token()
+                delta = reasoning_filter.feed(chunk.content)
+                if not delta:
+                    continue
+                if on_token is not None:
+                    on_token(delta)
+                    streamed = True
+                if budget is not None and budget.feed(delta):
+                    logger.info(f"Generation stopped at {budget.words} words (budget {max_words})")
+                    break
+        finally:
+            # Closing the stream drops the connection, which cancels generation
+            await stream.aclose()
+        
+        tail = reasoning_filter.flush()
+        if tail and on_token is not None:
+            on_token(tail)
+        return build_reply(reasoning_filter.answer, reasoning_filter.reasoning, usage)
+    
+    @async_retry_with_backoff(
+        max_retries=config.max_retries,
+        base_delay=config.retry_delay,
+        max_delay=config.retry_max_delay,
+        circuit_breaker=breaker,
+        on_failure=None if metrics is None else functools.partial(metrics.record_llm_failure, config.model_name),
+    )
+    async def _ainvoke():
+        nonlocal streamed
+        if streamed:
+            on_token.reset()
+            streamed = False
+        
+        if limiter is None:
+            return await _arequest()
+        
+        # Every attempt, including retries, counts against the shared quota
+        waited = time.perf_counter()
+        await limiter.aacquire(reserved_tokens)
+        timer.queued(waited)
+        try:
+            reply = await _arequest()
+        except BaseException:
+            # Settled per attempt: a failed attempt's tokens are refunded
+            await limiter.asettle(-reserved_tokens)
+            raise
+        await limiter.asettle(estimate_tokens(text) + reply.reasoning_tokens + reply.answer_tokens - reserved_tokens)
+        return reply
+    
+    reply = await _ainvoke()
+    if cache is not None:
+        await cache.aset(cache_key, reply.content)
+    reply = timer.finish(reply, config, text)
+    if metrics is not None:
+        metrics.record_llm_call(config.model_name, reply.metrics)
+    return reply
+
+
+def get_token_sink(role: str, state: Dict[str, Any]) -> Optional[TokenSink]:
+    """
+    Build a sink that forwards token deltas to the graph's custom stream.
+    
+    Token streaming is opt-in per run: it is only enabled when the graph is
+    executed with ``{"configurable": {"stream_tokens": True}}``.
+    
+    Args:
+        role: Agent role generating the tokens
+        state: Current graph state (for phase and round metadata)
+    
+    Returns:
+        TokenSink for the turn, or None if streaming is disabled
+    """
+    try:
+        run_config = get_config()
+    except RuntimeError:
+        # Called outside of a graph run
+        return None
+    
+    if not run_config.get("configurable", {}).get("stream_tokens"):
+        return None
+    
+    writer = get_stream_writer()
+    phase = "verdict" if role == "judge" else state["current_phase"]
+    round_number = 0 if role == "judge" else state["current_round"]
+    
+    def emit(kind: str, delta: str) -> None:
+        writer({
+            "kind": kind,
+            "node": role,
+            "role": role,
+            "phase": phase,
+            "round_number": round_number,
+            "delta": delta,
+        })
+    
+    return TokenSink(functools.partial(emit, "token"), functools.partial(emit, "reset", ""))
+
+
+# ============================================================================
+# Section Repair
+# ============================================================================
+
+ROLE_HEADERS = {
+    "proponent": PROPONENT_HEADERS,
+    "opposition": OPPOSITION_HEADERS,
+}
+
+
+def repair_options(config: DebateConfig) -> Dict[str, Any]:
+    """Generation settings for a section repair call (debater reasoning settings)."""
+    return {
+        "max_tokens": config.repair_max_tokens + reasoning_allowance(config, "debater", config.repair_max_tokens),
+        "reasoning": reasoning_request(config, "debater"),
+    }
+
+
+def build_repair_messages(config: DebateConfig, role: str, topic: str, stats: TurnStats) -> List[BaseMessage]:
+    """
+    Build the follow-up call asking only for a turn's missing sections.
+    
+    The repair budget is split evenly across the missing sections.
+    
+    Args:
+        config: Debate configuration with the repair budget
+        role: Debater whose turn is incomplete
+        topic: The debate proposition
+        stats: Analysis of the incomplete turn
+    
+    Returns:
+        Chat messages for the repair call
+    """
+    words = int(config.repair_max_tokens / TOKENS_PER_WORD / len(stats.missing_headers))
+    prompt = build_section_repair_prompt(role, topic, stats.content, stats.missing_headers, max(words, 10))
+    return build_messages(prompt, use_cache_hints(config))
+
+
+def merge_repair(reply: LLMReply, stats: TurnStats, repair: LLMReply, role: str) -> tuple[LLMReply, TurnStats]:
+    """
+    Splice the sections a repair call returned into the turn.
+    
+    Args:
+        reply: The turn's original reply
+        stats: Analysis of the incomplete turn
+        repair: Reply to the repair call
+        role: Debater whose turn is being repaired
+    
+    Returns:
+        Tuple of (reply with both calls' tokens, analysis of the repaired turn)
+    """
+    headers = ROLE_HEADERS[role]
+    returned = analyze_turn(repair.content, required_headers=tuple(stats.missing_headers))
+    additions = {
+        header: returned.section(header)
+        for header in stats.missing_headers
+        if returned.section(header)
+    }
+    
+    merged = LLMReply(
+        content=reply.content,
+        reasoning_tokens=reply.reasoning_tokens + repair.reasoning_tokens,
+        answer_tokens=reply.answer_tokens + repair.answer_tokens,
+        metrics=merge_metrics([reply.metrics, repair.metrics]),
+    )
+    if not additions:
+        logger.warning(f"Section repair for {role} returned none of {stats.missing_headers}")
+        return merged, stats
+    
+    content = splice_sections(stats.content, stats.sections, headers, additions)
+    logger.info(f"Repaired {role} sections {list(additions)} with {repair.answer_tokens} tokens")
+    return merged, analyze_turn(content, required_headers=headers)
+
+
+def review_turn(
+    llm: ChatOpenAI,
+    config: DebateConfig,
+    role: str,
+    topic: str,
+    reply: LLMReply,
+) -> tuple[LLMReply, TurnStats]:
+    """
+    Clean, truncate and validate a debater's reply, repairing missing sections.
+    
+    With config.repair_sections, missing sections are requested in one small
+    follow-up call instead of regenerating the turn. A failed repair keeps
+    the turn as generated.
+    
+    Args:
+        llm: Client the turn was generated with
+        config: Debate configuration
+        role: "proponent" or "opposition"
+        topic: The debate proposition
+        reply: The debater's reply
+    
+    Returns:
+        Tuple of (reply including any repair tokens, turn analysis)
+    """
+    stats = analyze_turn(reply.content, config.max_response_length, ROLE_HEADERS[role])
+    if stats.is_valid or not config.repair_sections:
+        return reply, stats
+    
+    try:
+        repair = invoke_agent(llm, build_repair_messages(config, role, topic, stats), config, **repair_options(config))
+    except Exception as e:
+        logger.warning(f"Section repair for {role} failed: {e}")
+        return reply, stats
+    return merge_repair(reply, stats, repair, role)
+
+
+async def areview_turn(
+    llm: ChatOpenAI,
+    config: DebateConfig,
+    role: str,
+    topic: str,
+    reply: LLMReply,
+) -> tuple[LLMReply, TurnStats]:
+    """Async variant of review_turn."""
+    stats = analyze_turn(reply.content, config.max_response_length, ROLE_HEADERS[role])
+    if stats.is_valid or not config.repair_sections:
+        return reply, stats
+    
+    try:
+        repair = await ainvoke_agent(
+            llm, build_repair_messages(config, role, topic, stats), config, **repair_options(config)
+        )
+    except Exception as e:
+        logger.warning(f"Section repair for {role} failed: {e}")
+        return reply, stats
+    return merge_repair(reply, stats, repair, role)
 
 
 # ============================================================================
 # Proponent Agent Node
 # ============================================================================
 
-def create_proponent_node(config: DebateConfig):
+def create_proponent_node(config: DebateConfig, llm: Optional[ChatOpenAI] = None):
     """
     Factory function to create a proponent agent node.
     
     Args:
         config: Debate configuration
-        
+        llm: Optional shared LLM client (a new one is created if omitted)
+    
     Returns:
-        Node function for LangGraph
+        Runnable node (sync and async) for LangGraph
     """
-    llm = create_llm_client(config)
+    llm = llm or create_llm_client(config)
     
-    def proponent_node(state: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Execute proponent agent turn.
-        
-        Constructs prompt based on current phase and history,
-        invokes LLM, validates output, and returns state update.
-        """
+    def build_prompt(state: Dict[str, Any]) -> List[BaseMessage]:
+        """Build the context-aware proponent messages for the current phase."""
         logger.info(f"Proponent agent executing - Phase: {state['current_phase']}, Round: {state['current_round']}")
         
-        # Build context-aware prompt
         prompt = build_proponent_prompt(
             topic=state["topic"],
             phase=state["current_phase"],
             round_number=state["current_round"],
             history=state["history"],
             max_words=config.max_response_length,
+            max_prompt_tokens=config.max_prompt_tokens,
+            memory=(state.get("memory") or {}).get("proponent") if config.memory_enabled else None,
         )
-        
-        # Invoke LLM
-        raw_response = invoke_agent(llm, prompt, config)
-        
-        # Clean and truncate response
-        response = clean_response(raw_response)
-        response = truncate_response(response, config.max_response_length)
-        
-        # Validate output format (log warning if invalid, but continue)
-        is_valid, missing = validate_proponent_output(response)
-        if not is_valid:
-            logger.warning(f"Proponent output missing headers: {missing}")
+        return build_messages(prompt, use_cache_hints(config))
+    
+    def process_response(
+        state: Dict[str, Any],
+        reply: LLMReply,
+        stats: TurnStats,
+        prompt: Prompt,
+    ) -> Dict[str, Any]:
+        """Record the proponent's reviewed response."""
+        # Log a warning if still invalid, but continue
+        if not stats.is_valid:
+            logger.warning(f"Proponent output missing headers: {stats.missing_headers}")
         
         # Create turn record
         turn = DebateTurn(
             role="proponent",
             phase=state["current_phase"],
             round_number=state["current_round"],
-            content=response,
+            content=stats.content,
+            word_count=stats.word_count,
+            prompt_tokens=estimate_tokens(prompt_text(prompt)),
+            reasoning_tokens=reply.reasoning_tokens,
+            answer_tokens=reply.answer_tokens,
+            metrics=reply.metrics,
         )
         
-        logger.info(f"Proponent turn complete - {turn.word_count} words")
+        logger.info(
+            f"Proponent turn complete - {turn.word_count} words, {turn.prompt_tokens} prompt tokens, "
+            f"{turn.reasoning_tokens} reasoning tokens"
+        )
         
         # Return additive state update
-        return {
-            "history": [turn],  # Will be added via reducer
-        }
+        update = {"history": [turn]}  # Will be added via reducer
+        if config.memory_enabled:
+            memory = (state.get("memory") or {}).get("proponent", "")
+            update["memory"] = {"proponent": update_memory(memory, turn, config.memory_max_tokens)}
+        return update
+    
+    def proponent_node(state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute proponent agent turn.
+        
+        Constructs prompt based on current phase and history,
+        invokes LLM, validates output, and returns state update.
+        """
+        prompt = build_prompt(state)
+        reply = invoke_agent(
+            llm,
+            prompt,
+            config,
+            get_token_sink("proponent", state),
+            **generation_options(config, state["current_phase"]),
+            max_words=config.max_response_length,
+        )
+        reply, stats = review_turn(llm, config, "proponent", state["topic"], reply)
+        return process_response(state, reply, stats, prompt)
+    
+    async def aproponent_node(state: Dict[str, Any]) -> Dict[str, Any]:
+        """Async variant of proponent_node."""
+        prompt = build_prompt(state)
+        reply = await ainvoke_agent(
+            llm,
+            prompt,
+            config,
+            get_token_sink("proponent", state),
+            **generation_options(config, state["current_phase"]),
+            max_words=config.max_response_length,
+        )
+        reply, stats = await areview_turn(llm, config, "proponent", state["topic"], reply)
+        return process_response(state, reply, stats, prompt)
     
-    return proponent_node
+    return RunnableLambda(timed_node(proponent_node, "proponent"), afunc=timed_node(aproponent_node, "proponent"), name="proponent")
 
 
 # ============================================================================
 # Opposition Agent Node
 # ============================================================================
 
-def create_opposition_node(config: DebateConfig):
+def create_opposition_node(config: DebateConfig, llm: Optional[ChatOpenAI] = None):
     """
     Factory function to create an opposition agent node.
     
     Args:
         config: Debate configuration
-        
+        llm: Optional shared LLM client (a new one is created if omitted)
+    
     Returns:
-        Node function for LangGraph
+        Runnable node (sync and async) for LangGraph
     """
-    llm = create_llm_client(config)
+    llm = llm or create_llm_client(config)
     
-    def opposition_node(state: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Execute opposition agent turn.
-        
-        Responds to proponent's arguments with counterarguments.
-        """
+    def build_prompt(state: Dict[str, Any]) -> List[BaseMessage]:
+        """Build the context-aware opposition messages for the current phase."""
         logger.info(f"Opposition agent executing - Phase: {state['current_phase']}, Round: {state['current_round']}")
         
-        # Build context-aware prompt
         prompt = build_opposition_prompt(
             topic=state["topic"],
             phase=state["current_phase"],
             round_number=state["current_round"],
             history=state["history"],
             max_words=config.max_response_length,
+            max_prompt_tokens=config.max_prompt_tokens,
+            memory=(state.get("memory") or {}).get("opposition") if config.memory_enabled else None,
         )
-        
-        # Invoke LLM
-        raw_response = invoke_agent(llm, prompt, config)
-        
-        # Clean and truncate response
-        response = clean_response(raw_response)
-        response = truncate_response(response, config.max_response_length)
-        
-        # Validate output format
-        is_valid, missing = validate_opposition_output(response)
-        if not is_valid:
-            logger.warning(f"Opposition output missing headers: {missing}")
+        return build_messages(prompt, use_cache_hints(config))
+    
+    def process_response(
+        state: Dict[str, Any],
+        reply: LLMReply,
+        stats: TurnStats,
+        prompt: Prompt,
+    ) -> Dict[str, Any]:
+        """Record the opposition's reviewed response."""
+        # Log a warning if still invalid, but continue
+        if not stats.is_valid:
+            logger.warning(f"Opposition output missing headers: {stats.missing_headers}")
         
         # Create turn record
         turn = DebateTurn(
             role="opposition",
             phase=state["current_phase"],
             round_number=state["current_round"],
-            content=response,
+            content=stats.content,
+            word_count=stats.word_count,
+            prompt_tokens=estimate_tokens(prompt_text(prompt)),
+            reasoning_tokens=reply.reasoning_tokens,
+            answer_tokens=reply.answer_tokens,
+            metrics=reply.metrics,
         )
         
-        logger.info(f"Opposition turn complete - {turn.word_count} words")
+        logger.info(
+            f"Opposition turn complete - {turn.word_count} words, {turn.prompt_tokens} prompt tokens, "
+            f"{turn.reasoning_tokens} reasoning tokens"
+        )
         
         # Return additive state update
-        return {
-            "history": [turn],
-        }
+        update = {"history": [turn]}
+        if config.memory_enabled:
+            memory = (state.get("memory") or {}).get("opposition", "")
+            update["memory"] = {"opposition": update_memory(memory, turn, config.memory_max_tokens)}
+        return update
     
-    return opposition_node
+    def opposition_node(state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute opposition agent turn.
+        
+        Responds to proponent's arguments with counterarguments.
+        """
+        prompt = build_prompt(state)
+        reply = invoke_agent(
+            llm,
+            prompt,
+            config,
+            get_token_sink("opposition", state),
+            **generation_options(config, state["current_phase"]),
+            max_words=config.max_response_length,
+        )
+        reply, stats = review_turn(llm, config, "opposition", state["topic"], reply)
+        return process_response(state, reply, stats, prompt)
+    
+    async def aopposition_node(state: Dict[str, Any]) -> Dict[str, Any]:
+        """Async variant of opposition_node."""
+        prompt = build_prompt(state)
+        reply = await ainvoke_agent(
+            llm,
+            prompt,
+            config,
+            get_token_sink("opposition", state),
+            **generation_options(config, state["current_phase"]),
+            max_words=config.max_response_length,
+        )
+        reply, stats = await areview_turn(llm, config, "opposition", state["topic"], reply)
+        return process_response(state, reply, stats, prompt)
+    
+    return RunnableLambda(timed_node(opposition_node, "opposition"), afunc=timed_node(aopposition_node, "opposition"), name="opposition")
 
 
 # ============================================================================
-# Judge Agent Node
+# Round Scorer Node
 # ============================================================================
 
-def create_judge_node(config: DebateConfig):
+def find_unscored_exchanges(state: Dict[str, Any]) -> list[tuple[str, int, list[DebateTurn]]]:
     """
-    Factory function to create a judge agent node.
+    List completed opening/rebuttal exchanges that have no scorecard yet.
     
     Args:
-        config: Debate configuration
-        
+        state: Current graph state
+    
     Returns:
-        Node function for LangGraph
+        (phase, round_number, turns) for each exchange, in debate order
     """
-    llm = create_llm_client(config)
+    scored = {card["round_number"] for card in state.get("round_scorecards") or []}
+    exchanges: Dict[int, list[DebateTurn]] = {}
     
-    def judge_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    for turn in state.get("history", []):
+        if turn.phase in ("opening", "rebuttal"):
+            exchanges.setdefault(turn.round_number, []).append(turn)
+    
+    return [
+        (turns[0].phase, round_number, turns)
+        for round_number, turns in sorted(exchanges.items())
+        if round_number not in scored and {t.role for t in turns} >= {"proponent", "opposition"}
+    ]
+
+
+# Debates whose background scorecards are kept until collected; older
+# entries (debates abandoned before judging) are cancelled and dropped
+MAX_PENDING_DEBATES = 1024
+
+# Every live RoundScorer, so debate runs can discard their jobs on exit
+_round_scorers: "weakref.WeakSet[RoundScorer]" = weakref.WeakSet()
+
+
+class RoundScorer:
+    """
+    Incremental round scorer that works off the debate's critical path.
+    
+    LangGraph runs the nodes of a step in lockstep, so a scorer node that
+    waited for its LLM call beside the proponent's turn would hold back
+    the opposition's. Instead the "score_round" node (dispatch) only
+    starts scoring each finished exchange in the background and returns
+    at once; the "collect_scores" node (collect), run just before
+    judging, waits for those scorecards and adds them to state. Exchanges
+    with no background job (e.g. a debate resumed in a new process) are
+    scored there. A failed scoring call is recorded in errors; the judge
+    then falls back to the full transcript. Jobs of a debate that ends
+    without reaching collect_scores (an error, a cancellation, a stream
+    closed early) are cancelled by discard().
+    """
+    
+    def __init__(self, config: DebateConfig, llm: Optional[ChatOpenAI] = None):
         """
-        Execute judge agent to produce final verdict.
-        
-        Analyzes complete debate history and produces structured verdict.
+        Args:
+            config: Debate configuration
+            llm: Optional shared LLM client for the scorer model
         """
-        logger.info("Judge agent executing - Producing final verdict")
-        
-        # Build complete debate context
-        prompt = build_judge_prompt(
-            topic=state["topic"],
-            history=state["history"],
+        self.config = config
+        self.scorer_config = config.model_copy(update={"model_name": config.scorer_model or config.model_name})
+        self.llm = llm or create_llm_client(self.scorer_config)
+        self._lock = threading.Lock()
+        # debate_id -> round_number -> concurrent or asyncio future of a score() update
+        self._pending: "OrderedDict[str, Dict[int, Any]]" = OrderedDict()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        _round_scorers.add(self)
+    
+    def build_prompt(self, topic: str, phase: str, round_number: int, turns: List[DebateTurn]) -> List[BaseMessage]:
+        """Build the scoring messages for one exchange."""
+        return build_messages(
+            build_round_scorer_prompt(topic, phase, round_number, turns, self.config.max_prompt_tokens),
+            use_cache_hints(self.scorer_config),
         )
+    
+    def process_response(self, phase: str, round_number: int, reply: LLMReply, prompt: Prompt) -> Dict[str, Any]:
+        """Turn a scorer response into a scorecard."""
+        notes = clean_response(reply.content)
+        proponent_score, opposition_score = extract_round_scores(notes)
+        logger.info(
+            f"Scored {phase} round {round_number}: "
+            f"proponent {proponent_score}, opposition {opposition_score}"
+        )
+        return {
+            "phase": phase,
+            "round_number": round_number,
+            "proponent_score": proponent_score,
+            "opposition_score": opposition_score,
+            "notes": notes,
+            "prompt_tokens": estimate_tokens(prompt_text(prompt)),
+            "reasoning_tokens": reply.reasoning_tokens,
+            "metrics": reply.metrics.model_dump(),
+        }
+    
+    def score(self, topic: str, phase: str, round_number: int, turns: List[DebateTurn]) -> Dict[str, Any]:
+        """Score one exchange; returns a state update with its scorecard or error."""
+        prompt = self.build_prompt(topic, phase, round_number, turns)
+        try:
+            reply = invoke_agent(
+                self.llm, prompt, self.scorer_config, **generation_options(self.scorer_config, "scoring")
+            )
+        except Exception as e:
+            logger.error(f"Round scorer failed for round {round_number}: {e}")
+            return {"round_scorecards": [], "errors": [f"score_round {round_number}: {e}"]}
+        return {"round_scorecards": [self.process_response(phase, round_number, reply, prompt)], "errors": []}
+    
+    async def ascore(self, topic: str, phase: str, round_number: int, turns: List[DebateTurn]) -> Dict[str, Any]:
+        """Async variant of score."""
+        prompt = self.build_prompt(topic, phase, round_number, turns)
+        try:
+            reply = await ainvoke_agent(
+                self.llm, prompt, self.scorer_config, **generation_options(self.scorer_config, "scoring")
+            )
+        except Exception as e:
+            logger.error(f"Round scorer failed for round {round_number}: {e}")
+            return {"round_scorecards": [], "errors": [f"score_round {round_number}: {e}"]}
+        return {"round_scorecards": [self.process_response(phase, round_number, reply, prompt)], "errors": []}
+    
+    def _undispatched(self, state: Dict[str, Any]) -> list[tuple[str, int, list[DebateTurn]]]:
+        """Unscored exchanges of the debate that have no background job yet."""
+        with self._lock:
+            jobs = self._pending.get(state["debate_id"], {})
+            return [exchange for exchange in find_unscored_exchanges(state) if exchange[1] not in jobs]
+    
+    @staticmethod
+    def _cancel(jobs: Dict[int, Any]) -> None:
+        """
+        Cancel background jobs.
         
-        # Invoke LLM (judge may need more tokens)
-        raw_response = invoke_agent(llm, prompt, config)
+        Tasks are cancelled on their own event loop. A sync job that has
+        already started cannot be interrupted; its result is dropped.
+        """
+        for job in jobs.values():
+            if isinstance(job, Future):
+                job.cancel()
+                continue
+            loop = job.get_loop()
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if loop is running:
+                job.cancel()
+            elif not loop.is_closed():
+                loop.call_soon_threadsafe(job.cancel)
+    
+    def _track(self, debate_id: str, round_number: int, job: Any) -> None:
+        """Remember a background job until the debate's scores are collected."""
+        evicted = []
+        with self._lock:
+            self._pending.setdefault(debate_id, {})[round_number] = job
+            self._pending.move_to_end(debate_id)
+            while len(self._pending) > MAX_PENDING_DEBATES:
+                evicted.append(self._pending.popitem(last=False)[1])
+        for jobs in evicted:
+            self._cancel(jobs)
+    
+    def discard(self, debate_id: str) -> None:
+        """Cancel a debate's background jobs that were never collected."""
+        with self._lock:
+            jobs = self._pending.pop(debate_id, {})
+        self._cancel(jobs)
+    
+    def dispatch(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Start scoring finished exchanges on a worker thread and return at once."""
+        for phase, round_number, turns in self._undispatched(state):
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(thread_name_prefix="round-scorer")
+                executor = self._executor
+            job = executor.submit(self.score, state["topic"], phase, round_number, turns)
+            self._track(state["debate_id"], round_number, job)
+        return {}
+    
+    async def adispatch(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Start scoring finished exchanges as event loop tasks and return at once."""
+        for phase, round_number, turns in self._undispatched(state):
+            # A fresh context keeps the task out of this node's run tree,
+            # which ends before the scoring call does
+            job = contextvars.Context().run(
+                asyncio.ensure_future, self.ascore(state["topic"], phase, round_number, turns)
+            )
+            self._track(state["debate_id"], round_number, job)
+        return {}
+    
+    def _take_jobs(self, state: Dict[str, Any]) -> Dict[int, Any]:
+        """Remove and return the debate's background jobs."""
+        with self._lock:
+            return self._pending.pop(state["debate_id"], {})
+    
+    @staticmethod
+    def _merge(update: Dict[str, Any], part: Dict[str, Any]) -> None:
+        """Add one exchange's scorecard or error to a collect update."""
+        update["round_scorecards"].extend(part["round_scorecards"])
+        update["errors"].extend(part["errors"])
+    
+    def _remaining(self, state: Dict[str, Any], update: Dict[str, Any], done: set) -> list:
+        """Unscored exchanges with no finished background job."""
+        merged = {**state, "round_scorecards": (state.get("round_scorecards") or []) + update["round_scorecards"]}
+        return [exchange for exchange in find_unscored_exchanges(merged) if exchange[1] not in done]
+    
+    def collect(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Wait for the debate's background scorecards and score any exchange without one."""
+        update: Dict[str, Any] = {"round_scorecards": [], "errors": []}
+        done = set()
+        for round_number, job in sorted(self._take_jobs(state).items()):
+            # Jobs started by an async run cannot be awaited here; those
+            # exchanges are scored again below
+            if isinstance(job, Future):
+                self._merge(update, job.result())
+                done.add(round_number)
         
-        # Clean response (don't truncate judge - we need full verdict)
-        response = clean_response(raw_response)
+        for phase, round_number, turns in self._remaining(state, update, done):
+            self._merge(update, self.score(state["topic"], phase, round_number, turns))
+        return update
+    
+    async def acollect(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Async variant of collect."""
+        update: Dict[str, Any] = {"round_scorecards": [], "errors": []}
+        done = set()
+        loop = asyncio.get_running_loop()
+        for round_number, job in sorted(self._take_jobs(state).items()):
+            if isinstance(job, Future):
+                self._merge(update, await asyncio.wrap_future(job))
+            elif job.get_loop() is loop:
+                self._merge(update, await job)
+            else:
+                # Started on another event loop; scored again below
+                job.cancel()
+                continue
+            done.add(round_number)
         
-        # Validate output format
-        is_valid, missing = validate_judge_output(response)
-        if not is_valid:
-            logger.warning(f"Judge output missing headers: {missing}")
+        for phase, round_number, turns in self._remaining(state, update, done):
+            self._merge(update, await self.ascore(state["topic"], phase, round_number, turns))
+        return update
+
+
+@contextlib.contextmanager
+def discard_round_scores(debate_id: str) -> Iterator[None]:
+    """
+    Cancel a debate's uncollected background scoring when its run ends.
+    
+    After a run that reached collect_scores there is nothing left to
+    cancel; after one that failed, was cancelled or whose stream was
+    closed early, the scoring calls stop spending LLM calls and quota.
+    
+    Args:
+        debate_id: Id of the debate being run
+    """
+    try:
+        yield
+    finally:
+        for scorer in list(_round_scorers):
+            scorer.discard(debate_id)
+
+
+def create_round_scorer_nodes(config: DebateConfig, llm: Optional[ChatOpenAI] = None) -> tuple:
+    """
+    Factory function to create the incremental round scorer nodes.
+    
+    Args:
+        config: Debate configuration
+        llm: Optional shared LLM client for the scorer model
+    
+    Returns:
+        Tuple of runnable nodes (sync and async) for LangGraph:
+        ("score_round" dispatch, "collect_scores" collect)
+    """
+    scorer = RoundScorer(config, llm)
+    dispatch = RunnableLambda(
+        timed_node(scorer.dispatch, "score_round"),
+        afunc=timed_node(scorer.adispatch, "score_round"),
+        name="score_round",
+    )
+    collect = RunnableLambda(
+        timed_node(scorer.collect, "collect_scores"),
+        afunc=timed_node(scorer.acollect, "collect_scores"),
+        name="collect_scores",
+    )
+    return dispatch, collect
+
+
+# ============================================================================
+# Judge Agent Node
+# ============================================================================
+
+def parse_judge_response(raw_response: str, output_format: str = "markdown") -> tuple[TurnStats, JudgeVerdict]:
+    """
+    Clean a judge response and parse it into a structured verdict.
+    
+    A JSON verdict is re-rendered in the markdown judge format, so the
+    transcript reads the same either way.
+    
+    Args:
+        raw_response: Raw LLM output from a judge
+        output_format: Format the judge was asked for ("markdown" or "json")
+    
+    Returns:
+        Tuple of (cleaned response stats, verdict)
+    """
+    verdict, from_json = parse_verdict(raw_response.strip(), output_format)
+    
+    # Clean and validate (don't truncate judge - we need full verdict)
+    stats = analyze_turn(render_verdict(verdict) if from_json else raw_response, required_headers=JUDGE_HEADERS)
+    if not stats.is_valid:
+        logger.warning(f"Judge output missing headers: {stats.missing_headers}")
+    if not (verdict.proponent_scores and verdict.opposition_scores):
+        logger.warning("Judge output has no parseable scores")
+    
+    return stats, verdict
+
+
+def build_verdict(verdict: JudgeVerdict, **overrides: Any) -> Dict[str, Any]:
+    """
+    Build the verdict dict stored in graph state.
+    
+    Args:
+        verdict: Parsed judge verdict
+        **overrides: Fields to replace, e.g. a panel's winner and summary
+    
+    Returns:
+        The verdict as a plain dict (scores as nested dicts)
+    """
+    return verdict.model_copy(update=overrides).model_dump()
+
+
+def build_verdict_prompt(state: Dict[str, Any], config: DebateConfig) -> str:
+    """
+    Build the prompt for a final verdict.
+    
+    With incremental judging, and every opening/rebuttal exchange scored,
+    the judge reads the round scorecards plus the closing statements.
+    Otherwise it reads the complete transcript.
+    
+    Args:
+        state: Current graph state
+        config: Debate configuration
+    
+    Returns:
+        Complete judge prompt string
+    """
+    scorecards = state.get("round_scorecards") or []
+    
+    if config.incremental_judging and scorecards:
+        if not find_unscored_exchanges(state):
+            return build_scorecard_judge_prompt(
+                topic=state["topic"],
+                scorecards=sorted(scorecards, key=lambda card: card["round_number"]),
+                closing_turns=[t for t in state["history"] if t.phase == "closing"],
+                max_prompt_tokens=config.max_prompt_tokens,
+                output_format=config.judge_output_format,
+            )
+        logger.warning("Round scorecards incomplete; judging the full transcript")
+    
+    return build_judge_prompt(
+        topic=state["topic"],
+        history=state["history"],
+        max_prompt_tokens=config.max_prompt_tokens,
+        output_format=config.judge_output_format,
+    )
+
+
+def create_judge_node(config: DebateConfig, llm: Optional[ChatOpenAI] = None):
+    """
+    Factory function to create a judge agent node.
+    
+    Args:
+        config: Debate configuration
+        llm: Optional shared LLM client (a new one is created if omitted)
+    
+    Returns:
+        Runnable node (sync and async) for LangGraph
+    """
+    llm = llm or create_llm_client(config)
+    
+    def build_prompt(state: Dict[str, Any]) -> List[BaseMessage]:
+        """Build the judge messages over the complete debate history."""
+        logger.info("Judge agent executing - Producing final verdict")
         
-        # Extract verdict details from response
-        winner = extract_winner_from_text(response) or "tie"
-        confidence = extract_confidence_from_text(response) or "medium"
+        return build_messages(build_verdict_prompt(state, config), use_cache_hints(config))
+    
+    def process_response(state: Dict[str, Any], reply: LLMReply, prompt: Prompt) -> Dict[str, Any]:
+        """Clean the judge's response and parse the verdict."""
+        stats, verdict = parse_judge_response(reply.content, config.judge_output_format)
         
         # Create turn record for history
         turn = DebateTurn(
             role="judge",
             phase="verdict",
             round_number=0,
-            content=response,
+            content=stats.content,
+            word_count=stats.word_count,
+            prompt_tokens=estimate_tokens(prompt_text(prompt)),
+            reasoning_tokens=reply.reasoning_tokens,
+            answer_tokens=reply.answer_tokens,
+            metrics=reply.metrics,
         )
         
-        logger.info(f"Judge verdict: {winner} (confidence: {confidence})")
+        logger.info(f"Judge verdict: {verdict.winner} (confidence: {verdict.confidence})")
         
         # Return state update with verdict
         return {
             "history": [turn],
             "current_phase": "complete",
-            "verdict": {
-                "winner": winner,
-                "confidence": confidence,
-                "reasoning": response,
-                "summary": f"The {winner} wins with {confidence} confidence.",
-                "proponent_scores": {},
-                "opposition_scores": {},
-                "key_arguments_proponent": [],
-                "key_arguments_opposition": [],
-                "ignored_counterarguments": [],
-            }
+            "verdict": build_verdict(verdict),
+        }
+    
+    def judge_node(state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute judge agent to produce final verdict.
+        
+        Analyzes complete debate history and produces structured verdict.
+        """
+        prompt = build_prompt(state)
+        reply = invoke_agent(
+            llm, prompt, config, get_token_sink("judge", state), **generation_options(config, "verdict")
+        )
+        return process_response(state, reply, prompt)
+    
+    async def ajudge_node(state: Dict[str, Any]) -> Dict[str, Any]:
+        """Async variant of judge_node."""
+        prompt = build_prompt(state)
+        reply = await ainvoke_agent(
+            llm, prompt, config, get_token_sink("judge", state), **generation_options(config, "verdict")
+        )
+        return process_response(state, reply, prompt)
+    
+    return RunnableLambda(timed_node(judge_node, "judge"), afunc=timed_node(ajudge_node, "judge"), name="judge")
+
+
+# ============================================================================
+# Judge Panel Nodes
+# ============================================================================
+
+CONFIDENCE_LEVELS = ("low", "medium", "high")
+
+
+def convene_panel_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Transition to the verdict phase; the panel judges fan out from here."""
+    logger.info("Convening judge panel")
+    return {
+        "current_phase": "verdict",
+    }
+
+
+def create_panel_judge_node(
+    config: DebateConfig,
+    judge_index: int,
+    model_name: str,
+    llm: Optional[ChatOpenAI] = None,
+):
+    """
+    Factory function to create one judge of a judge panel.
+    
+    Panel judges run as parallel branches. Each casts a vote into the
+    panel_verdicts state channel; aggregate_panel_node tallies them. A judge
+    that fails records the error instead of failing the whole debate.
+    
+    Args:
+        config: Debate configuration
+        judge_index: 1-based position on the panel (used in the node name)
+        model_name: Model this judge runs on
+        llm: Optional shared LLM client for model_name
+    
+    Returns:
+        Runnable node (sync and async) for LangGraph
+    """
+    judge_config = config.model_copy(update={"model_name": model_name})
+    llm = llm or create_llm_client(judge_config)
+    name = f"judge_{judge_index}"
+    
+    def process_response(reply: LLMReply, prompt: Prompt) -> Dict[str, Any]:
+        """Turn a panel judge's response into its vote."""
+        stats, verdict = parse_judge_response(reply.content, config.judge_output_format)
+        logger.info(f"Panel {name} ({model_name}) votes {verdict.winner} (confidence: {verdict.confidence})")
+        return {
+            "panel_verdicts": [{
+                "judge": name,
+                "model": model_name,
+                "winner": verdict.winner,
+                "confidence": verdict.confidence,
+                "reasoning": stats.content,
+                "verdict": build_verdict(verdict),
+                "prompt_tokens": estimate_tokens(prompt_text(prompt)),
+                "reasoning_tokens": reply.reasoning_tokens,
+                "metrics": reply.metrics.model_dump(),
+            }]
         }
     
-    return judge_node
+    def process_error(error: Exception) -> Dict[str, Any]:
+        """Record a failed judge so the panel can still reach a verdict."""
+        logger.error(f"Panel {name} ({model_name}) failed: {error}")
+        return {
+            "panel_verdicts": [{"judge": name, "model": model_name, "error": str(error)}],
+            "errors": [f"{name} ({model_name}): {error}"],
+        }
+    
+    def panel_judge_node(state: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute one panel judge over the complete debate history."""
+        prompt = build_messages(build_verdict_prompt(state, config), use_cache_hints(judge_config))
+        # Parallel judges would interleave in the token stream, so none is streamed
+        try:
+            reply = invoke_agent(
+                llm, prompt, judge_config, **generation_options(judge_config, "verdict")
+            )
+        except Exception as e:
+            return process_error(e)
+        return process_response(reply, prompt)
+    
+    async def apanel_judge_node(state: Dict[str, Any]) -> Dict[str, Any]:
+        """Async variant of panel_judge_node."""
+        prompt = build_messages(build_verdict_prompt(state, config), use_cache_hints(judge_config))
+        try:
+            reply = await ainvoke_agent(
+                llm, prompt, judge_config, **generation_options(judge_config, "verdict")
+            )
+        except Exception as e:
+            return process_error(e)
+        return process_response(reply, prompt)
+    
+    return RunnableLambda(timed_node(panel_judge_node, name), afunc=timed_node(apanel_judge_node, name), name=name)
+
+
+def tally_votes(votes: list[Dict[str, Any]]) -> tuple[str, str, Dict[str, int]]:
+    """
+    Aggregate panel votes into a single decision.
+    
+    The side with the most votes wins; a tie for the most votes is a tie.
+    Confidence is the median confidence of the winning voters, lowered one
+    level when the panel was split.
+    
+    Args:
+        votes: Successful panel votes with winner and confidence
+    
+    Returns:
+        Tuple of (winner, confidence, vote counts per side)
+    """
+    tally = {"proponent": 0, "opposition": 0, "tie": 0}
+    for vote in votes:
+        tally[vote["winner"]] += 1
+    
+    top = max(tally.values())
+    leaders = [side for side, count in tally.items() if count == top]
+    winner = leaders[0] if len(leaders) == 1 else "tie"
+    
+    levels = sorted(
+        CONFIDENCE_LEVELS.index(vote["confidence"])
+        for vote in votes
+        if vote["winner"] == winner
+    ) or [0]
+    level = levels[(len(levels) - 1) // 2]
+    if top < len(votes):
+        level = max(level - 1, 0)
+    
+    return winner, CONFIDENCE_LEVELS[level], tally
+
+
+def aggregate_panel_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Fan-in node: combine the panel's votes into the final verdict.
+    
+    Raises:
+        RuntimeError: If every judge on the panel failed
+    """
+    ballots = state.get("panel_verdicts", [])
+    votes = [ballot for ballot in ballots if "error" not in ballot]
+    if not votes:
+        raise RuntimeError(f"All {len(ballots)} panel judges failed")
+    
+    winner, confidence, tally = tally_votes(votes)
+    score = f"{tally['proponent']}-{tally['opposition']}"
+    if tally["tie"]:
+        score += f"-{tally['tie']}"
+    
+    # Lead with a judge who agreed with the panel, then list every ballot;
+    # the lead judge's scores and analysis become the panel verdict's
+    lead = next((vote for vote in votes if vote["winner"] == winner), votes[0])
+    lines = [
+        "## PANEL VOTE",
+        f"Winner: {winner} ({score}), confidence: {confidence}",
+        "",
+    ]
+    for ballot in ballots:
+        if "error" in ballot:
+            lines.append(f"- {ballot['judge']} ({ballot['model']}): failed")
+        else:
+            lines.append(
+                f"- {ballot['judge']} ({ballot['model']}): "
+                f"{ballot['winner']} ({ballot['confidence']})"
+            )
+    content = "\n".join(lines) + "\n\n" + lead["reasoning"]
+    
+    turn = DebateTurn(
+        role="judge",
+        phase="verdict",
+        round_number=0,
+        content=content,
+        prompt_tokens=sum(vote["prompt_tokens"] for vote in votes),
+        reasoning_tokens=sum(vote.get("reasoning_tokens", 0) for vote in votes),
+        metrics=merge_metrics(
+            [TurnMetrics.model_validate(vote["metrics"]) for vote in votes if "metrics" in vote],
+            parallel=True,
+        ),
+    )
+    
+    logger.info(f"Panel verdict: {winner} {score} (confidence: {confidence})")
+    
+    return {
+        "history": [turn],
+        "current_phase": "complete",
+        "verdict": build_verdict(
+            JudgeVerdict.model_validate(lead["verdict"]),
+            winner=winner,
+            confidence=confidence,
+            summary=(
+                f"The panel rules a tie ({score}) with {confidence} confidence."
+                if winner == "tie"
+                else f"The {winner} wins the panel vote {score} with {confidence} confidence."
+            ),
+        ),
+    }
 
 
 # ============================================================================
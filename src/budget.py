@@ -0,0 +1,218 @@
+"""
+Prompt token budgeting for the Multi-Agent Debate System.
+
+Keeps debater and judge prompts under DebateConfig.max_prompt_tokens by
+shrinking the variable sections (opponent arguments, prior turns, the
+judge transcript) while the fixed instructions stay intact:
+- Sections share the remaining budget max-min fairly, so short sections
+  keep their full text and the slack flows to longer ones
+- A section over its share is first summarized extractively (headers plus
+  as many lead sentences per section as fit), then trimmed at a word boundary
+- Turns whose share falls below a useful size are elided, oldest first
+
+Token counts use the same fast local estimate as rate limiting.
+"""
+
+import re
+from typing import List, Optional, Sequence
+
+from .models import DebateTurn
+from .utils import estimate_tokens
+
+# A turn squeezed below this many tokens says nothing useful; elide it instead
+MIN_TURN_TOKENS = 40
+
+ELISION_MARKER = "[...]"
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+# ============================================================================
+# Budget Allocation
+# ============================================================================
+
+def allocate_budget(budget: int, sizes: Sequence[int]) -> List[int]:
+    """
+    Split a token budget across sections max-min fairly.
+    
+    Sections smaller than their equal share keep their full size and the
+    unused share is redistributed among the larger ones.
+    
+    Args:
+        budget: Tokens available for all sections together
+        sizes: Estimated tokens each section needs in full
+    
+    Returns:
+        Tokens granted to each section, in input order
+    """
+    grants = [0] * len(sizes)
+    remaining = max(budget, 0)
+    pending = sorted(range(len(sizes)), key=lambda i: sizes[i])
+    
+    while pending:
+        share = remaining // len(pending)
+        index = pending[0]
+        if sizes[index] > share:
+            # Everyone left needs at least the equal share
+            for index in pending:
+                grants[index] = share
+            break
+        grants[index] = sizes[index]
+        remaining -= sizes[index]
+        pending.pop(0)
+    
+    return grants
+
+
+# ============================================================================
+# Text Shrinking
+# ============================================================================
+
+def trim_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Cut text to at most max_tokens at a word boundary.
+    
+    Args:
+        text: Text to trim
+        max_tokens: Token ceiling
+    
+    Returns:
+        The text unchanged if it fits, otherwise its head plus an elision marker
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    
+    max_chars = max(max_tokens * 4 - len(ELISION_MARKER) - 1, 0)
+    head = text[:max_chars]
+    if " " in head:
+        head = head[:head.rfind(" ")]
+    return f"{head.rstrip()} {ELISION_MARKER}"
+
+
+def summarize_markdown(text: str, sentences_per_section: int = 1) -> str:
+    """
+    Extractively summarize a structured agent response.
+    
+    Keeps every markdown header and the lead sentences of the text under it,
+    which preserves the argument skeleton the agents are prompted to produce.
+    
+    Args:
+        text: Agent response with ## headers
+        sentences_per_section: Sentences kept under each header
+    
+    Returns:
+        Condensed text
+    """
+    lines = []
+    budget = sentences_per_section
+    
+    for line in text.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("#"):
+            lines.append(stripped)
+            budget = sentences_per_section
+        elif stripped and budget > 0:
+            sentences = _SENTENCE_END.split(stripped)[:budget]
+            lines.append(" ".join(sentences))
+            budget -= len(sentences)
+    
+    return "\n".join(lines)
+
+
+def fit_text(text: str, max_tokens: int) -> str:
+    """
+    Shrink text to fit max_tokens, summarizing before trimming.
+    
+    Keeps as many lead sentences per section as fit, then trims the
+    one-sentence summary if even that is too long.
+    
+    Args:
+        text: Text to fit
+        max_tokens: Token ceiling
+    
+    Returns:
+        Text whose estimated size is at most max_tokens
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    
+    most = max(len(_SENTENCE_END.split(text)) - 1, 1)
+    low, high = 1, most
+    best = None
+    while low <= high:
+        middle = (low + high) // 2
+        summary = summarize_markdown(text, middle)
+        if estimate_tokens(summary) <= max_tokens:
+            best, low = summary, middle + 1
+        else:
+            high = middle - 1
+    
+    if best is not None:
+        return best
+    return trim_to_tokens(summarize_markdown(text), max_tokens)
+
+
+def fit_sections(texts: Sequence[str], budget: int) -> List[str]:
+    """
+    Fit several sections into a shared budget.
+    
+    Args:
+        texts: Section texts, in prompt order
+        budget: Tokens available for all of them
+    
+    Returns:
+        Fitted section texts, in input order
+    """
+    grants = allocate_budget(budget, [estimate_tokens(text) for text in texts])
+    return [fit_text(text, grant) for text, grant in zip(texts, grants)]
+
+
+def fit_turns(
+    turns: Sequence[DebateTurn],
+    budget: int,
+    render,
+) -> List[str]:
+    """
+    Render debate turns into a shared budget, eliding the oldest if needed.
+    
+    Args:
+        turns: Turns in debate order
+        budget: Tokens available for the rendered turns
+        render: Callable (turn, content) -> rendered section text
+    
+    Returns:
+        Rendered sections in debate order, led by a note if turns were elided
+    """
+    # Drop oldest turns until everyone left can get a useful share; only
+    # the kept tail is copied, so long histories cost no extra memory
+    start = len(turns) - min(len(turns), max(budget // MIN_TURN_TOKENS, 1))
+    
+    stubs = [f"{ELISION_MARKER} {start} earlier turns elided\n"] if start else []
+    budget -= sum(estimate_tokens(stub) for stub in stubs)
+    
+    kept = turns[start:]
+    overhead = [estimate_tokens(render(turn, "")) for turn in kept]
+    grants = allocate_budget(
+        budget - sum(overhead),
+        [estimate_tokens(turn.content) for turn in kept],
+    )
+    
+    return stubs + [
+        render(turn, fit_text(turn.content, grant)) for turn, grant in zip(kept, grants)
+    ]
+
+
+def remaining_budget(max_prompt_tokens: Optional[int], *fixed_parts: str) -> Optional[int]:
+    """
+    Tokens left for variable sections after the fixed prompt parts.
+    
+    Args:
+        max_prompt_tokens: Prompt ceiling (None = unlimited)
+        fixed_parts: Prompt parts that are always included verbatim
+    
+    Returns:
+        Remaining tokens, or None when there is no ceiling
+    """
+    if max_prompt_tokens is None:
+        return None
+    return max(max_prompt_tokens - sum(estimate_tokens(part) for part in fixed_parts), 0)
@@ -0,0 +1,279 @@
+"""
+LLM response cache for the Multi-Agent Debate System.
+
+Two tiers sit in front of the LLM call:
+- An in-memory LRU for repeated prompts within one process
+- An optional on-disk SQLite store that survives restarts
+
+Entries are keyed by a fingerprint of (model, temperature, prompt and the
+request options that shape the response: max_tokens, reasoning,
+response_format, early-stop word budget), expire after an optional TTL,
+and are evicted least-recently-used once a tier is full. The cache is
+opt-in via DebateConfig.cache_enabled.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from .config import DebateConfig
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Cache Keys
+# ============================================================================
+
+def make_cache_key(
+    model: str,
+    temperature: float,
+    prompt: str,
+    options: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    Fingerprint an LLM request.
+    
+    Args:
+        model: Model identifier
+        temperature: Sampling temperature
+        prompt: Complete prompt string
+        options: Other request settings that change the response (token
+            cap, reasoning, response format, early-stop word budget)
+    
+    Returns:
+        Hex digest identifying the request
+    """
+    payload = json.dumps([model, temperature, prompt, options or {}], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# ============================================================================
+# Response Cache
+# ============================================================================
+
+class ResponseCache:
+    """
+    Two-tier (memory LRU + SQLite) cache of LLM responses.
+    
+    Thread-safe; one instance is shared by every agent using the same
+    cache path.
+    """
+    
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_entries: int = 256,
+        max_disk_entries: int = 10_000,
+        ttl_seconds: Optional[float] = None,
+    ):
+        """
+        Args:
+            path: SQLite file for the disk tier (memory only if None)
+            max_entries: Capacity of the in-memory LRU tier
+            max_disk_entries: Capacity of the disk tier
+            ttl_seconds: Entry lifetime in seconds (no expiry if None)
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.ttl_seconds = ttl_seconds
+        
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._counters = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+        
+        self._db: Optional[sqlite3.Connection] = None
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)"
+            )
+            self._db.commit()
+    
+    def _expired(self, created_at: float, now: float) -> bool:
+        """Check whether an entry created at created_at has outlived the TTL."""
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+    
+    def _remember(self, key: str, value: str, created_at: float) -> None:
+        """Insert into the memory tier, evicting the LRU entry if full. Must hold _lock."""
+        self._memory[key] = (value, created_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._counters["evictions"] += 1
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+        
+        Args:
+            key: Fingerprint from make_cache_key
+        
+        Returns:
+            Cached response text, or None on a miss
+        """
+        now = time.time()
+        
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                value, created_at = entry
+                if not self._expired(created_at, now):
+                    self._memory.move_to_end(key)
+                    self._counters["memory_hits"] += 1
+                    return value
+                del self._memory[key]
+            
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    value, created_at = row
+                    if not self._expired(created_at, now):
+                        self._db.execute(
+                            "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+                        )
+                        self._db.commit()
+                        self._remember(key, value, created_at)
+                        self._counters["disk_hits"] += 1
+                        return value
+                    self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._db.commit()
+            
+            self._counters["misses"] += 1
+            return None
+    
+    def set(self, key: str, value: str) -> None:
+        """
+        Store a response in both tiers.
+        
+        Args:
+            key: Fingerprint from make_cache_key
+            value: Response text to cache
+        """
+        now = time.time()
+        
+        with self._lock:
+            self._remember(key, value, now)
+            
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, created_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, value, now, now),
+                )
+                (count,) = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()
+                if count > self.max_disk_entries:
+                    overflow = count - self.max_disk_entries
+                    self._db.execute(
+                        "DELETE FROM responses WHERE key IN ("
+                        "SELECT key FROM responses ORDER BY accessed_at LIMIT ?)",
+                        (overflow,),
+                    )
+                    self._counters["evictions"] += overflow
+                self._db.commit()
+    
+    async def aget(self, key: str) -> Optional[str]:
+        """
+        Async version of get; the disk tier is read in a worker thread.
+        
+        Args:
+            key: Fingerprint from make_cache_key
+        
+        Returns:
+            Cached response text, or None on a miss
+        """
+        if self._db is None:
+            return self.get(key)
+        return await asyncio.to_thread(self.get, key)
+    
+    async def aset(self, key: str, value: str) -> None:
+        """
+        Async version of set; the disk tier is written in a worker thread.
+        
+        Args:
+            key: Fingerprint from make_cache_key
+            value: Response text to cache
+        """
+        if self._db is None:
+            self.set(key, value)
+        else:
+            await asyncio.to_thread(self.set, key, value)
+    
+    def clear(self) -> None:
+        """Remove every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+                self._db.commit()
+    
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss/eviction counters and current memory tier size."""
+        with self._lock:
+            return {**self._counters, "memory_entries": len(self._memory)}
+    
+    def close(self) -> None:
+        """Close the disk tier."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+# ============================================================================
+# Shared Instances
+# ============================================================================
+
+_caches: Dict[Tuple, ResponseCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_response_cache(config: DebateConfig) -> Optional[ResponseCache]:
+    """
+    Get the shared response cache for a configuration.
+    
+    Args:
+        config: Debate configuration with cache settings
+    
+    Returns:
+        ResponseCache instance, or None if caching is disabled
+    """
+    if not config.cache_enabled:
+        return None
+    
+    key = (
+        config.cache_path,
+        config.cache_max_entries,
+        config.cache_max_disk_entries,
+        config.cache_ttl_seconds,
+    )
+    
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = ResponseCache(
+                path=config.cache_path,
+                max_entries=config.cache_max_entries,
+                max_disk_entries=config.cache_max_disk_entries,
+                ttl_seconds=config.cache_ttl_seconds,
+            )
+            _caches[key] = cache
+        return cache
@@ -6,7 +6,7 @@ Uses Pydantic for validation and type safety.
 """
 
 import os
-from typing import Optional
+from typing import Dict, List, Literal, Optional, Tuple
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
 
@@ -14,6 +14,31 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+def parse_model_prices(value: str) -> Dict[str, Tuple[float, float]]:
+    """
+    Parse MODEL_PRICES, e.g. "openai/gpt-4o=2.5/10,anthropic/claude-3.5-sonnet=3/15".
+    
+    Args:
+        value: Comma-separated model=prompt/completion entries (USD per million tokens)
+    
+    Returns:
+        Model name -> (prompt price, completion price)
+    
+    Raises:
+        ValueError: If an entry is malformed
+    """
+    prices = {}
+    for entry in value.split(","):
+        if not entry.strip():
+            continue
+        model, _, price = entry.rpartition("=")
+        prompt_price, _, completion_price = price.partition("/")
+        if not model.strip() or not completion_price:
+            raise ValueError(f"Invalid MODEL_PRICES entry '{entry.strip()}' (expected model=prompt/completion)")
+        prices[model.strip()] = (float(prompt_price), float(completion_price))
+    return prices
+
+
 class DebateConfig(BaseModel):
     """
     Configuration for the debate system.
@@ -30,6 +55,10 @@ class DebateConfig(BaseModel):
         default="https://openrouter.ai/api/v1",
         description="OpenRouter API base URL"
     )
+    mock_llm_url: Optional[str] = Field(
+        default_factory=lambda: os.getenv("MOCK_LLM_URL") or None,
+        description="Send every LLM call to a local mock server (src.mock_server) instead of OpenRouter"
+    )
     
     # Model Configuration
     model_name: str = Field(
@@ -42,6 +71,48 @@ class DebateConfig(BaseModel):
         le=2.0,
         description="Model temperature for response generation"
     )
+    judge_models: List[str] = Field(
+        default_factory=lambda: [
+            model.strip() for model in os.getenv("JUDGE_MODELS", "").split(",") if model.strip()
+        ],
+        description="Models for a parallel judge panel (empty = single judge on model_name)"
+    )
+    incremental_judging: bool = Field(
+        default_factory=lambda: os.getenv("INCREMENTAL_JUDGING", "false").lower() in ("1", "true", "yes"),
+        description="Score each exchange in the background; the judge aggregates the scorecards"
+    )
+    scorer_model: Optional[str] = Field(
+        default_factory=lambda: os.getenv("SCORER_MODEL") or None,
+        description="Lightweight model for round scoring (None = model_name)"
+    )
+    model_prices: Dict[str, Tuple[float, float]] = Field(
+        default_factory=lambda: parse_model_prices(os.getenv("MODEL_PRICES", "")),
+        description="USD per million (prompt, completion) tokens by model, for cost estimates (':free' models cost nothing)"
+    )
+    judge_output_format: Literal["markdown", "json"] = Field(
+        default_factory=lambda: os.getenv("JUDGE_OUTPUT_FORMAT", "markdown"),
+        description="Judges answer in markdown sections or as a JSON object (requested in JSON mode)"
+    )
+    
+    # Reasoning Configuration (ignored by models without reasoning)
+    debater_reasoning_effort: Optional[Literal["minimal", "low", "medium", "high"]] = Field(
+        default_factory=lambda: os.getenv("DEBATER_REASONING_EFFORT") or None,
+        description="Reasoning effort for proponent and opposition (None = model default)"
+    )
+    debater_reasoning_max_tokens: Optional[int] = Field(
+        default_factory=lambda: int(os.getenv("DEBATER_REASONING_MAX_TOKENS", "0")) or None,
+        ge=1,
+        description="Reasoning token budget for debaters; overrides the effort level"
+    )
+    judge_reasoning_effort: Optional[Literal["minimal", "low", "medium", "high"]] = Field(
+        default_factory=lambda: os.getenv("JUDGE_REASONING_EFFORT") or None,
+        description="Reasoning effort for judges and the round scorer (None = model default)"
+    )
+    judge_reasoning_max_tokens: Optional[int] = Field(
+        default_factory=lambda: int(os.getenv("JUDGE_REASONING_MAX_TOKENS", "0")) or None,
+        ge=1,
+        description="Reasoning token budget for judges; overrides the effort level"
+    )
     
     # Debate Parameters
     max_rounds: int = Field(
@@ -56,6 +127,41 @@ class DebateConfig(BaseModel):
         le=2000,
         description="Maximum words per agent response"
     )
+    stop_grace_words: int = Field(
+        default=30,
+        ge=0,
+        le=200,
+        description="Words a debater may run past max_response_length to finish a sentence before generation is cancelled"
+    )
+    repair_sections: bool = Field(
+        default_factory=lambda: os.getenv("REPAIR_SECTIONS", "false").lower() in ("1", "true", "yes"),
+        description="Ask for a debater's missing sections in a small follow-up call and splice them in"
+    )
+    repair_max_tokens: int = Field(
+        default=200,
+        ge=20,
+        le=2000,
+        description="Completion token budget for one turn's section repair"
+    )
+    max_prompt_tokens: Optional[int] = Field(
+        default_factory=lambda: int(os.getenv("MAX_PROMPT_TOKENS", "0")) or None,
+        ge=1000,
+        description="Prompt ceiling; history is condensed to fit (None = unlimited)"
+    )
+    memory_enabled: bool = Field(
+        default_factory=lambda: os.getenv("MEMORY_ENABLED", "false").lower() in ("1", "true", "yes"),
+        description="Give debaters a rolling summary of their own arguments instead of raw snippets"
+    )
+    prompt_cache_hints: Optional[bool] = Field(
+        default=None,
+        description="Add cache_control breakpoints to prompts (None = auto-detect from model_name)"
+    )
+    memory_max_tokens: int = Field(
+        default=300,
+        ge=50,
+        le=4000,
+        description="Ceiling for each debater's rolling memory"
+    )
     
     # Retry Configuration
     max_retries: int = Field(
@@ -70,11 +176,105 @@ class DebateConfig(BaseModel):
         le=10.0,
         description="Base delay between retries (seconds)"
     )
+    retry_max_delay: float = Field(
+        default=30.0,
+        ge=1.0,
+        le=300.0,
+        description="Cap on the backoff delay, Retry-After hints included (seconds)"
+    )
+    circuit_breaker_threshold: int = Field(
+        default_factory=lambda: int(os.getenv("CIRCUIT_BREAKER_THRESHOLD", "5")),
+        ge=0,
+        description="Consecutive failures that open a model's circuit breaker (0 disables)"
+    )
+    circuit_breaker_cooldown: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds an open circuit fails fast before allowing a trial call"
+    )
+    
+    # Response Cache Configuration
+    cache_enabled: bool = Field(
+        default_factory=lambda: os.getenv("CACHE_ENABLED", "false").lower() in ("1", "true", "yes"),
+        description="Serve repeated identical prompts from the response cache"
+    )
+    cache_path: Optional[str] = Field(
+        default_factory=lambda: os.getenv("CACHE_PATH", ".debate_cache/responses.sqlite"),
+        description="SQLite file for the on-disk cache tier (None for memory only)"
+    )
+    cache_max_entries: int = Field(
+        default=256,
+        ge=1,
+        description="Maximum responses held in the in-memory LRU tier"
+    )
+    cache_max_disk_entries: int = Field(
+        default=10_000,
+        ge=1,
+        description="Maximum responses held in the on-disk tier"
+    )
+    cache_ttl_seconds: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Lifetime of cached responses in seconds (None = never expire)"
+    )
+    verdict_cache_path: Optional[str] = Field(
+        default_factory=lambda: os.getenv("VERDICT_CACHE_PATH", ".debate_cache/verdicts.sqlite"),
+        description="SQLite file caching re-judged verdicts (None for memory only)"
+    )
+    verdict_cache_max_entries: int = Field(
+        default=100_000,
+        ge=1,
+        description="Maximum verdicts held in the verdict cache"
+    )
+    
+    # Checkpoint Configuration
+    checkpoint_enabled: bool = Field(
+        default_factory=lambda: os.getenv("CHECKPOINT_ENABLED", "false").lower() in ("1", "true", "yes"),
+        description="Persist graph state after every node so debates can be resumed"
+    )
+    checkpoint_path: str = Field(
+        default_factory=lambda: os.getenv("CHECKPOINT_PATH", ".debate_cache/checkpoints.sqlite"),
+        description="SQLite file holding debate checkpoints"
+    )
+    
+    # Rate Limit Configuration
+    rate_limit_requests_per_minute: Optional[int] = Field(
+        default_factory=lambda: int(os.getenv("RATE_LIMIT_RPM", "0")) or None,
+        ge=1,
+        description="Shared request quota across all agents and debates (None = unlimited)"
+    )
+    rate_limit_tokens_per_minute: Optional[int] = Field(
+        default_factory=lambda: int(os.getenv("RATE_LIMIT_TPM", "0")) or None,
+        ge=1,
+        description="Shared token quota across all agents and debates (None = unlimited)"
+    )
+    rate_limit_path: Optional[str] = Field(
+        default_factory=lambda: os.getenv("RATE_LIMIT_PATH") or None,
+        description="SQLite file to share the quota across processes (None = this process only)"
+    )
+    
+    # Metrics Configuration
+    metrics_port: Optional[int] = Field(
+        default_factory=lambda: int(os.getenv("METRICS_PORT")) if os.getenv("METRICS_PORT") else None,
+        ge=0,
+        le=65535,
+        description="Collect metrics and serve them at http://<host>:<port>/metrics (None = off)"
+    )
+    metrics_host: str = Field(
+        default_factory=lambda: os.getenv("METRICS_HOST", "127.0.0.1"),
+        description="Interface the metrics endpoint binds to (0.0.0.0 exposes it on every interface)"
+    )
     
     def validate_api_key(self) -> bool:
-        """Check if API key is configured."""
+        """Check if API key is configured (the mock server needs none)."""
+        if self.mock_llm_url:
+            return True
         return bool(self.openrouter_api_key and self.openrouter_api_key != "your_openrouter_api_key_here")
     
+    def llm_base_url(self) -> str:
+        """Base URL LLM calls go to: the mock server if set, else OpenRouter."""
+        return self.mock_llm_url or self.openrouter_base_url
+    
     class Config:
         """Pydantic model configuration."""
         validate_assignment = True
@@ -87,7 +287,7 @@ def get_default_config() -> DebateConfig:
     
     Returns:
         DebateConfig: Configured instance ready for use
-        
+    
     Raises:
         ValueError: If required API key is not set
     """
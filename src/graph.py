@@ -8,24 +8,36 @@ Defines the debate graph with:
 - Deterministic flow control
 """
 
+import asyncio
 import logging
-from typing import Annotated, Any, Dict, List, Sequence
+import os
+import sqlite3
+import uuid
+from typing import Annotated, Any, AsyncIterator, Dict, Iterator, List, Sequence
 from typing_extensions import TypedDict
 import operator
 
 from langgraph.graph import StateGraph, END
-from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 
 from .config import DebateConfig, get_default_config
-from .models import DebateTurn, JudgeVerdict
+from .models import DebateStreamEvent, DebateTurn, JudgeVerdict
 from .agents import (
     create_proponent_node,
     create_opposition_node,
     create_judge_node,
+    create_round_scorer_nodes,
+    discard_round_scores,
+    create_panel_judge_node,
+    convene_panel_node,
+    aggregate_panel_node,
     start_rebuttal_node,
     next_round_node,
     start_closing_node,
 )
+from .registry import checkpoint_lease, get_debate_graph, get_llm_client
+from .metrics import track_debate
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +46,11 @@ logger = logging.getLogger(__name__)
 # Graph State Definition
 # ============================================================================
 
+def merge_memory(current: Dict[str, str], update: Dict[str, str]) -> Dict[str, str]:
+    """Reducer for the memory channel: each update replaces only its roles."""
+    return {**(current or {}), **(update or {})}
+
+
 class GraphState(TypedDict):
     """
     LangGraph state schema for the debate.
@@ -42,6 +59,7 @@ class GraphState(TypedDict):
     ensuring history is never overwritten, only appended.
     """
     # Configuration (set once at start)
+    debate_id: str
     topic: str
     max_rounds: int
     
@@ -52,6 +70,15 @@ class GraphState(TypedDict):
     # Debate history - uses ADD reducer for immutability
     history: Annotated[List[DebateTurn], operator.add]
     
+    # Rolling memory per debater role - merged key by key
+    memory: Annotated[Dict[str, str], merge_memory]
+    
+    # Per-exchange scorecards from the background round scorer
+    round_scorecards: Annotated[List[Dict[str, Any]], operator.add]
+    
+    # Panel votes (one per panel judge, merged from parallel branches)
+    panel_verdicts: Annotated[List[Dict[str, Any]], operator.add]
+    
     # Final verdict (set by judge)
     verdict: Dict[str, Any] | None
     
@@ -111,17 +138,83 @@ def route_after_phase_change(state: GraphState) -> str:
     return "proponent"
 
 
+# ============================================================================
+# Checkpointing
+# ============================================================================
+
+def _checkpoint_serde() -> JsonPlusSerializer:
+    """Serializer that allows the state's pydantic models to round-trip."""
+    try:
+        return JsonPlusSerializer(
+            allowed_msgpack_modules=[(DebateTurn.__module__, DebateTurn.__name__)]
+        )
+    except TypeError:
+        # Older langgraph versions have no allow-list and accept any type
+        return JsonPlusSerializer()
+
+
+def create_checkpointer(config: DebateConfig) -> BaseCheckpointSaver:
+    """
+    Open the SQLite checkpointer at config.checkpoint_path.
+    
+    Returns an AsyncSqliteSaver when called inside a running event loop
+    (the async graph path needs it) and a SqliteSaver otherwise. The async
+    saver's connection is closed when the async runs using it finish (see
+    registry.checkpoint_lease).
+    
+    Args:
+        config: Debate configuration with checkpoint settings
+    
+    Returns:
+        Checkpoint saver bound to the SQLite file
+    
+    Raises:
+        ImportError: If langgraph-checkpoint-sqlite is not installed
+    """
+    try:
+        from langgraph.checkpoint.sqlite import SqliteSaver
+        from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+        import aiosqlite
+    except ImportError as e:
+        raise ImportError(
+            "Checkpointing requires langgraph-checkpoint-sqlite. "
+            "Install it with: pip install langgraph-checkpoint-sqlite"
+        ) from e
+    
+    directory = os.path.dirname(config.checkpoint_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return SqliteSaver(
+            sqlite3.connect(config.checkpoint_path, check_same_thread=False),
+            serde=_checkpoint_serde(),
+        )
+    
+    return AsyncSqliteSaver(aiosqlite.connect(config.checkpoint_path), serde=_checkpoint_serde())
+
+
 # ============================================================================
 # Graph Construction
 # ============================================================================
 
-def create_debate_graph(config: DebateConfig | None = None) -> StateGraph:
+def create_debate_graph(
+    config: DebateConfig | None = None,
+    checkpointer: BaseCheckpointSaver | None = None,
+) -> StateGraph:
     """
     Create and compile the debate graph.
     
+    Prefer registry.get_debate_graph() in long-lived processes; it caches
+    the compiled result per configuration.
+    
     Args:
         config: Optional debate configuration (uses defaults if not provided)
-        
+        checkpointer: Optional saver; state is persisted after every node
+            so an interrupted debate can be resumed by its debate_id
+    
     Returns:
         Compiled LangGraph StateGraph ready for execution
     
@@ -159,6 +252,21 @@ def create_debate_graph(config: DebateConfig | None = None) -> StateGraph:
           │
           ▼
         END
+    
+    With config.judge_models set, the judge step becomes a panel:
+        
+        convene_panel ──┬── judge_1 ──┐
+                        ├── judge_2 ──┼──► judge (vote aggregation)
+                        └── judge_K ──┘
+    
+    With config.incremental_judging, every phase transition also fans out
+    to score_round, which starts scoring the exchange that just ended in
+    the background and returns at once, so the debate never waits for it.
+    collect_scores, between the closing statements and the judge, gathers
+    the scorecards; the judge then reads them and the closing statements
+    instead of the whole transcript:
+        
+        opposition (closing) ──► collect_scores ──► judge (or convene_panel)
     """
     if config is None:
         config = get_default_config()
@@ -172,10 +280,31 @@ def create_debate_graph(config: DebateConfig | None = None) -> StateGraph:
     # Register Nodes
     # =========================================
     
-    # Agent nodes
-    graph.add_node("proponent", create_proponent_node(config))
-    graph.add_node("opposition", create_opposition_node(config))
-    graph.add_node("judge", create_judge_node(config))
+    # Agent nodes (share one client and its connection pool)
+    llm = get_llm_client(config)
+    graph.add_node("proponent", create_proponent_node(config, llm))
+    graph.add_node("opposition", create_opposition_node(config, llm))
+    
+    # Judge: a single agent, or a panel fanning out in parallel and
+    # fanning back in to a vote-aggregating "judge" node
+    panel = []
+    if config.judge_models:
+        graph.add_node("convene_panel", convene_panel_node)
+        for index, model_name in enumerate(config.judge_models, start=1):
+            judge_config = config.model_copy(update={"model_name": model_name})
+            node = create_panel_judge_node(config, index, model_name, get_llm_client(judge_config))
+            graph.add_node(node.name, node)
+            panel.append(node.name)
+        graph.add_node("judge", aggregate_panel_node)
+    else:
+        graph.add_node("judge", create_judge_node(config, llm))
+    
+    # Background round scorer (incremental judging): dispatch and collect
+    if config.incremental_judging:
+        scorer_config = config.model_copy(update={"model_name": config.scorer_model or config.model_name})
+        dispatch, collect = create_round_scorer_nodes(config, get_llm_client(scorer_config))
+        graph.add_node("score_round", dispatch)
+        graph.add_node("collect_scores", collect)
     
     # Phase transition nodes
     graph.add_node("start_rebuttal", start_rebuttal_node)
@@ -192,7 +321,9 @@ def create_debate_graph(config: DebateConfig | None = None) -> StateGraph:
     # Proponent always goes to opposition
     graph.add_edge("proponent", "opposition")
     
-    # Opposition routes based on phase
+    # Opposition routes based on phase; judging starts at the panel or the
+    # single judge, after collecting round scorecards if there are any
+    judging = "convene_panel" if panel else "judge"
     graph.add_conditional_edges(
         "opposition",
         route_after_opposition,
@@ -200,7 +331,7 @@ def create_debate_graph(config: DebateConfig | None = None) -> StateGraph:
             "start_rebuttal": "start_rebuttal",
             "start_closing": "start_closing",
             "next_round": "next_round",
-            "judge": "judge",
+            "judge": "collect_scores" if config.incremental_judging else judging,
             END: END,
         }
     )
@@ -210,6 +341,20 @@ def create_debate_graph(config: DebateConfig | None = None) -> StateGraph:
     graph.add_edge("next_round", "proponent")
     graph.add_edge("start_closing", "proponent")
     
+    # Each transition also dispatches scoring of the exchange that just
+    # ended; the scorecards are collected before judging
+    if config.incremental_judging:
+        for transition in ("start_rebuttal", "next_round", "start_closing"):
+            graph.add_edge(transition, "score_round")
+        graph.add_edge("score_round", END)
+        graph.add_edge("collect_scores", judging)
+    
+    # Panel judges run in parallel; "judge" waits for every one of them
+    if panel:
+        for name in panel:
+            graph.add_edge("convene_panel", name)
+        graph.add_edge(panel, "judge")
+    
     # Judge ends the graph
     graph.add_edge("judge", END)
     
@@ -217,32 +362,41 @@ def create_debate_graph(config: DebateConfig | None = None) -> StateGraph:
     # Compile and Return
     # =========================================
     
-    # Optional: Add memory saver for checkpointing
-    # memory = MemorySaver()
-    # return graph.compile(checkpointer=memory)
-    
-    return graph.compile()
+    return graph.compile(checkpointer=checkpointer)
 
 
 # ============================================================================
 # Convenience Functions
 # ============================================================================
 
-def run_debate(
+# Configurable flag that asks agent nodes to stream tokens into the custom stream
+TOKEN_STREAM = {"stream_tokens": True}
+
+
+def _to_stream_events(mode: str, chunk: Any) -> List[DebateStreamEvent]:
+    """Convert a (mode, chunk) pair from a multi-mode graph stream into events."""
+    if mode == "custom":
+        return [DebateStreamEvent(**chunk)]
+    
+    return [
+        DebateStreamEvent(kind="update", node=node_name, update=node_output or {})
+        for node_name, node_output in chunk.items()
+    ]
+
+
+def _prepare_debate(
     topic: str,
-    max_rounds: int = 3,
-    config: DebateConfig | None = None,
-) -> Dict[str, Any]:
+    max_rounds: int,
+    config: DebateConfig | None,
+    debate_id: str | None = None,
+) -> tuple[DebateConfig, GraphState, Dict[str, Any]]:
     """
-    Run a complete debate on the given topic.
+    Resolve configuration and build the initial state for a debate.
+    
+    Shared by the sync and async entry points so they stay in lockstep.
     
-    Args:
-        topic: The debate proposition
-        max_rounds: Number of rebuttal rounds
-        config: Optional configuration override
-        
     Returns:
-        Final state dict with complete debate history and verdict
+        Tuple of (config, initial state, run config carrying the thread id)
     """
     if config is None:
         config = get_default_config()
@@ -253,25 +407,60 @@ def run_debate(
             **{**config.model_dump(), "max_rounds": max_rounds}
         )
     
-    # Create graph
-    graph = create_debate_graph(config)
+    debate_id = debate_id or uuid.uuid4().hex
     
-    # Initial state
     initial_state: GraphState = {
+        "debate_id": debate_id,
         "topic": topic,
         "max_rounds": config.max_rounds,
         "current_phase": "opening",
         "current_round": 0,
         "history": [],
+        "memory": {},
+        "round_scorecards": [],
+        "panel_verdicts": [],
         "verdict": None,
         "errors": [],
     }
     
-    logger.info(f"Starting debate: '{topic}'")
+    return config, initial_state, _thread_config(debate_id)
+
+
+def _thread_config(debate_id: str, **configurable: Any) -> Dict[str, Any]:
+    """Build the run config addressing a debate's checkpoint thread."""
+    return {"configurable": {"thread_id": debate_id, **configurable}}
+
+
+def run_debate(
+    topic: str,
+    max_rounds: int = 3,
+    config: DebateConfig | None = None,
+    debate_id: str | None = None,
+) -> Dict[str, Any]:
+    """
+    Run a complete debate on the given topic.
+    
+    Args:
+        topic: The debate proposition
+        max_rounds: Number of rebuttal rounds
+        config: Optional configuration override
+        debate_id: Optional id for the debate (generated if omitted); with
+            checkpointing enabled, pass it to resume_debate after a crash
+    
+    Returns:
+        Final state dict with complete debate history and verdict
+    """
+    config, initial_state, run_config = _prepare_debate(topic, max_rounds, config, debate_id)
+    
+    # Reuse the compiled graph for this configuration
+    graph = get_debate_graph(config)
+    
+    logger.info(f"Starting debate {initial_state['debate_id']}: '{topic}'")
     logger.info(f"Configuration: {config.max_rounds} rounds, model: {config.model_name}")
     
     # Run the graph
-    final_state = graph.invoke(initial_state)
+    with track_debate(config), discard_round_scores(initial_state["debate_id"]):
+        final_state = graph.invoke(initial_state, config=run_config)
     
     logger.info("Debate complete")
     
@@ -282,6 +471,7 @@ def stream_debate(
     topic: str,
     max_rounds: int = 3,
     config: DebateConfig | None = None,
+    debate_id: str | None = None,
 ):
     """
     Stream debate execution, yielding each turn as it completes.
@@ -290,31 +480,250 @@ def stream_debate(
         topic: The debate proposition
         max_rounds: Number of rebuttal rounds
         config: Optional configuration override
+        debate_id: Optional id for the debate (generated if omitted)
+    
+    Yields:
+        State updates after each node execution
+    """
+    config, initial_state, run_config = _prepare_debate(topic, max_rounds, config, debate_id)
+    
+    graph = get_debate_graph(config)
+    
+    logger.info(f"Starting streaming debate {initial_state['debate_id']}: '{topic}'")
+    
+    with track_debate(config), discard_round_scores(initial_state["debate_id"]):
+        for event in graph.stream(initial_state, config=run_config, stream_mode="updates"):
+            yield event
+
+
+async def arun_debate(
+    topic: str,
+    max_rounds: int = 3,
+    config: DebateConfig | None = None,
+    debate_id: str | None = None,
+) -> Dict[str, Any]:
+    """
+    Async version of run_debate.
+    
+    Agent nodes await the LLM instead of blocking a thread, so many
+    debates can be multiplexed on a single event loop. With checkpointing
+    on, the loop's checkpoint connection is closed once no debate on the
+    loop is using it, so asyncio.run(arun_debate(...)) exits cleanly.
+    
+    Args:
+        topic: The debate proposition
+        max_rounds: Number of rebuttal rounds
+        config: Optional configuration override
+        debate_id: Optional id for the debate (generated if omitted)
+    
+    Returns:
+        Final state dict with complete debate history and verdict
+    """
+    config, initial_state, run_config = _prepare_debate(topic, max_rounds, config, debate_id)
+    
+    async with checkpoint_lease(config):
+        graph = get_debate_graph(config)
+        
+        logger.info(f"Starting async debate {initial_state['debate_id']}: '{topic}'")
+        logger.info(f"Configuration: {config.max_rounds} rounds, model: {config.model_name}")
         
+        with track_debate(config), discard_round_scores(initial_state["debate_id"]):
+            final_state = await graph.ainvoke(initial_state, config=run_config)
+    
+    logger.info("Debate complete")
+    
+    return final_state
+
+
+async def astream_debate(
+    topic: str,
+    max_rounds: int = 3,
+    config: DebateConfig | None = None,
+    debate_id: str | None = None,
+):
+    """
+    Async version of stream_debate.
+    
+    Args:
+        topic: The debate proposition
+        max_rounds: Number of rebuttal rounds
+        config: Optional configuration override
+        debate_id: Optional id for the debate (generated if omitted)
+    
     Yields:
         State updates after each node execution
     """
+    config, initial_state, run_config = _prepare_debate(topic, max_rounds, config, debate_id)
+    
+    async with checkpoint_lease(config):
+        graph = get_debate_graph(config)
+        
+        logger.info(f"Starting async streaming debate {initial_state['debate_id']}: '{topic}'")
+        
+        with track_debate(config), discard_round_scores(initial_state["debate_id"]):
+            async for event in graph.astream(initial_state, config=run_config, stream_mode="updates"):
+                yield event
+
+
+def stream_debate_events(
+    topic: str,
+    max_rounds: int = 3,
+    config: DebateConfig | None = None,
+    debate_id: str | None = None,
+) -> Iterator[DebateStreamEvent]:
+    """
+    Stream debate execution token by token.
+    
+    Agent nodes stream from the chat model and forward each text delta
+    through LangGraph's custom stream mode, interleaved with the regular
+    node updates.
+    
+    Args:
+        topic: The debate proposition
+        max_rounds: Number of rebuttal rounds
+        config: Optional configuration override
+        debate_id: Optional id for the debate (generated if omitted)
+    
+    Yields:
+        DebateStreamEvent for every token delta and every node update
+    """
+    config, initial_state, run_config = _prepare_debate(topic, max_rounds, config, debate_id)
+    
+    graph = get_debate_graph(config)
+    
+    logger.info(f"Starting token-streaming debate {initial_state['debate_id']}: '{topic}'")
+    
+    with track_debate(config), discard_round_scores(initial_state["debate_id"]):
+        for mode, chunk in graph.stream(
+            initial_state,
+            config=_thread_config(initial_state["debate_id"], **TOKEN_STREAM),
+            stream_mode=["updates", "custom"],
+        ):
+            yield from _to_stream_events(mode, chunk)
+
+
+async def astream_debate_events(
+    topic: str,
+    max_rounds: int = 3,
+    config: DebateConfig | None = None,
+    debate_id: str | None = None,
+) -> AsyncIterator[DebateStreamEvent]:
+    """
+    Async version of stream_debate_events.
+    
+    Args:
+        topic: The debate proposition
+        max_rounds: Number of rebuttal rounds
+        config: Optional configuration override
+        debate_id: Optional id for the debate (generated if omitted)
+    
+    Yields:
+        DebateStreamEvent for every token delta and every node update
+    """
+    config, initial_state, run_config = _prepare_debate(topic, max_rounds, config, debate_id)
+    
+    async with checkpoint_lease(config):
+        graph = get_debate_graph(config)
+        
+        logger.info(f"Starting async token-streaming debate {initial_state['debate_id']}: '{topic}'")
+        
+        with track_debate(config), discard_round_scores(initial_state["debate_id"]):
+            async for mode, chunk in graph.astream(
+                initial_state,
+                config=_thread_config(initial_state["debate_id"], **TOKEN_STREAM),
+                stream_mode=["updates", "custom"],
+            ):
+                for event in _to_stream_events(mode, chunk):
+                    yield event
+
+
+# ============================================================================
+# Resuming Checkpointed Debates
+# ============================================================================
+
+def _resolve_resume_config(config: DebateConfig | None) -> DebateConfig:
+    """Resolve configuration for a resume, forcing checkpointing on."""
     if config is None:
         config = get_default_config()
     
-    if max_rounds != config.max_rounds:
-        config = DebateConfig(
-            **{**config.model_dump(), "max_rounds": max_rounds}
-        )
+    if not config.checkpoint_enabled:
+        config = DebateConfig(**{**config.model_dump(), "checkpoint_enabled": True})
     
-    graph = create_debate_graph(config)
+    return config
+
+
+def resume_debate(
+    debate_id: str,
+    config: DebateConfig | None = None,
+) -> Dict[str, Any]:
+    """
+    Continue a checkpointed debate from its last completed node.
     
-    initial_state: GraphState = {
-        "topic": topic,
-        "max_rounds": config.max_rounds,
-        "current_phase": "opening",
-        "current_round": 0,
-        "history": [],
-        "verdict": None,
-        "errors": [],
-    }
+    Completed turns are loaded from the checkpoint, so no finished LLM
+    call is repeated. A debate that already finished is returned as-is.
+    
+    Args:
+        debate_id: Id of the debate to resume
+        config: Optional configuration override (must point at the same
+            checkpoint_path the debate was started with)
     
-    logger.info(f"Starting streaming debate: '{topic}'")
+    Returns:
+        Final state dict with complete debate history and verdict
+    
+    Raises:
+        ValueError: If no checkpoint exists for debate_id
+    """
+    config = _resolve_resume_config(config)
+    graph = get_debate_graph(config)
+    run_config = _thread_config(debate_id)
+    
+    snapshot = graph.get_state(run_config)
+    if not snapshot.values:
+        raise ValueError(f"No checkpoint found for debate '{debate_id}'")
+    
+    if not snapshot.next:
+        logger.info(f"Debate {debate_id} already complete")
+        return snapshot.values
+    
+    logger.info(f"Resuming debate {debate_id} at {', '.join(snapshot.next)}")
+    
+    # None input tells LangGraph to continue from the saved checkpoint
+    with track_debate(config), discard_round_scores(debate_id):
+        return graph.invoke(None, config=run_config)
+
+
+async def aresume_debate(
+    debate_id: str,
+    config: DebateConfig | None = None,
+) -> Dict[str, Any]:
+    """
+    Async version of resume_debate.
     
-    for event in graph.stream(initial_state, stream_mode="updates"):
-        yield event
+    Args:
+        debate_id: Id of the debate to resume
+        config: Optional configuration override
+    
+    Returns:
+        Final state dict with complete debate history and verdict
+    
+    Raises:
+        ValueError: If no checkpoint exists for debate_id
+    """
+    config = _resolve_resume_config(config)
+    run_config = _thread_config(debate_id)
+    
+    async with checkpoint_lease(config):
+        graph = get_debate_graph(config)
+        
+        snapshot = await graph.aget_state(run_config)
+        if not snapshot.values:
+            raise ValueError(f"No checkpoint found for debate '{debate_id}'")
+        
+        if not snapshot.next:
+            logger.info(f"Debate {debate_id} already complete")
+            return snapshot.values
+        
+        logger.info(f"Resuming debate {debate_id} at {', '.join(snapshot.next)}")
+        
+        with track_debate(config), discard_round_scores(debate_id):
+            return await graph.ainvoke(None, config=run_config)
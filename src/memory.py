@@ -0,0 +1,105 @@
+"""
+Rolling per-role memory for the Multi-Agent Debate System.
+
+Each debater keeps a compact running summary of its own arguments, updated
+locally after every turn (no extra LLM call). The summary replaces raw
+snippets of earlier turns in the debater prompts, so prompts stay the same
+size however many rounds are debated while agents can still see, and avoid
+repeating, everything they have argued.
+
+Memory is a plain string of one bullet per turn. When it outgrows its token
+ceiling, the oldest bullets are shortened to their lead point first and
+dropped only after that.
+"""
+
+import re
+from typing import List
+
+from .models import DebateTurn
+from .utils import estimate_tokens
+
+# Longest key point kept from one section, in words
+MAX_POINT_WORDS = 30
+
+# Separates the key points of one bullet; a bullet without it is compressed
+POINT_SEPARATOR = " | "
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+# ============================================================================
+# Key Point Extraction
+# ============================================================================
+
+def extract_key_points(content: str) -> List[str]:
+    """
+    Extract the lead sentence of each section of an agent response.
+    
+    Args:
+        content: Agent response with ## headers
+    
+    Returns:
+        One short key point per non-empty section, in order
+    """
+    points = []
+    want_point = True
+    
+    for line in content.splitlines():
+        stripped = line.strip().lstrip("-*• ").strip()
+        if line.strip().startswith("#"):
+            want_point = True
+            continue
+        if not stripped or not want_point:
+            continue
+        
+        sentence = _SENTENCE_END.split(stripped, maxsplit=1)[0]
+        words = sentence.split()
+        if len(words) > MAX_POINT_WORDS:
+            sentence = " ".join(words[:MAX_POINT_WORDS]) + "..."
+        points.append(sentence.replace(POINT_SEPARATOR, ", "))
+        want_point = False
+    
+    return points
+
+
+def turn_label(turn: DebateTurn) -> str:
+    """Short label for a turn, e.g. 'Opening' or 'Round 2'."""
+    if turn.phase == "rebuttal":
+        return f"Round {turn.round_number}"
+    return turn.phase.capitalize()
+
+
+# ============================================================================
+# Memory Updates
+# ============================================================================
+
+def update_memory(memory: str, turn: DebateTurn, max_tokens: int) -> str:
+    """
+    Fold a new turn into a role's rolling memory.
+    
+    Args:
+        memory: Current memory ("" for none)
+        turn: The turn the role just completed
+        max_tokens: Ceiling for the updated memory
+    
+    Returns:
+        Updated memory text
+    """
+    points = extract_key_points(turn.content) or [turn.content[:200]]
+    entries = [line for line in memory.splitlines() if line.strip()]
+    entries.append(f"- [{turn_label(turn)}] {POINT_SEPARATOR.join(points)}")
+    
+    # Shorten oldest entries to their lead point, then drop the oldest
+    index = 0
+    while estimate_tokens("\n".join(entries)) > max_tokens and index < len(entries) - 1:
+        if POINT_SEPARATOR in entries[index]:
+            entries[index] = entries[index].split(POINT_SEPARATOR, 1)[0]
+        index += 1
+    
+    while estimate_tokens("\n".join(entries)) > max_tokens and len(entries) > 1:
+        entries.pop(0)
+    
+    if estimate_tokens(entries[0]) > max_tokens:
+        entries[0] = entries[0][:max_tokens * 4]
+    
+    return "\n".join(entries)
@@ -0,0 +1,377 @@
+"""
+Prometheus-style metrics for the Multi-Agent Debate System.
+
+An optional, process-wide registry of counters, gauges and histograms for
+long-running workers (batch runs, the Streamlit app): LLM requests,
+failures by category (429s are category "rate_limited"), retries, tokens,
+estimated cost, LLM and node latency, cache hits and debates in flight.
+It is served in the Prometheus text exposition format over HTTP
+(stdlib only, like the mock server) at /metrics.
+
+Metrics are off unless DebateConfig.metrics_port (METRICS_PORT, or
+`main.py --metrics-port`) is set or enable_metrics() is called. While off,
+every instrumentation point costs one global lookup; while on, recording
+is a dict update under a per-metric lock.
+"""
+
+import asyncio
+import bisect
+import contextlib
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .config import DebateConfig
+from .models import TurnMetrics
+from .retry import RetryDecision
+
+logger = logging.getLogger(__name__)
+
+# Seconds; LLM calls and debate nodes run from milliseconds to minutes
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+DEBATE_BUCKETS = (1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1200.0, 3600.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+# ============================================================================
+# Metric Types
+# ============================================================================
+
+def format_value(value: float) -> str:
+    """A sample value in exposition format (integers without a decimal point)."""
+    if value == float("inf"):
+        return "+Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def escape_label(value: str) -> str:
+    """Escape a label value for the exposition format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class Metric:
+    """
+    Base class: a named family of samples keyed by label values.
+    
+    Label values are passed positionally, in labelnames order.
+    """
+    
+    kind = "untyped"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], Any] = {}
+    
+    def _labels(self, values: Tuple[str, ...], extra: str = "") -> str:
+        """Render a label set, with an optional pre-rendered extra label."""
+        pairs = [f'{name}="{escape_label(str(value))}"' for name, value in zip(self.labelnames, values)]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+    
+    def samples(self) -> List[str]:
+        """Sample lines for the current values."""
+        with self._lock:
+            values = dict(self._values)
+        return [f"{self.name}{self._labels(labels)} {format_value(value)}" for labels, value in sorted(values.items())]
+    
+    def render(self) -> str:
+        """HELP, TYPE and sample lines."""
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        return "\n".join(lines + self.samples())
+
+
+class Counter(Metric):
+    """Monotonically increasing total."""
+    
+    kind = "counter"
+    
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        """Add `amount` (non-negative) to the labelled total."""
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+
+class Gauge(Metric):
+    """Value that goes up and down."""
+    
+    kind = "gauge"
+    
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        """Add `amount` to the labelled value."""
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+    
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        """Subtract `amount` from the labelled value."""
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(Metric):
+    """
+    Distribution of observations in fixed buckets.
+    
+    Each labelled series keeps per-bucket counts (made cumulative when
+    rendered), a sum and a count.
+    """
+    
+    kind = "histogram"
+    
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+    
+    def observe(self, *labels: str, value: float) -> None:
+        """Record one observation."""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(labels)
+            if series is None:
+                # [bucket counts (+Inf last), sum, count]
+                series = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+    
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = {labels: (list(counts), total, count) for labels, (counts, total, count) in self._values.items()}
+        
+        lines = []
+        for labels, (counts, total, count) in sorted(values.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = f'le="{format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{self._labels(labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{self._labels(labels)} {format_value(total)}")
+            lines.append(f"{self.name}_count{self._labels(labels)} {count}")
+        return lines
+
+
+# ============================================================================
+# Debate Metrics
+# ============================================================================
+
+class DebateMetrics:
+    """The metrics the debate system records, with recording helpers."""
+    
+    def __init__(self):
+        self.llm_requests = Counter(
+            "debate_llm_requests_total", "LLM requests sent, retries included.", ["model"]
+        )
+        self.llm_failures = Counter(
+            "debate_llm_failures_total",
+            "Failed LLM requests by error category (rate_limited = HTTP 429).",
+            ["model", "category"],
+        )
+        self.llm_retries = Counter(
+            "debate_llm_retries_total", "Failed LLM requests that were retried.", ["model"]
+        )
+        self.llm_tokens = Counter(
+            "debate_llm_tokens_total",
+            "Tokens of successful LLM calls by kind (prompt, completion, reasoning).",
+            ["model", "kind"],
+        )
+        self.llm_cost = Counter(
+            "debate_llm_cost_usd_total", "Estimated cost of successful LLM calls in USD.", ["model"]
+        )
+        self.llm_latency = Histogram(
+            "debate_llm_latency_seconds",
+            "Wall time of successful LLM calls, including queueing and retries.",
+            ["model"],
+        )
+        self.llm_ttft = Histogram(
+            "debate_llm_ttft_seconds", "Time to first token of streamed LLM calls.", ["model"]
+        )
+        self.cache_requests = Counter(
+            "debate_cache_requests_total",
+            "Response and verdict cache lookups by result (hit, miss).",
+            ["cache", "result"],
+        )
+        self.node_latency = Histogram(
+            "debate_node_latency_seconds", "Wall time of agent graph nodes.", ["node"]
+        )
+        self.debates_in_flight = Gauge(
+            "debate_debates_in_flight", "Debates currently running."
+        )
+        self.debates = Counter(
+            "debate_debates_total", "Finished debates by status (completed, failed, cancelled).", ["status"]
+        )
+        self.debate_duration = Histogram(
+            "debate_debate_duration_seconds", "Wall time of finished debates.", buckets=DEBATE_BUCKETS
+        )
+    
+    def metrics(self) -> List[Metric]:
+        """Every registered metric."""
+        return [value for value in vars(self).values() if isinstance(value, Metric)]
+    
+    def render(self) -> str:
+        """The whole registry in the Prometheus text exposition format."""
+        return "\n".join(metric.render() for metric in self.metrics()) + "\n"
+    
+    def record_llm_call(self, model: str, metrics: TurnMetrics) -> None:
+        """Record a successful LLM call from its TurnMetrics."""
+        self.llm_tokens.inc(model, "prompt", amount=metrics.prompt_tokens)
+        self.llm_tokens.inc(model, "completion", amount=metrics.completion_tokens)
+        self.llm_tokens.inc(model, "reasoning", amount=metrics.reasoning_tokens)
+        if metrics.cost_usd:
+            self.llm_cost.inc(model, amount=metrics.cost_usd)
+        self.llm_latency.observe(model, value=metrics.llm_latency_ms / 1000)
+        if metrics.ttft_ms is not None:
+            self.llm_ttft.observe(model, value=metrics.ttft_ms / 1000)
+    
+    def record_llm_failure(self, model: str, decision: RetryDecision, retrying: bool) -> None:
+        """Record a failed LLM request (a retry on_failure hook)."""
+        self.llm_failures.inc(model, decision.category)
+        if retrying:
+            self.llm_retries.inc(model)
+    
+    def record_cache(self, cache: str, hit: bool) -> None:
+        """Record a cache lookup ("response" or "verdict")."""
+        self.cache_requests.inc(cache, "hit" if hit else "miss")
+    
+    @contextlib.contextmanager
+    def track_debate(self) -> Iterator[None]:
+        """
+        Count a debate as in flight while the block runs, then record how it ended.
+        
+        A debate is "failed" only when it raised an error. One that was
+        cancelled, interrupted, or whose stream the consumer stopped reading
+        (the generator was closed early) is "cancelled".
+        """
+        started = time.perf_counter()
+        self.debates_in_flight.inc()
+        status = "completed"
+        try:
+            yield
+        except (GeneratorExit, asyncio.CancelledError, KeyboardInterrupt):
+            status = "cancelled"
+            raise
+        except BaseException:
+            status = "failed"
+            raise
+        finally:
+            self.debates_in_flight.dec()
+            self.debates.inc(status)
+            self.debate_duration.observe(value=time.perf_counter() - started)
+
+
+# ============================================================================
+# Exposition Endpoint
+# ============================================================================
+
+class MetricsRequestHandler(BaseHTTPRequestHandler):
+    """Serves the registry at /metrics; `registry` is bound by start_metrics_server."""
+    
+    registry: DebateMetrics
+    
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(f"{self.address_string()} {format % args}")
+    
+    def do_GET(self) -> None:
+        if self.path.split("?")[0].rstrip("/") not in ("", "/metrics"):
+            self.send_error(404)
+            return
+        data = self.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def start_metrics_server(registry: DebateMetrics, port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """
+    Serve a registry over HTTP on a daemon thread.
+    
+    Args:
+        registry: Metrics to expose
+        port: Port to listen on (0 picks a free one)
+        host: Interface to bind
+    
+    Returns:
+        The running server (server_address holds the bound port)
+    """
+    handler = type("BoundMetricsRequestHandler", (MetricsRequestHandler,), {"registry": registry})
+    httpd = ThreadingHTTPServer((host, port), handler)
+    httpd.daemon_threads = True
+    threading.Thread(target=httpd.serve_forever, name="metrics", daemon=True).start()
+    logger.info(f"Serving metrics on http://{host}:{httpd.server_address[1]}/metrics")
+    return httpd
+
+
+# ============================================================================
+# Process-wide Registry
+# ============================================================================
+
+_metrics: Optional[DebateMetrics] = None
+_server: Optional[ThreadingHTTPServer] = None
+_metrics_lock = threading.Lock()
+
+
+def enable_metrics(port: Optional[int] = None, host: str = "127.0.0.1") -> DebateMetrics:
+    """
+    Turn on metrics collection for this process.
+    
+    Idempotent: later calls return the same registry, and the endpoint is
+    started at most once.
+    
+    Args:
+        port: Serve /metrics on this port (None = collect without serving)
+        host: Interface to bind the endpoint to
+    
+    Returns:
+        The process-wide registry
+    """
+    global _metrics, _server
+    
+    with _metrics_lock:
+        if _metrics is None:
+            _metrics = DebateMetrics()
+        if port is not None and _server is None:
+            _server = start_metrics_server(_metrics, port, host)
+        return _metrics
+
+
+def get_metrics(config: Optional[DebateConfig] = None) -> Optional[DebateMetrics]:
+    """
+    Get the process-wide registry, enabling it if a configuration asks for it.
+    
+    Args:
+        config: Configuration whose metrics_port turns metrics on
+    
+    Returns:
+        DebateMetrics, or None while metrics are off
+    """
+    if _metrics is None and config is not None and config.metrics_port is not None:
+        return enable_metrics(config.metrics_port, config.metrics_host)
+    return _metrics
+
+
+def metrics_address() -> Optional[Tuple[str, int]]:
+    """(host, port) the endpoint is bound to, or None if it isn't serving."""
+    return None if _server is None else _server.server_address[:2]
+
+
+@contextlib.contextmanager
+def track_debate(config: DebateConfig) -> Iterator[None]:
+    """Track a debate in the registry while the block runs (no-op while metrics are off)."""
+    metrics = get_metrics(config)
+    if metrics is None:
+        yield
+        return
+    with metrics.track_debate():
+        yield
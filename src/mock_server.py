@@ -0,0 +1,522 @@
+"""
+Local OpenAI-compatible mock LLM server for the Multi-Agent Debate System.
+
+Stands in for OpenRouter so the graph can be load-tested and benchmarked
+offline, without quota or network. It serves /v1/chat/completions, both
+streaming (SSE) and non-streaming, and answers each agent with
+role-appropriate markdown carrying the headers the validators expect:
+- Proponent / opposition turns sized to the prompt's word limit
+- Judge verdicts (markdown, or JSON when response_format asks for it)
+- Round scorecards and section repairs
+
+Timing is configurable: time to first token drawn from a latency
+distribution, then a steady tokens-per-second stream. Errors (HTTP 500)
+and rate limits (HTTP 429 with Retry-After) can be injected at a given
+rate. Responses are deterministic per prompt; latency and injected
+failures are deterministic per server when a seed is set.
+
+Usage:
+    python -m src.mock_server --port 8765 --ttft-ms 300 --tokens-per-second 40
+    MOCK_LLM_URL=http://127.0.0.1:8765/v1 python main.py --topic "..."
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Literal, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from .utils import OPPOSITION_HEADERS, PROPONENT_HEADERS
+
+logger = logging.getLogger(__name__)
+
+WORDS = (
+    "evidence policy growth risk labor market automation productivity wages "
+    "history transition regulation innovation cost benefit study data trend "
+    "outcome incentive public private sector long term impact analysis"
+).split()
+
+# Words per debater turn when the prompt states no limit
+DEFAULT_RESPONSE_WORDS = 300
+
+_WORD_LIMIT = re.compile(r"do not exceed (\d+) words", re.IGNORECASE)
+
+
+# ============================================================================
+# Settings
+# ============================================================================
+
+class MockServerSettings(BaseModel):
+    """Behaviour of the mock server."""
+    host: str = Field(default="127.0.0.1", description="Interface to bind")
+    port: int = Field(default=8765, ge=0, description="Port to bind (0 = any free port)")
+    ttft_ms: float = Field(default=200.0, ge=0.0, description="Mean time to first token (ms)")
+    ttft_distribution: Literal["fixed", "uniform", "exponential", "lognormal"] = Field(
+        default="lognormal",
+        description="Distribution time to first token is drawn from"
+    )
+    ttft_jitter: float = Field(
+        default=0.5,
+        ge=0.0,
+        description="Spread: +/- fraction of the mean (uniform) or sigma (lognormal)"
+    )
+    tokens_per_second: float = Field(default=50.0, ge=0.0, description="Stream rate after the first token (0 = instant)")
+    error_rate: float = Field(default=0.0, ge=0.0, le=1.0, description="Share of requests failing with HTTP 500")
+    rate_limit_rate: float = Field(default=0.0, ge=0.0, le=1.0, description="Share of requests rejected with HTTP 429")
+    retry_after_seconds: float = Field(default=1.0, ge=0.0, description="Retry-After sent with 429 responses")
+    response_words: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Words per debater turn (None = 80% of the prompt's word limit)"
+    )
+    seed: Optional[int] = Field(default=None, description="Seed for latency and failure injection")
+
+
+# ============================================================================
+# Response Generation
+# ============================================================================
+
+def prompt_text(messages: List[Dict[str, Any]]) -> str:
+    """Flatten OpenAI chat messages (string or content-part lists) to text."""
+    parts = []
+    for message in messages:
+        content = message.get("content") or ""
+        if isinstance(content, list):
+            content = "\n".join(part.get("text", "") for part in content if isinstance(part, dict))
+        parts.append(content)
+    return "\n".join(parts)
+
+
+def detect_role(text: str) -> str:
+    """Which agent sent a prompt: proponent, opposition, judge, scorer or repair."""
+    if "missing required sections" in text:
+        return "repair"
+    if "**SCORER**" in text:
+        return "scorer"
+    if "**JUDGE**" in text:
+        return "judge"
+    if "**AGAINST**" in text:
+        return "opposition"
+    return "proponent"
+
+
+def sentences(rng: random.Random, words: int) -> str:
+    """About `words` words of filler prose."""
+    out = []
+    while words > 0:
+        size = min(words, rng.randint(8, 16))
+        out.append(" ".join(rng.choice(WORDS) for _ in range(size)).capitalize() + ".")
+        words -= size
+    return " ".join(out)
+
+
+def debater_response(headers: Tuple[str, ...], words: int, rng: random.Random) -> str:
+    """A debater turn with one section per required header."""
+    per_section = max(words // len(headers), 5)
+    return "\n\n".join(f"## {header}\n{sentences(rng, per_section)}" for header in headers)
+
+
+def judge_response(rng: random.Random, as_json: bool) -> str:
+    """A verdict in the judge's markdown or JSON format."""
+    scores = {
+        dimension: (rng.randint(5, 9), rng.randint(5, 9))
+        for dimension in ("logic", "evidence", "rebuttal", "persuasion")
+    }
+    proponent_total = sum(p for p, _ in scores.values())
+    opposition_total = sum(o for _, o in scores.values())
+    winner = "proponent" if proponent_total >= opposition_total else "opposition"
+    confidence = rng.choice(("high", "medium", "low"))
+    reasoning = sentences(rng, 50)
+    summary = f"The {winner} made the stronger case."
+    
+    if as_json:
+        return json.dumps({
+            "proponent_strengths": [sentences(rng, 12), sentences(rng, 12)],
+            "opposition_strengths": [sentences(rng, 12), sentences(rng, 12)],
+            "ignored_counterarguments": [sentences(rng, 10)],
+            "scores": {
+                dimension: {"proponent": p, "opposition": o, "notes": sentences(rng, 6)}
+                for dimension, (p, o) in scores.items()
+            },
+            "winner": winner,
+            "confidence": confidence,
+            "reasoning": reasoning,
+            "summary": summary,
+        })
+    
+    rows = "\n".join(
+        f"| {dimension.title()} | {p}/10 | {o}/10 | {sentences(rng, 6)} |"
+        for dimension, (p, o) in scores.items()
+    )
+    return (
+        "## Argument Analysis\n\n"
+        f"### Proponent Strengths\n- {sentences(rng, 12)}\n- {sentences(rng, 12)}\n\n"
+        f"### Proponent Weaknesses\n- {sentences(rng, 10)}\n\n"
+        f"### Opposition Strengths\n- {sentences(rng, 12)}\n- {sentences(rng, 12)}\n\n"
+        f"### Opposition Weaknesses\n- {sentences(rng, 10)}\n\n"
+        f"## Ignored Counterarguments\n- {sentences(rng, 10)}\n\n"
+        "## Scores\n\n"
+        "| Dimension | Proponent | Opposition | Notes |\n"
+        "|-----------|-----------|------------|-------|\n"
+        f"{rows}\n"
+        f"| **TOTAL** | {proponent_total}/40 | {opposition_total}/40 | |\n\n"
+        f"## Verdict\n\n**WINNER: {winner.capitalize()}**\n**CONFIDENCE: {confidence.capitalize()}**\n\n"
+        f"## Reasoning\n{reasoning}\n\n"
+        f"## Summary\n{summary}"
+    )
+
+
+def generate_response(body: Dict[str, Any], response_words: Optional[int] = None) -> str:
+    """
+    The mock completion for a chat request, deterministic per prompt.
+    
+    Args:
+        body: Decoded chat-completions request body
+        response_words: Words per debater turn (None = 80% of the prompt's limit)
+    
+    Returns:
+        Response text
+    """
+    text = prompt_text(body.get("messages") or [])
+    rng = random.Random(hashlib.sha256(text.encode("utf-8")).digest())
+    role = detect_role(text)
+    
+    if role == "judge":
+        as_json = (body.get("response_format") or {}).get("type") == "json_object"
+        return judge_response(rng, as_json)
+    if role == "scorer":
+        return (
+            f"## Scores\nPROPONENT: {rng.randint(4, 9)}/10\nOPPOSITION: {rng.randint(4, 9)}/10\n\n"
+            f"## Notes\n- Proponent best point: {sentences(rng, 10)}\n"
+            f"- Opposition best point: {sentences(rng, 10)}\n- Unanswered: none"
+        )
+    if role == "repair":
+        missing = text.split("# MISSING SECTIONS", 1)[-1].split("---", 1)[0]
+        headers = tuple(line[3:].strip() for line in missing.splitlines() if line.startswith("## "))
+        return debater_response(headers or ("Key Takeaway",), 30 * max(len(headers), 1), rng)
+    
+    if response_words is None:
+        limit = _WORD_LIMIT.search(text)
+        response_words = int(int(limit.group(1)) * 0.8) if limit else DEFAULT_RESPONSE_WORDS
+    headers = OPPOSITION_HEADERS if role == "opposition" else PROPONENT_HEADERS
+    return debater_response(headers, response_words, rng)
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into stream chunks: one whitespace-led word per token."""
+    return re.findall(r"\s*\S+", text) or [text]
+
+
+# ============================================================================
+# HTTP Server
+# ============================================================================
+
+class MockLLMServer:
+    """
+    The mock server, running on a background thread.
+    
+    Usable as a context manager:
+        
+        with MockLLMServer(MockServerSettings(port=0)) as server:
+            config = DebateConfig(mock_llm_url=server.url)
+    """
+    
+    def __init__(self, settings: Optional[MockServerSettings] = None):
+        self.settings = settings or MockServerSettings()
+        self._rng = random.Random(self.settings.seed)
+        self._lock = threading.Lock()
+        self._counters = {
+            "requests": 0,
+            "streamed": 0,
+            "errors_injected": 0,
+            "rate_limited": 0,
+            "completion_tokens": 0,
+            "disconnects": 0,
+        }
+        self._httpd = ThreadingHTTPServer((self.settings.host, self.settings.port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+        self._serving = False
+    
+    @property
+    def url(self) -> str:
+        """Base URL for DebateConfig.mock_llm_url."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+    
+    def start(self) -> "MockLLMServer":
+        """Serve requests on a daemon thread."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="mock-llm", daemon=True)
+        self._thread.start()
+        logger.info(f"Mock LLM server listening on {self.url}")
+        return self
+    
+    def serve_forever(self) -> None:
+        """Serve requests on the calling thread until interrupted."""
+        logger.info(f"Mock LLM server listening on {self.url}")
+        self._serving = True
+        self._httpd.serve_forever()
+    
+    def stop(self) -> None:
+        """
+        Stop serving and release the port.
+        
+        Safe on a server that was never started: shutdown() waits for the
+        serve loop to exit, so it is only called when one was started.
+        """
+        try:
+            if self._thread is not None or self._serving:
+                self._httpd.shutdown()
+        finally:
+            self._httpd.server_close()
+            self._serving = False
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+    
+    def __enter__(self) -> "MockLLMServer":
+        return self.start()
+    
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+    
+    def stats(self) -> Dict[str, int]:
+        """Request, failure-injection and token counters."""
+        with self._lock:
+            return dict(self._counters)
+    
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] += amount
+    
+    def sample_ttft(self) -> float:
+        """Draw a time to first token, in seconds."""
+        settings = self.settings
+        mean = settings.ttft_ms / 1000.0
+        with self._lock:
+            if settings.ttft_distribution == "uniform":
+                spread = mean * min(settings.ttft_jitter, 1.0)
+                return self._rng.uniform(mean - spread, mean + spread)
+            if settings.ttft_distribution == "exponential":
+                return self._rng.expovariate(1 / mean) if mean > 0 else 0.0
+            if settings.ttft_distribution == "lognormal" and mean > 0:
+                # Parameterized so the mean stays ttft_ms whatever the spread
+                sigma = settings.ttft_jitter
+                return self._rng.lognormvariate(0.0, sigma) * mean / math.exp(sigma * sigma / 2)
+            return mean
+    
+    def sample_failure(self) -> Optional[int]:
+        """HTTP status to inject for a request, or None to answer it."""
+        with self._lock:
+            roll = self._rng.random()
+        if roll < self.settings.rate_limit_rate:
+            return 429
+        if roll < self.settings.rate_limit_rate + self.settings.error_rate:
+            return 500
+        return None
+    
+    def _handler_class(self):
+        server = self
+        
+        class Handler(MockRequestHandler):
+            mock = server
+        
+        return Handler
+
+
+class MockRequestHandler(BaseHTTPRequestHandler):
+    """Chat-completions endpoint; `mock` is bound to the owning MockLLMServer."""
+    
+    protocol_version = "HTTP/1.1"  # keep-alive, so clients reuse connections
+    mock: MockLLMServer
+    
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(f"{self.address_string()} {format % args}")
+    
+    def send_json(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> None:
+        """Send a complete JSON response."""
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def do_GET(self) -> None:
+        path = self.path.rstrip("/")
+        if path.endswith("/models"):
+            self.send_json(200, {"object": "list", "data": [{"id": "mock", "object": "model"}]})
+        elif path.endswith("/stats"):
+            self.send_json(200, self.mock.stats())
+        elif path.endswith("/health"):
+            self.send_json(200, {"status": "ok"})
+        else:
+            self.send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+    
+    def do_POST(self) -> None:
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self.send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+            return
+        
+        mock = self.mock
+        mock._count("requests")
+        status = mock.sample_failure()
+        if status == 429:
+            mock._count("rate_limited")
+            self.send_json(
+                429,
+                {"error": {"message": "Rate limit exceeded (injected)", "code": 429}},
+                {"Retry-After": f"{mock.settings.retry_after_seconds:g}"},
+            )
+            return
+        if status == 500:
+            mock._count("errors_injected")
+            self.send_json(500, {"error": {"message": "Internal server error (injected)", "code": 500}})
+            return
+        
+        text = generate_response(body, mock.settings.response_words)
+        tokens = tokenize(text)
+        max_tokens = body.get("max_tokens") or body.get("max_completion_tokens")
+        finish_reason = "stop"
+        if max_tokens and len(tokens) > max_tokens:
+            tokens, finish_reason = tokens[:max_tokens], "length"
+        
+        usage = {
+            "prompt_tokens": len(prompt_text(body.get("messages") or [])) // 4,
+            "completion_tokens": len(tokens),
+        }
+        usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+        completion_id = f"chatcmpl-mock-{uuid.uuid4().hex[:12]}"
+        model = body.get("model", "mock")
+        
+        time.sleep(mock.sample_ttft())
+        
+        if not body.get("stream"):
+            if mock.settings.tokens_per_second:
+                time.sleep(max(len(tokens) - 1, 0) / mock.settings.tokens_per_second)
+            mock._count("completion_tokens", len(tokens))
+            self.send_json(200, {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "".join(tokens)},
+                    "finish_reason": finish_reason,
+                }],
+                "usage": usage,
+            })
+            return
+        
+        mock._count("streamed")
+        include_usage = (body.get("stream_options") or {}).get("include_usage")
+        try:
+            self.stream_events(completion_id, model, tokens, finish_reason, usage if include_usage else None)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client cancelled generation (e.g. early stopping)
+            mock._count("disconnects")
+            self.close_connection = True
+    
+    def stream_events(
+        self,
+        completion_id: str,
+        model: str,
+        tokens: List[str],
+        finish_reason: str,
+        usage: Optional[Dict[str, int]],
+    ) -> None:
+        """Send the completion as chunked server-sent events."""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        
+        interval = 1 / self.mock.settings.tokens_per_second if self.mock.settings.tokens_per_second else 0.0
+        for payload in self.chunk_payloads(completion_id, model, tokens, finish_reason, usage):
+            self.write_chunk(f"data: {json.dumps(payload)}\n\n")
+            if payload["choices"] and payload["choices"][0]["delta"].get("content"):
+                self.mock._count("completion_tokens")
+                if interval:
+                    time.sleep(interval)
+        self.write_chunk("data: [DONE]\n\n")
+        self.wfile.write(b"0\r\n\r\n")
+    
+    @staticmethod
+    def chunk_payloads(
+        completion_id: str,
+        model: str,
+        tokens: List[str],
+        finish_reason: str,
+        usage: Optional[Dict[str, int]],
+    ) -> Iterator[Dict[str, Any]]:
+        """The chat.completion.chunk objects of a streamed completion."""
+        base = {"id": completion_id, "object": "chat.completion.chunk", "created": int(time.time()), "model": model}
+        yield {**base, "choices": [{"index": 0, "delta": {"role": "assistant", "content": ""}, "finish_reason": None}]}
+        for token in tokens:
+            yield {**base, "choices": [{"index": 0, "delta": {"content": token}, "finish_reason": None}]}
+        yield {**base, "choices": [{"index": 0, "delta": {}, "finish_reason": finish_reason}]}
+        if usage is not None:
+            yield {**base, "choices": [], "usage": usage}
+    
+    def write_chunk(self, text: str) -> None:
+        """Write one HTTP/1.1 chunk and flush it to the client."""
+        data = text.encode("utf-8")
+        self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+
+# ============================================================================
+# Command Line
+# ============================================================================
+
+def main() -> None:
+    """Run the mock server until interrupted."""
+    defaults = MockServerSettings()
+    parser = argparse.ArgumentParser(description="OpenAI-compatible mock LLM server for offline debates")
+    parser.add_argument("--host", default=defaults.host)
+    parser.add_argument("--port", type=int, default=defaults.port)
+    parser.add_argument("--ttft-ms", type=float, default=defaults.ttft_ms, help="Mean time to first token")
+    parser.add_argument(
+        "--ttft-distribution",
+        choices=["fixed", "uniform", "exponential", "lognormal"],
+        default=defaults.ttft_distribution,
+    )
+    parser.add_argument("--ttft-jitter", type=float, default=defaults.ttft_jitter)
+    parser.add_argument("--tokens-per-second", type=float, default=defaults.tokens_per_second)
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate, help="Share of HTTP 500s")
+    parser.add_argument("--rate-limit-rate", type=float, default=defaults.rate_limit_rate, help="Share of HTTP 429s")
+    parser.add_argument("--retry-after", type=float, default=defaults.retry_after_seconds, dest="retry_after_seconds")
+    parser.add_argument("--response-words", type=int, default=None, help="Words per debater turn")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--verbose", "-v", action="store_true", help="Log every request")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO, format="%(asctime)s %(message)s")
+    settings = MockServerSettings(**{k: v for k, v in vars(args).items() if k != "verbose"})
+    
+    server = MockLLMServer(settings)
+    print(f"Mock LLM server on {server.url} (set MOCK_LLM_URL={server.url})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
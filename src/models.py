@@ -7,7 +7,7 @@ Defines typed state structures for LangGraph, ensuring:
 - Structured outputs for all agents
 """
 
-from typing import List, Optional, Literal, Annotated
+from typing import Any, Dict, List, Optional, Literal, Annotated
 from pydantic import BaseModel, Field
 from datetime import datetime
 import operator
@@ -45,6 +45,82 @@ class AgentResponse(BaseModel):
     )
 
 
+class TurnMetrics(BaseModel):
+    """
+    Where the time, tokens and money of one turn's LLM calls went.
+    
+    Token counts come from the provider's usage metadata when it reports
+    them, and are estimated from the text otherwise.
+    """
+    llm_calls: int = Field(
+        default=0,
+        description="Requests sent to the model (retries and section repairs included)"
+    )
+    cache_hits: int = Field(
+        default=0,
+        description="Calls answered from the response cache"
+    )
+    retries: int = Field(
+        default=0,
+        description="Failed attempts that were retried"
+    )
+    queue_wait_ms: float = Field(
+        default=0.0,
+        description="Time spent waiting for the shared rate limiter"
+    )
+    ttft_ms: Optional[float] = Field(
+        default=None,
+        description="Time to first token of the first streamed call (None if not streamed)"
+    )
+    llm_latency_ms: float = Field(
+        default=0.0,
+        description="Wall time of the LLM calls, including queueing and backoff"
+    )
+    node_latency_ms: float = Field(
+        default=0.0,
+        description="Wall time of the graph node that produced the turn"
+    )
+    prompt_tokens: int = Field(
+        default=0,
+        description="Prompt tokens sent"
+    )
+    completion_tokens: int = Field(
+        default=0,
+        description="Completion tokens generated, reasoning included"
+    )
+    reasoning_tokens: int = Field(
+        default=0,
+        description="Completion tokens spent reasoning"
+    )
+    usage_reported: bool = Field(
+        default=False,
+        description="Token counts came from provider usage metadata rather than estimates"
+    )
+    cost_usd: Optional[float] = Field(
+        default=None,
+        description="Estimated cost from DebateConfig.model_prices (None if the price is unknown)"
+    )
+
+
+class LLMReply(BaseModel):
+    """One LLM call's answer and how its completion tokens were spent."""
+    content: str = Field(
+        description="Answer text, with any reasoning removed"
+    )
+    reasoning_tokens: int = Field(
+        default=0,
+        description="Completion tokens spent reasoning before the answer"
+    )
+    answer_tokens: int = Field(
+        default=0,
+        description="Completion tokens in the answer"
+    )
+    metrics: TurnMetrics = Field(
+        default_factory=TurnMetrics,
+        description="Latency, token and cost instrumentation of the call"
+    )
+
+
 # ============================================================================
 # Debate Turn Model
 # ============================================================================
@@ -76,6 +152,22 @@ class DebateTurn(BaseModel):
         default=0,
         description="Word count of the response"
     )
+    prompt_tokens: int = Field(
+        default=0,
+        description="Estimated tokens in the prompt that produced this turn"
+    )
+    reasoning_tokens: int = Field(
+        default=0,
+        description="Completion tokens the model spent reasoning for this turn"
+    )
+    answer_tokens: int = Field(
+        default=0,
+        description="Completion tokens in the generated answer"
+    )
+    metrics: TurnMetrics = Field(
+        default_factory=TurnMetrics,
+        description="Latency, token and cost instrumentation of the turn"
+    )
     
     def model_post_init(self, __context) -> None:
         """Calculate word count after initialization."""
@@ -83,6 +175,65 @@ class DebateTurn(BaseModel):
             self.word_count = len(self.content.split())
 
 
+# ============================================================================
+# Turn Analysis Model
+# ============================================================================
+
+class SectionSpan(BaseModel):
+    """Location of one required header's section within a response."""
+    header: str = Field(
+        description="Required header, as spelled in the format"
+    )
+    start: int = Field(
+        description="Offset where the header markup begins"
+    )
+    body_start: int = Field(
+        description="Offset just past the header markup"
+    )
+    end: int = Field(
+        description="Offset where the next required header (or the text) begins"
+    )
+
+
+class TurnStats(BaseModel):
+    """
+    Result of post-processing one agent response.
+    
+    Produced in a single pass by utils.analyze_turn.
+    """
+    content: str = Field(
+        description="Normalized and, if needed, truncated response text"
+    )
+    word_count: int = Field(
+        default=0,
+        description="Words in content"
+    )
+    truncated: bool = Field(
+        default=False,
+        description="Whether the response was cut to the word limit"
+    )
+    missing_headers: List[str] = Field(
+        default_factory=list,
+        description="Required headers not found in content"
+    )
+    sections: List[SectionSpan] = Field(
+        default_factory=list,
+        description="Required-header sections of content, in order"
+    )
+    
+    @property
+    def is_valid(self) -> bool:
+        """Whether every required header is present."""
+        return not self.missing_headers
+    
+    def section(self, header: str) -> Optional[str]:
+        """Body of the first section under a required header, or None."""
+        for span in self.sections:
+            if span.header == header:
+                return self.content[span.body_start:span.end].strip()
+        return None
+
+
 # ============================================================================
 # Judge Verdict Model
 # ============================================================================
@@ -140,6 +291,147 @@ class JudgeVerdict(BaseModel):
     )
 
 
+# ============================================================================
+# Streaming Event Model
+# ============================================================================
+
+class DebateStreamEvent(BaseModel):
+    """
+    A single event from a token-level debate stream.
+    
+    "token" events carry an incremental text delta from the agent that is
+    currently generating; "reset" events void the deltas streamed so far
+    for that turn (a failed call is being retried and will stream the turn
+    again); "update" events carry the state update a graph node returned
+    once it finished.
+    """
+    kind: Literal["token", "reset", "update"] = Field(
+        description="Event type: token delta, reset of the streamed turn, or completed node update"
+    )
+    node: str = Field(
+        description="Graph node that produced the event"
+    )
+    role: Optional[Literal["proponent", "opposition", "judge"]] = Field(
+        default=None,
+        description="Agent role generating the tokens (token and reset events only)"
+    )
+    phase: Optional[str] = Field(
+        default=None,
+        description="Debate phase of the turn being generated (token and reset events only)"
+    )
+    round_number: int = Field(
+        default=0,
+        ge=0,
+        description="Round number of the turn being generated (token and reset events only)"
+    )
+    delta: str = Field(
+        default="",
+        description="Incremental text generated since the previous token event"
+    )
+    update: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Partial state returned by the node (update events only)"
+    )
+
+
+# ============================================================================
+# Batch Execution Models
+# ============================================================================
+
+class DebateResult(BaseModel):
+    """
+    Outcome of one debate in a batch run.
+    
+    Failed debates are recorded with an error instead of aborting the batch.
+    """
+    index: int = Field(
+        ge=0,
+        description="Position of the topic in the input list"
+    )
+    topic: str = Field(
+        description="The debate proposition"
+    )
+    debate_id: str = Field(
+        default="",
+        description="Debate id (the checkpoint thread id when checkpointing)"
+    )
+    winner: Optional[Literal["proponent", "opposition", "tie"]] = Field(
+        default=None,
+        description="Winning side (None if the debate failed)"
+    )
+    confidence: Optional[Literal["high", "medium", "low"]] = Field(
+        default=None,
+        description="Judge's confidence (None if the debate failed)"
+    )
+    history: List[DebateTurn] = Field(
+        default_factory=list,
+        description="Complete history of debate turns"
+    )
+    verdict: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="Full verdict dict produced by the judge"
+    )
+    elapsed_seconds: float = Field(
+        default=0.0,
+        ge=0.0,
+        description="Wall-clock time spent on this debate"
+    )
+    error: Optional[str] = Field(
+        default=None,
+        description="Error message if the debate failed"
+    )
+    cached: bool = Field(
+        default=False,
+        description="Whether the verdict was served from the verdict cache (re-judging only)"
+    )
+
+
+class TournamentReport(BaseModel):
+    """Aggregate throughput figures for a batch of debates."""
+    total: int = Field(
+        default=0,
+        description="Number of debates scheduled"
+    )
+    completed: int = Field(
+        default=0,
+        description="Number of debates that finished successfully"
+    )
+    failed: int = Field(
+        default=0,
+        description="Number of debates that raised an error"
+    )
+    total_turns: int = Field(
+        default=0,
+        description="Turns produced across all completed debates"
+    )
+    elapsed_seconds: float = Field(
+        default=0.0,
+        description="Wall-clock time for the whole batch"
+    )
+    concurrency: int = Field(
+        default=1,
+        description="Maximum debates in flight at once"
+    )
+    cached: int = Field(
+        default=0,
+        description="Verdicts served from the verdict cache (re-judging only)"
+    )
+    
+    @property
+    def debates_per_minute(self) -> float:
+        """Completed debates per minute of wall-clock time."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.completed * 60.0 / self.elapsed_seconds
+    
+    @property
+    def turns_per_minute(self) -> float:
+        """Debate turns per minute of wall-clock time."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.total_turns * 60.0 / self.elapsed_seconds
+
+
 # ============================================================================
 # LangGraph State Model
 # ============================================================================
@@ -163,6 +455,10 @@ class DebateState(BaseModel):
     - Immutable patterns enforced through Pydantic
     """
     # Debate Configuration
+    debate_id: str = Field(
+        default="",
+        description="Identifier used as the checkpoint thread id"
+    )
     topic: str = Field(
         default="",
         description="The debate topic or proposition"
@@ -14,14 +14,24 @@ This prevents:
 - Unstructured responses
 """
 
-from typing import List
+from typing import Any, Dict, List, Optional
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 from .models import DebateTurn
+from .budget import fit_sections, fit_turns, remaining_budget
+from .utils import estimate_tokens
 
 
 # ============================================================================
 # Prompt Templates
 # ============================================================================
 
+# Separates the system part of a flattened prompt from its user part
+PROMPT_SEPARATOR = "\n\n---\n\n"
+
+# Shortest prefix providers cache (OpenAI's automatic caching and
+# Anthropic's cache_control both start at 1024 tokens)
+MIN_CACHEABLE_TOKENS = 1024
+
 PROPONENT_SYSTEM_PROMPT = """## ROLE
 You are a skilled debater arguing **IN FAVOR** of the proposition. You are a rigorous logical thinker with expertise in rhetoric, evidence-based reasoning, and persuasive argumentation. Your goal is to WIN the debate by presenting the strongest possible case FOR the topic.
 
@@ -177,17 +187,111 @@ You MUST structure your response with these exact headers and format:
 [One sentence capturing the essence of the verdict]
 """
 
+# Same judge, answering with one JSON object instead of markdown sections
+# (DebateConfig.judge_output_format = "json")
+JUDGE_JSON_SYSTEM_PROMPT = JUDGE_SYSTEM_PROMPT.split("## OUTPUT FORMAT")[0] + """## OUTPUT FORMAT
+You MUST respond with ONE JSON object and nothing else, with exactly these keys:
+
+{
+  "proponent_strengths": ["2-3 strongest arguments with brief explanation"],
+  "opposition_strengths": ["2-3 strongest arguments with brief explanation"],
+  "ignored_counterarguments": ["points not adequately addressed by either side"],
+  "scores": {
+    "logic": {"proponent": 1-10, "opposition": 1-10, "notes": "brief justification"},
+    "evidence": {"proponent": 1-10, "opposition": 1-10, "notes": "brief justification"},
+    "rebuttal": {"proponent": 1-10, "opposition": 1-10, "notes": "brief justification"},
+    "persuasion": {"proponent": 1-10, "opposition": 1-10, "notes": "brief justification"}
+  },
+  "winner": "proponent" or "opposition",
+  "confidence": "high", "medium" or "low",
+  "reasoning": "3-5 sentences explaining why the winner prevailed, with specific references to arguments made",
+  "summary": "one sentence capturing the essence of the verdict"
+}
+"""
+
+ROUND_SCORER_SYSTEM_PROMPT = """## ROLE
+You are a debate **SCORER** keeping a running scorecard for the judge. You score one exchange at a time, impartially, on argument quality alone.
+
+## INSTRUCTIONS
+1. Score EACH side (1-10) for this exchange only, weighing logic, evidence and rebuttal
+2. Name the single strongest point each side made
+3. Note any argument from the other side that was left unanswered
+
+## CONSTRAINTS
+❌ Do NOT let personal opinion on the topic influence scores
+❌ Do NOT summarize the exchange - the judge only needs your assessment
+❌ Do NOT exceed 120 words
+
+## OUTPUT FORMAT
+You MUST use exactly this format:
+
+## Scores
+PROPONENT: X/10
+OPPOSITION: X/10
+
+## Notes
+- Proponent best point: [one line]
+- Opposition best point: [one line]
+- Unanswered: [one line, or "none"]
+"""
+
+
+SECTION_REPAIR_SYSTEM_PROMPT = """## ROLE
+You are completing a debate response that is missing required sections.
+
+## INSTRUCTIONS
+1. Write ONLY the missing sections listed by the user, in the order given
+2. Start each section with its exact markdown header
+3. Stay consistent with the existing response and its side of the debate
+
+## CONSTRAINTS
+❌ Do NOT repeat or rewrite the existing response
+❌ Do NOT exceed {max_words} words per section
+
+## OUTPUT FORMAT
+The missing sections only, nothing before or after them.
+"""
+
 
 # ============================================================================
 # Prompt Construction Functions
 # ============================================================================
 
+def recent_turns(history: List[DebateTurn], role: str, count: int) -> List[DebateTurn]:
+    """
+    The last `count` turns of one role, oldest first.
+    
+    Scans from the end of the history, so the cost does not grow with
+    the length of the debate.
+    """
+    turns = []
+    for turn in reversed(history):
+        if len(turns) == count:
+            break
+        if turn.role == role:
+            turns.append(turn)
+    turns.reverse()
+    return turns
+
+
+def debater_system_prompt(template: str, topic: str, max_words: int) -> str:
+    """
+    System part of a debater prompt: the role's instructions, then the topic.
+    
+    Both stay the same for every turn of a debater in a debate, so the
+    whole system part is the stable prefix providers can cache.
+    """
+    return f"{template.format(max_words=max_words)}\n# DEBATE TOPIC\n{topic}\n"
+
+
 def build_proponent_prompt(
     topic: str,
     phase: str,
     round_number: int,
     history: List[DebateTurn],
-    max_words: int = 400
+    max_words: int = 400,
+    max_prompt_tokens: Optional[int] = None,
+    memory: Optional[str] = None
 ) -> str:
     """
     Construct the full prompt for the proponent agent.
@@ -198,39 +302,62 @@ def build_proponent_prompt(
         round_number: Current round number
         history: Previous debate turns for context
         max_words: Maximum response length
-        
+        max_prompt_tokens: Optional ceiling; history sections are condensed to fit
+    
     Returns:
         Complete prompt string with system + user context
     """
-    system = PROPONENT_SYSTEM_PROMPT.format(max_words=max_words)
-    
-    # Build context from history
-    context_parts = [f"# DEBATE TOPIC\n{topic}\n"]
-    context_parts.append(f"# CURRENT PHASE: {phase.upper()}")
-    
-    if phase == "opening":
-        context_parts.append("\n## Your Task\nPresent your opening argument FOR the proposition.\n")
-    elif phase == "rebuttal":
-        context_parts.append(f"\n## Round {round_number}\n")
-        # Include opponent's last argument
-        opp_turns = [t for t in history if t.role == "opposition"]
+    system = debater_system_prompt(PROPONENT_SYSTEM_PROMPT, topic, max_words)
+    
+    # Opponent's last argument (rebuttal only)
+    opponent_argument = None
+    if phase == "rebuttal":
+        opp_turns = recent_turns(history, "opposition", 1)
         if opp_turns:
-            last_opp = opp_turns[-1]
-            context_parts.append(f"## Opposition's Last Argument\n{last_opp.content}\n")
-        context_parts.append("## Your Task\nRebut the opposition's arguments and strengthen your case.\n")
-    elif phase == "closing":
-        context_parts.append("\n## Your Task\nDeliver your closing statement. Summarize your strongest points and final appeal.\n")
-    
-    # Include relevant history
-    if history and phase != "opening":
-        context_parts.append("## Prior Arguments (for reference - DO NOT REPEAT)\n")
-        my_turns = [t for t in history if t.role == "proponent"]
-        for turn in my_turns[-2:]:  # Last 2 of my own turns
-            context_parts.append(f"[Your {turn.phase}]: {turn.content[:200]}...\n")
+            opponent_argument = opp_turns[-1].content
     
-    user_prompt = "\n".join(context_parts)
+    # Own prior turns, to avoid repetition
+    prior_notes = []
+    if memory:
+        prior_notes = [f"{memory}\n"]
+    elif history and phase != "opening":
+        prior_notes = [
+            f"[Your {turn.phase}]: {turn.content[:200]}...\n"
+            for turn in recent_turns(history, "proponent", 2)  # Last 2 of my own turns
+        ]
+    
+    def render(opponent_argument: Optional[str], prior_notes: List[str]) -> str:
+        # Build context from history
+        context_parts = [f"# CURRENT PHASE: {phase.upper()}"]
+        
+        if phase == "opening":
+            context_parts.append("\n## Your Task\nPresent your opening argument FOR the proposition.\n")
+        elif phase == "rebuttal":
+            context_parts.append(f"\n## Round {round_number}\n")
+            # Include opponent's last argument
+            if opponent_argument is not None:
+                context_parts.append(f"## Opposition's Last Argument\n{opponent_argument}\n")
+            context_parts.append("## Your Task\nRebut the opposition's arguments and strengthen your case.\n")
+        elif phase == "closing":
+            context_parts.append("\n## Your Task\nDeliver your closing statement. Summarize your strongest points and final appeal.\n")
+        
+        # Include relevant history
+        if prior_notes and phase != "opening":
+            context_parts.append("## Prior Arguments (for reference - DO NOT REPEAT)\n")
+            context_parts.extend(prior_notes)
+        
+        user_prompt = "\n".join(context_parts)
+        
+        return f"{system}{PROMPT_SEPARATOR}{user_prompt}"
+    
+    budget = remaining_budget(max_prompt_tokens, render("" if opponent_argument is not None else None, []))
+    if budget is not None:
+        sections = fit_sections([opponent_argument or "", *prior_notes], budget)
+        if opponent_argument is not None:
+            opponent_argument = sections[0]
+        prior_notes = sections[1:]
     
-    return f"{system}\n\n---\n\n{user_prompt}"
+    return render(opponent_argument, prior_notes)
 
 
 def build_opposition_prompt(
@@ -238,7 +365,9 @@ def build_opposition_prompt(
     phase: str,
     round_number: int,
     history: List[DebateTurn],
-    max_words: int = 400
+    max_words: int = 400,
+    max_prompt_tokens: Optional[int] = None,
+    memory: Optional[str] = None
 ) -> str:
     """
     Construct the full prompt for the opposition agent.
@@ -249,45 +378,71 @@ def build_opposition_prompt(
         round_number: Current round number
         history: Previous debate turns for context
         max_words: Maximum response length
-        
+        max_prompt_tokens: Optional ceiling; history sections are condensed to fit
+    
     Returns:
         Complete prompt string with system + user context
     """
-    system = OPPOSITION_SYSTEM_PROMPT.format(max_words=max_words)
-    
-    # Build context from history
-    context_parts = [f"# DEBATE TOPIC\n{topic}\n"]
-    context_parts.append(f"# CURRENT PHASE: {phase.upper()}")
+    system = debater_system_prompt(OPPOSITION_SYSTEM_PROMPT, topic, max_words)
     
     # Always include proponent's last argument (except in rare edge cases)
-    prop_turns = [t for t in history if t.role == "proponent"]
-    if prop_turns:
-        last_prop = prop_turns[-1]
-        context_parts.append(f"\n## Proponent's Last Argument\n{last_prop.content}\n")
-    
-    if phase == "opening":
-        context_parts.append("\n## Your Task\nPresent your opening argument AGAINST the proposition, responding to the proponent.\n")
-    elif phase == "rebuttal":
-        context_parts.append(f"\n## Round {round_number}\n")
-        context_parts.append("## Your Task\nRebut the proponent's arguments and strengthen your case.\n")
-    elif phase == "closing":
-        context_parts.append("\n## Your Task\nDeliver your closing statement. Summarize your strongest attacks and final appeal.\n")
-    
-    # Include relevant history
-    if len(history) > 1:
-        context_parts.append("## Prior Arguments (for reference - DO NOT REPEAT)\n")
-        my_turns = [t for t in history if t.role == "opposition"]
-        for turn in my_turns[-2:]:  # Last 2 of my own turns
-            context_parts.append(f"[Your {turn.phase}]: {turn.content[:200]}...\n")
+    prop_turns = recent_turns(history, "proponent", 1)
+    proponent_argument = prop_turns[-1].content if prop_turns else None
     
-    user_prompt = "\n".join(context_parts)
+    # Own prior turns, to avoid repetition
+    prior_notes = []
+    if memory:
+        prior_notes = [f"{memory}\n"]
+    elif len(history) > 1:
+        prior_notes = [
+            f"[Your {turn.phase}]: {turn.content[:200]}...\n"
+            for turn in recent_turns(history, "opposition", 2)  # Last 2 of my own turns
+        ]
+    
+    def render(proponent_argument: Optional[str], prior_notes: List[str]) -> str:
+        # Build context from history
+        context_parts = [f"# CURRENT PHASE: {phase.upper()}"]
+        
+        if proponent_argument is not None:
+            context_parts.append(f"\n## Proponent's Last Argument\n{proponent_argument}\n")
+        
+        if phase == "opening":
+            context_parts.append("\n## Your Task\nPresent your opening argument AGAINST the proposition, responding to the proponent.\n")
+        elif phase == "rebuttal":
+            context_parts.append(f"\n## Round {round_number}\n")
+            context_parts.append("## Your Task\nRebut the proponent's arguments and strengthen your case.\n")
+        elif phase == "closing":
+            context_parts.append("\n## Your Task\nDeliver your closing statement. Summarize your strongest attacks and final appeal.\n")
+        
+        # Include relevant history
+        if prior_notes and len(history) > 1:
+            context_parts.append("## Prior Arguments (for reference - DO NOT REPEAT)\n")
+            context_parts.extend(prior_notes)
+        
+        user_prompt = "\n".join(context_parts)
+        
+        return f"{system}{PROMPT_SEPARATOR}{user_prompt}"
     
-    return f"{system}\n\n---\n\n{user_prompt}"
+    budget = remaining_budget(max_prompt_tokens, render("" if proponent_argument is not None else None, []))
+    if budget is not None:
+        sections = fit_sections([proponent_argument or "", *prior_notes], budget)
+        if proponent_argument is not None:
+            proponent_argument = sections[0]
+        prior_notes = sections[1:]
+    
+    return render(proponent_argument, prior_notes)
+
+
+def judge_system_prompt(output_format: str = "markdown") -> str:
+    """Judge system prompt for an output format ("markdown" or "json")."""
+    return JUDGE_JSON_SYSTEM_PROMPT if output_format == "json" else JUDGE_SYSTEM_PROMPT
 
 
 def build_judge_prompt(
     topic: str,
-    history: List[DebateTurn]
+    history: List[DebateTurn],
+    max_prompt_tokens: Optional[int] = None,
+    output_format: str = "markdown"
 ) -> str:
     """
     Construct the full prompt for the judge agent.
@@ -295,24 +450,260 @@ def build_judge_prompt(
     Args:
         topic: The debate proposition
         history: Complete debate history
-        
+        max_prompt_tokens: Optional ceiling; turns are condensed, and the
+            oldest elided, to fit
+        output_format: "markdown" sections or a "json" object
+    
     Returns:
         Complete prompt string for final verdict
     """
-    system = JUDGE_SYSTEM_PROMPT
-    
-    # Build complete debate transcript
-    context_parts = [f"# DEBATE TOPIC\n**{topic}**\n"]
-    context_parts.append("# COMPLETE DEBATE TRANSCRIPT\n")
+    system = judge_system_prompt(output_format)
     
-    for turn in history:
+    def render_turn(turn: DebateTurn, content: str) -> str:
         header = f"## {turn.role.upper()} - {turn.phase.upper()}"
         if turn.phase == "rebuttal":
             header += f" (Round {turn.round_number})"
-        context_parts.append(f"{header}\n{turn.content}\n")
+        return f"{header}\n{content}\n"
+    
+    def render(transcript: List[str]) -> str:
+        # Build complete debate transcript
+        context_parts = [f"# DEBATE TOPIC\n**{topic}**\n"]
+        context_parts.append("# COMPLETE DEBATE TRANSCRIPT\n")
+        context_parts.extend(transcript)
+        context_parts.append("\n---\n\n## Your Task\nAnalyze the debate above and render your verdict following the required format.\n")
+        
+        user_prompt = "\n".join(context_parts)
+        
+        return f"{system}{PROMPT_SEPARATOR}{user_prompt}"
+    
+    budget = remaining_budget(max_prompt_tokens, render([]))
+    if budget is None:
+        transcript = [render_turn(turn, turn.content) for turn in history]
+    else:
+        transcript = fit_turns(history, budget, render_turn)
+    
+    return render(transcript)
+
+
+def build_round_scorer_prompt(
+    topic: str,
+    phase: str,
+    round_number: int,
+    turns: List[DebateTurn],
+    max_prompt_tokens: Optional[int] = None
+) -> str:
+    """
+    Construct the prompt for scoring a single exchange.
+    
+    Args:
+        topic: The debate proposition
+        phase: Phase of the exchange (opening or rebuttal)
+        round_number: Round of the exchange (0 for opening)
+        turns: The proponent and opposition turns of the exchange
+        max_prompt_tokens: Optional ceiling; turns are condensed to fit
+    
+    Returns:
+        Complete prompt string for the round scorer
+    """
+    system = ROUND_SCORER_SYSTEM_PROMPT
+    label = phase.upper() if phase == "opening" else f"ROUND {round_number}"
+    
+    def render_turn(turn: DebateTurn, content: str) -> str:
+        return f"## {turn.role.upper()}\n{content}\n"
+    
+    def render(exchange: List[str]) -> str:
+        context_parts = [f"# DEBATE TOPIC\n**{topic}**\n"]
+        context_parts.append(f"# EXCHANGE TO SCORE: {label}\n")
+        context_parts.extend(exchange)
+        context_parts.append("\n---\n\n## Your Task\nScore this exchange following the required format.\n")
+        
+        user_prompt = "\n".join(context_parts)
+        
+        return f"{system}{PROMPT_SEPARATOR}{user_prompt}"
+    
+    budget = remaining_budget(max_prompt_tokens, render([]))
+    if budget is None:
+        exchange = [render_turn(turn, turn.content) for turn in turns]
+    else:
+        exchange = fit_turns(turns, budget, render_turn)
+    
+    return render(exchange)
+
+
+def build_scorecard_judge_prompt(
+    topic: str,
+    scorecards: List[Dict[str, Any]],
+    closing_turns: List[DebateTurn],
+    max_prompt_tokens: Optional[int] = None,
+    output_format: str = "markdown"
+) -> str:
+    """
+    Construct a compact judge prompt from per-round scorecards.
+    
+    Used with incremental judging: earlier exchanges are represented by
+    their scorecards, and only the closing statements appear verbatim.
+    
+    Args:
+        topic: The debate proposition
+        scorecards: Round scorecards in debate order
+        closing_turns: Closing statements from both sides
+        max_prompt_tokens: Optional ceiling; sections are condensed to fit
+        output_format: "markdown" sections or a "json" object
+    
+    Returns:
+        Complete prompt string for final verdict
+    """
+    system = judge_system_prompt(output_format)
+    
+    cards = []
+    for card in scorecards:
+        label = "OPENING" if card["phase"] == "opening" else f"ROUND {card['round_number']}"
+        proponent = card.get("proponent_score")
+        opposition = card.get("opposition_score")
+        cards.append(
+            f"## {label} - Proponent {proponent if proponent is not None else '?'}/10, "
+            f"Opposition {opposition if opposition is not None else '?'}/10\n{card['notes']}\n"
+        )
+    
+    closings = [f"## {turn.role.upper()} - CLOSING\n{turn.content}\n" for turn in closing_turns]
+    
+    def render(cards: List[str], closings: List[str]) -> str:
+        context_parts = [f"# DEBATE TOPIC\n**{topic}**\n"]
+        context_parts.append("# ROUND SCORECARDS\n")
+        context_parts.extend(cards)
+        context_parts.append("# CLOSING STATEMENTS\n")
+        context_parts.extend(closings)
+        context_parts.append(
+            "\n---\n\n## Your Task\nThe scorecards above were recorded as the debate progressed. "
+            "Aggregate them with the closing statements and render your verdict following the required format.\n"
+        )
+        
+        user_prompt = "\n".join(context_parts)
+        
+        return f"{system}{PROMPT_SEPARATOR}{user_prompt}"
+    
+    budget = remaining_budget(max_prompt_tokens, render([], []))
+    if budget is not None:
+        sections = fit_sections(cards + closings, budget)
+        cards, closings = sections[:len(cards)], sections[len(cards):]
+    
+    return render(cards, closings)
+
+
+def build_section_repair_prompt(
+    role: str,
+    topic: str,
+    response: str,
+    missing_headers: List[str],
+    max_words: int = 40
+) -> str:
+    """
+    Construct the prompt asking only for a turn's missing sections.
+    
+    Args:
+        role: Agent role whose response is incomplete
+        topic: The debate proposition
+        response: The response as generated
+        missing_headers: Required headers the response lacks, in format order
+        max_words: Word limit per missing section
+    
+    Returns:
+        Complete prompt string for the section repair call
+    """
+    system = SECTION_REPAIR_SYSTEM_PROMPT.format(max_words=max_words)
+    side = "FOR" if role == "proponent" else "AGAINST"
     
-    context_parts.append("\n---\n\n## Your Task\nAnalyze the debate above and render your verdict following the required format.\n")
+    context_parts = [f"# DEBATE TOPIC\n**{topic}**\n"]
+    context_parts.append(f"# EXISTING RESPONSE ({role.upper()}, arguing {side})\n{response}\n")
+    context_parts.append("# MISSING SECTIONS\n" + "\n".join(f"## {header}" for header in missing_headers) + "\n")
+    context_parts.append("---\n\n## Your Task\nWrite only the missing sections above.\n")
     
     user_prompt = "\n".join(context_parts)
     
-    return f"{system}\n\n---\n\n{user_prompt}"
+    return f"{system}{PROMPT_SEPARATOR}{user_prompt}"
+
+
+# ============================================================================
+# Chat Message Layout
+# ============================================================================
+
+def split_prompt(prompt: str) -> tuple[str, str]:
+    """
+    Split a prompt from a build_*_prompt function into system and user parts.
+    
+    Args:
+        prompt: Flattened prompt string
+    
+    Returns:
+        Tuple of (system part, user part); system is "" if there is none
+    """
+    system, separator, user = prompt.partition(PROMPT_SEPARATOR)
+    if not separator:
+        return "", prompt
+    return system, user
+
+
+def mark_cache_breakpoint(message: BaseMessage) -> BaseMessage:
+    """
+    Return a copy of a message tagged as a prompt-cache breakpoint.
+    
+    Providers with explicit prompt caching (e.g. Anthropic and Gemini via
+    OpenRouter) cache everything up to a block carrying cache_control.
+    
+    Args:
+        message: Message whose content ends the cacheable prefix
+    
+    Returns:
+        Message with its text as a single content block with cache_control
+    """
+    return message.model_copy(update={"content": [{
+        "type": "text",
+        "text": message.content,
+        "cache_control": {"type": "ephemeral"},
+    }]})
+
+
+def build_messages(prompt: str, cache_hints: bool = False) -> List[BaseMessage]:
+    """
+    Turn a flattened prompt into a stable SystemMessage plus a HumanMessage.
+    
+    The system part (a role's instructions, plus the topic for debaters)
+    is byte-identical across a debate's calls for that role, so providers
+    can serve it from their prompt cache once it reaches their minimum
+    cacheable length.
+    
+    Args:
+        prompt: Prompt string from a build_*_prompt function
+        cache_hints: Add a cache_control breakpoint after the system part for
+            explicit-cache providers, if it is long enough to be cached
+    
+    Returns:
+        Message list ready for the chat model
+    """
+    system, user = split_prompt(prompt)
+    messages: List[BaseMessage] = [HumanMessage(content=user)]
+    if system:
+        messages.insert(0, SystemMessage(content=system))
+    
+    if cache_hints and system and estimate_tokens(system) >= MIN_CACHEABLE_TOKENS:
+        messages[0] = mark_cache_breakpoint(messages[0])
+    return messages
+
+
+def messages_text(messages: List[BaseMessage]) -> str:
+    """
+    Flatten messages into one string for token estimates and cache keys.
+    
+    Args:
+        messages: Chat messages
+    
+    Returns:
+        Role-tagged concatenation of the message texts
+    """
+    parts = []
+    for message in messages:
+        content = message.content
+        if isinstance(content, list):
+            content = "".join(block.get("text", "") for block in content if isinstance(block, dict))
+        parts.append(f"[{message.type}]\n{content}")
+    return "\n\n".join(parts)
@@ -0,0 +1,297 @@
+"""
+Token-bucket rate limiting for the Multi-Agent Debate System.
+
+All agents and concurrent debates draw from the same buckets, one for
+requests per minute and one for tokens per minute, so traffic stays at the
+provider quota instead of bursting into 429s and retry storms.
+
+Buckets live in memory (shared by every thread and coroutine in the
+process) or, when a path is configured, in a SQLite file so several worker
+processes on one machine share the same quota.
+"""
+
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from .config import DebateConfig
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Token Bucket Limiter
+# ============================================================================
+
+class TokenBucketLimiter:
+    """
+    Requests/min and tokens/min token buckets with blocking acquire.
+    
+    A bucket refills continuously at its per-minute rate up to one minute's
+    worth of capacity. acquire() takes one request and the estimated tokens
+    atomically, waiting until both buckets can cover them.
+    """
+    
+    def __init__(
+        self,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        path: Optional[str] = None,
+        name: str = "default",
+    ):
+        """
+        Args:
+            requests_per_minute: Request quota (unlimited if None)
+            tokens_per_minute: Token quota (unlimited if None)
+            path: SQLite file for cross-process buckets (in-memory if None)
+            name: Bucket namespace inside the SQLite file
+        """
+        self.name = name
+        self.path = path
+        self._rates: Dict[str, float] = {}
+        if requests_per_minute:
+            self._rates["requests"] = requests_per_minute / 60.0
+        if tokens_per_minute:
+            self._rates["tokens"] = tokens_per_minute / 60.0
+        
+        self._lock = threading.Lock()
+        now = time.monotonic()
+        # bucket -> (level, updated_at); buckets start full
+        self._levels: Dict[str, Tuple[float, float]] = {
+            bucket: (rate * 60.0, now) for bucket, rate in self._rates.items()
+        }
+        # Separate lock: the bucket lock can be held through a SQLite busy wait
+        self._metrics_lock = threading.Lock()
+        self._metrics = {"acquired": 0, "waited": 0, "wait_seconds": 0.0, "max_wait_seconds": 0.0}
+        
+        self._db: Optional[sqlite3.Connection] = None
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # Autocommit mode so BEGIN IMMEDIATE controls the transactions
+            self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS buckets ("
+                "name TEXT NOT NULL, bucket TEXT NOT NULL, level REAL NOT NULL, "
+                "updated_at REAL NOT NULL, PRIMARY KEY (name, bucket))"
+            )
+    
+    @property
+    def enabled(self) -> bool:
+        """Whether any quota is configured."""
+        return bool(self._rates)
+    
+    def _refill(self, bucket: str, level: float, updated_at: float, now: float) -> float:
+        """Return the bucket level after refilling from updated_at to now."""
+        rate = self._rates[bucket]
+        return min(rate * 60.0, level + (now - updated_at) * rate)
+    
+    def _take(self, levels: Dict[str, Tuple[float, float]], amounts: Dict[str, float], now: float) -> float:
+        """
+        Try to take amounts from refilled levels, updating them in place.
+        
+        Returns:
+            0.0 if taken, otherwise the seconds to wait before retrying
+        """
+        refilled = {
+            bucket: self._refill(bucket, *levels[bucket], now) for bucket in self._rates
+        }
+        
+        wait = 0.0
+        for bucket, amount in amounts.items():
+            # Never ask for more than a full bucket, or we would wait forever
+            amount = min(amount, self._rates[bucket] * 60.0)
+            if refilled[bucket] < amount:
+                wait = max(wait, (amount - refilled[bucket]) / self._rates[bucket])
+        
+        if wait == 0.0:
+            for bucket, amount in amounts.items():
+                refilled[bucket] -= min(amount, self._rates[bucket] * 60.0)
+        
+        for bucket, level in refilled.items():
+            levels[bucket] = (level, now)
+        return wait
+    
+    def _try_acquire(self, amounts: Dict[str, float]) -> float:
+        """Atomically take amounts from every bucket or report the wait needed."""
+        amounts = {bucket: amount for bucket, amount in amounts.items() if bucket in self._rates}
+        
+        with self._lock:
+            if self._db is None:
+                return self._take(self._levels, amounts, time.monotonic())
+            
+            # Wall-clock time: monotonic clocks are not comparable across processes
+            now = time.time()
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._db.execute(
+                    "SELECT bucket, level, updated_at FROM buckets WHERE name = ?", (self.name,)
+                ).fetchall()
+                levels = {bucket: (rate * 60.0, now) for bucket, rate in self._rates.items()}
+                levels.update({bucket: (level, updated) for bucket, level, updated in rows if bucket in levels})
+                
+                wait = self._take(levels, amounts, now)
+                
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO buckets (name, bucket, level, updated_at) VALUES (?, ?, ?, ?)",
+                    [(self.name, bucket, level, updated) for bucket, (level, updated) in levels.items()],
+                )
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+            return wait
+    
+    def _record_wait(self, waited: float) -> None:
+        """Update wait-time metrics after an acquire."""
+        with self._metrics_lock:
+            self._metrics["acquired"] += 1
+            if waited > 0:
+                self._metrics["waited"] += 1
+                self._metrics["wait_seconds"] += waited
+                self._metrics["max_wait_seconds"] = max(self._metrics["max_wait_seconds"], waited)
+    
+    def acquire(self, tokens: float = 0) -> float:
+        """
+        Block until one request and `tokens` tokens are available.
+        
+        Args:
+            tokens: Estimated tokens the request will consume
+        
+        Returns:
+            Seconds spent waiting
+        """
+        if not self.enabled:
+            return 0.0
+        
+        start = time.monotonic()
+        waited = 0.0
+        while True:
+            wait = self._try_acquire({"requests": 1, "tokens": tokens})
+            if wait == 0.0:
+                break
+            time.sleep(wait)
+            waited = time.monotonic() - start
+        
+        self._record_wait(waited)
+        if waited > 0:
+            logger.debug(f"Rate limiter waited {waited:.2f}s")
+        return waited
+    
+    async def aacquire(self, tokens: float = 0) -> float:
+        """
+        Async version of acquire; waits with asyncio.sleep.
+        
+        With SQLite buckets each attempt runs in a worker thread: another
+        process holding the database lock would otherwise block the event
+        loop (and every debate on it) for up to the 30s busy timeout.
+        
+        Args:
+            tokens: Estimated tokens the request will consume
+        
+        Returns:
+            Seconds spent waiting
+        """
+        if not self.enabled:
+            return 0.0
+        
+        start = time.monotonic()
+        waited = 0.0
+        while True:
+            amounts = {"requests": 1, "tokens": tokens}
+            if self._db is None:
+                wait = self._try_acquire(amounts)
+            else:
+                wait = await asyncio.to_thread(self._try_acquire, amounts)
+            if wait == 0.0:
+                break
+            await asyncio.sleep(wait)
+            waited = time.monotonic() - start
+        
+        self._record_wait(waited)
+        if waited > 0:
+            logger.debug(f"Rate limiter waited {waited:.2f}s")
+        return waited
+    
+    def settle(self, token_delta: float) -> None:
+        """
+        Correct the token bucket once actual usage is known.
+        
+        Args:
+            token_delta: Actual minus reserved tokens (negative refunds)
+        """
+        if "tokens" not in self._rates or token_delta == 0:
+            return
+        
+        with self._lock:
+            if self._db is None:
+                level, updated_at = self._levels["tokens"]
+                self._levels["tokens"] = (level - token_delta, updated_at)
+                return
+            
+            self._db.execute(
+                "UPDATE buckets SET level = level - ? WHERE name = ? AND bucket = 'tokens'",
+                (token_delta, self.name),
+            )
+    
+    async def asettle(self, token_delta: float) -> None:
+        """
+        Async version of settle; SQLite updates run in a worker thread.
+        
+        Args:
+            token_delta: Actual minus reserved tokens (negative refunds)
+        """
+        if self._db is None:
+            self.settle(token_delta)
+        else:
+            await asyncio.to_thread(self.settle, token_delta)
+    
+    def stats(self) -> Dict[str, float]:
+        """Return acquire counts and wait-time metrics."""
+        with self._metrics_lock:
+            return dict(self._metrics)
+
+
+# ============================================================================
+# Shared Instances
+# ============================================================================
+
+_limiters: Dict[Tuple, TokenBucketLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(config: DebateConfig) -> Optional[TokenBucketLimiter]:
+    """
+    Get the process-wide rate limiter for a configuration.
+    
+    Every agent and debate using the same quota settings shares one
+    limiter (and, with rate_limit_path, one set of on-disk buckets).
+    
+    Args:
+        config: Debate configuration with rate limit settings
+    
+    Returns:
+        TokenBucketLimiter, or None if no quota is configured
+    """
+    rpm = config.rate_limit_requests_per_minute
+    tpm = config.rate_limit_tokens_per_minute
+    if not rpm and not tpm:
+        return None
+    
+    key = (rpm, tpm, config.rate_limit_path)
+    
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = TokenBucketLimiter(
+                requests_per_minute=rpm,
+                tokens_per_minute=tpm,
+                path=config.rate_limit_path,
+            )
+            _limiters[key] = limiter
+        return limiter
@@ -0,0 +1,250 @@
+"""
+Reasoning-model support for the Multi-Agent Debate System.
+
+Reasoning models (DeepSeek R1 and its merges, the defaults here) can spend
+thousands of tokens thinking before they answer. This module:
+- Builds OpenRouter's `reasoning` request parameter from per-role effort
+  or token budgets, so debaters and judges can think as much as they need
+- Sizes the completion max_tokens so reasoning can't crowd out the answer
+- Separates inline <think> blocks from the answer while it streams, so
+  reasoning is never shown, counted as answer words or truncated into turns
+"""
+
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config import DebateConfig
+
+# Share of max_tokens OpenRouter lets each effort level spend on reasoning
+REASONING_EFFORT_SHARE = {
+    "minimal": 0.1,
+    "low": 0.2,
+    "medium": 0.5,
+    "high": 0.8,
+}
+
+# Reasoning headroom for a known reasoning model when no effort or budget is
+# configured; reasoning models routinely think for a few thousand tokens
+DEFAULT_REASONING_ALLOWANCE = 4000
+
+# Model ids (after the provider prefix) that reason by default
+REASONING_MODEL_PREFIXES = ("o1", "o3", "o4", "deepseek-r1", "qwq", "magistral")
+REASONING_MODEL_MARKERS = ("-r1", "thinking", "reasoner")
+
+OPEN_TAGS = ("<think>", "<thinking>")
+CLOSE_TAGS = ("</think>", "</thinking>")
+
+_LONGEST_TAG = max(len(tag) for tag in OPEN_TAGS + CLOSE_TAGS)
+
+
+# ============================================================================
+# Request Parameters
+# ============================================================================
+
+def reasoning_settings(config: DebateConfig, role: str) -> Tuple[Optional[str], Optional[int]]:
+    """
+    Reasoning effort and token budget configured for a role.
+    
+    Args:
+        config: Debate configuration
+        role: "debater" (proponent and opposition) or "judge" (judges,
+            panel judges and the round scorer)
+    
+    Returns:
+        Tuple of (effort, max reasoning tokens); either may be None
+    """
+    if role == "judge":
+        return config.judge_reasoning_effort, config.judge_reasoning_max_tokens
+    return config.debater_reasoning_effort, config.debater_reasoning_max_tokens
+
+
+def is_reasoning_model(model_name: str) -> bool:
+    """
+    Whether a model is known to reason before answering.
+    
+    Args:
+        model_name: OpenRouter model id, e.g. "deepseek/deepseek-r1:free"
+    
+    Returns:
+        True for reasoning model families (o-series, DeepSeek R1 and its
+        merges, QwQ, Magistral, "thinking" and "reasoner" variants)
+    """
+    model_id = model_name.lower().rpartition("/")[2]
+    return model_id.startswith(REASONING_MODEL_PREFIXES) or any(
+        marker in model_id for marker in REASONING_MODEL_MARKERS
+    )
+
+
+def reasoning_request(config: DebateConfig, role: str) -> Optional[Dict[str, Any]]:
+    """
+    OpenRouter `reasoning` parameter for a role.
+    
+    A token budget takes precedence over an effort level, since OpenRouter
+    accepts only one of them. Models without reasoning ignore the parameter.
+    
+    Args:
+        config: Debate configuration
+        role: "debater" or "judge"
+    
+    Returns:
+        The parameter, or None to leave the model's default
+    """
+    effort, max_tokens = reasoning_settings(config, role)
+    if max_tokens:
+        return {"max_tokens": max_tokens}
+    if effort:
+        return {"effort": effort}
+    return None
+
+
+def reasoning_allowance(config: DebateConfig, role: str, answer_tokens: int) -> int:
+    """
+    Completion tokens to add to an answer's cap for reasoning.
+    
+    With an effort level, OpenRouter sizes the reasoning budget as a share
+    of max_tokens, so the allowance keeps answer_tokens free for the answer.
+    With neither an effort nor a budget, only known reasoning models get
+    DEFAULT_REASONING_ALLOWANCE; other models get nothing, so their cap
+    stays the answer's own.
+    
+    Args:
+        config: Debate configuration (its model_name is the model called)
+        role: "debater" or "judge"
+        answer_tokens: Tokens the answer itself needs
+    
+    Returns:
+        Extra completion tokens
+    """
+    effort, max_tokens = reasoning_settings(config, role)
+    if max_tokens:
+        return max_tokens
+    if effort:
+        share = REASONING_EFFORT_SHARE[effort]
+        return math.ceil(answer_tokens * share / (1 - share))
+    if is_reasoning_model(config.model_name):
+        return DEFAULT_REASONING_ALLOWANCE
+    return 0
+
+
+# ============================================================================
+# Reasoning Stripping
+# ============================================================================
+
+def _find_tag(text: str, tags: Tuple[str, ...]) -> Tuple[int, str]:
+    """Earliest case-insensitive occurrence of any tag, as (index, tag)."""
+    lowered = text.lower()
+    found = [(lowered.find(tag), tag) for tag in tags]
+    found = [(index, tag) for index, tag in found if index >= 0]
+    return min(found) if found else (-1, "")
+
+
+class ReasoningFilter:
+    """
+    Separates inline reasoning blocks from streamed answer text.
+    
+    Feed it raw deltas as they arrive; it returns only answer text, holding
+    back a possible partial tag until the next delta decides it. A closing
+    tag without an opening one (some R1 variants omit <think>) turns
+    everything before it into reasoning.
+    """
+    
+    def __init__(self):
+        self._answer: List[str] = []
+        self._reasoning: List[str] = []
+        self._buffer = ""
+        self._in_reasoning = False
+    
+    @property
+    def answer(self) -> str:
+        """Answer text seen so far."""
+        return "".join(self._answer)
+    
+    @property
+    def reasoning(self) -> str:
+        """Reasoning text seen so far."""
+        return "".join(self._reasoning)
+    
+    def feed(self, delta: str) -> str:
+        """
+        Process a streamed delta.
+        
+        Args:
+            delta: Raw text from the model
+        
+        Returns:
+            The answer text it completes ("" while reasoning)
+        """
+        self._buffer += delta
+        emitted = []
+        
+        while True:
+            if self._in_reasoning:
+                index, tag = _find_tag(self._buffer, CLOSE_TAGS)
+                if index < 0:
+                    break
+                self._reasoning.append(self._buffer[:index])
+                self._buffer = self._buffer[index + len(tag):]
+                self._in_reasoning = False
+                continue
+            
+            index, tag = _find_tag(self._buffer, OPEN_TAGS)
+            close_index, close_tag = _find_tag(self._buffer, CLOSE_TAGS)
+            if close_index >= 0 and (index < 0 or close_index < index):
+                # Orphan closing tag: the answer so far was reasoning
+                self._reasoning.extend(self._answer + [self._buffer[:close_index]])
+                self._answer, emitted = [], []
+                self._buffer = self._buffer[close_index + len(close_tag):]
+                continue
+            if index < 0:
+                break
+            emitted.append(self._buffer[:index])
+            self._answer.append(self._buffer[:index])
+            self._buffer = self._buffer[index + len(tag):]
+            self._in_reasoning = True
+        
+        # Hold back a suffix that could still become a tag
+        keep = 0
+        tail = self._buffer[-(_LONGEST_TAG - 1):].lower()
+        for size in range(len(tail), 0, -1):
+            if any(tag.startswith(tail[-size:]) for tag in OPEN_TAGS + CLOSE_TAGS):
+                keep = size
+                break
+        
+        ready, self._buffer = self._buffer[:len(self._buffer) - keep], self._buffer[len(self._buffer) - keep:]
+        (self._reasoning if self._in_reasoning else self._answer).append(ready)
+        if not self._in_reasoning:
+            emitted.append(ready)
+        return "".join(emitted)
+    
+    def flush(self) -> str:
+        """
+        Release held-back text at the end of the stream.
+        
+        Returns:
+            Any final answer text
+        """
+        rest, self._buffer = self._buffer, ""
+        if self._in_reasoning:
+            self._reasoning.append(rest)
+            return ""
+        self._answer.append(rest)
+        return rest
+
+
+def split_reasoning(text: str) -> Tuple[str, str]:
+    """
+    Split a complete response into answer and reasoning text.
+    
+    Args:
+        text: Raw model output
+    
+    Returns:
+        Tuple of (answer, reasoning)
+    """
+    if "<" not in text:
+        return text, ""
+    
+    reasoning_filter = ReasoningFilter()
+    reasoning_filter.feed(text)
+    reasoning_filter.flush()
+    return reasoning_filter.answer, reasoning_filter.reasoning
@@ -0,0 +1,391 @@
+"""
+Process-wide registry of compiled debate graphs and LLM clients.
+
+Building a debate graph compiles a new StateGraph and, without sharing,
+opens a fresh HTTP connection pool per agent. The registry caches both,
+keyed by a hash of the DebateConfig fields that affect them, so repeated
+debates in the same process pay compile and TLS-handshake cost once.
+
+Entries live until explicitly evicted with evict() or close_registry().
+Async connection pools are bound to an event loop, so entries created
+inside a running loop are scoped to that loop; sync callers share one
+process-wide scope. The exception is a loop's async checkpointer, which
+only lives while async debates using it run (see checkpoint_lease).
+
+A loop's async pools can only be closed on that loop: evict() and
+close_registry() leave them open (with a warning) for aclose_registry()
+to close when it next runs on the loop.
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import weakref
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
+
+import httpx
+from langchain_openai import ChatOpenAI
+
+from .config import DebateConfig
+from .agents import create_llm_client
+
+logger = logging.getLogger(__name__)
+
+
+# Fields that determine how an LLM client talks to the provider
+CLIENT_KEY_FIELDS = (
+    "openrouter_api_key",
+    "openrouter_base_url",
+    "mock_llm_url",
+    "model_name",
+    "temperature",
+)
+
+# Fields that never change the compiled graph (read from state at runtime)
+GRAPH_KEY_EXCLUDE = {"max_rounds"}
+
+
+# ============================================================================
+# Config Fingerprinting
+# ============================================================================
+
+def config_fingerprint(
+    config: DebateConfig,
+    include: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+) -> str:
+    """
+    Compute a stable hash of selected configuration fields.
+    
+    Args:
+        config: Debate configuration to fingerprint
+        include: Only hash these fields (all fields if None)
+        exclude: Fields to leave out of the hash
+    
+    Returns:
+        Hex digest identifying the configuration
+    """
+    data = config.model_dump(
+        mode="json",
+        include=set(include) if include is not None else None,
+        exclude=set(exclude) if exclude is not None else None,
+    )
+    payload = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+# ============================================================================
+# Registry
+# ============================================================================
+
+class _ClientEntry:
+    """A shared LLM client together with the HTTP pools it owns."""
+    
+    def __init__(self, config: DebateConfig, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """
+        Args:
+            config: Debate configuration with API settings
+            loop: Event loop the async pool is bound to (None for the sync scope)
+        """
+        self.loop = loop
+        self.http_client = httpx.Client()
+        self.http_async_client = httpx.AsyncClient()
+        self.llm = create_llm_client(
+            config,
+            http_client=self.http_client,
+            http_async_client=self.http_async_client,
+        )
+    
+    def close(self) -> None:
+        """
+        Close the owned connection pools from sync code.
+        
+        The async pool of a loop-scoped entry is left open: it can only be
+        closed on its own loop, by aclose().
+        """
+        self.http_client.close()
+        if self.loop is not None:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop running: safe to drive the async close ourselves
+            try:
+                asyncio.run(self.http_async_client.aclose())
+            except Exception as e:
+                logger.debug(f"Async HTTP client close failed: {e}")
+        else:
+            logger.warning("Event loop running; left the async HTTP pool open (use aclose_registry())")
+    
+    async def aclose(self) -> None:
+        """Close the owned connection pools from async code."""
+        self.http_client.close()
+        await self.http_async_client.aclose()
+
+
+class _Scope:
+    """Cached clients and graphs for one event loop (or for sync callers)."""
+    
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.loop = loop
+        self.clients: Dict[str, _ClientEntry] = {}
+        self.graphs: Dict[str, Any] = {}
+        self.graph_client_keys: Dict[str, set] = {}  # graph key -> client keys it uses
+        self.checkpointers: Dict[str, Any] = {}  # checkpoint path -> saver
+        self.checkpoint_leases: Dict[str, int] = {}  # checkpoint path -> runs using its saver
+        self.unclosed: List[_ClientEntry] = []  # dropped entries whose async pool awaits aclose_registry
+    
+    def pop_all(self) -> tuple:
+        """Empty the scope and return its client entries and savers for closing."""
+        entries = [*self.clients.values(), *self.unclosed]
+        savers = list(self.checkpointers.values())
+        self.clients.clear()
+        self.unclosed.clear()
+        self.graphs.clear()
+        self.graph_client_keys.clear()
+        self.checkpointers.clear()
+        return entries, savers
+
+
+_lock = threading.RLock()
+_sync_scope = _Scope()
+# Async pools cannot outlive their loop, so each running loop gets its own
+# scope; entries disappear with the loop once it is garbage collected.
+_loop_scopes: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _Scope]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _current_scope() -> _Scope:
+    """Return the scope for the calling context. Must hold _lock."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return _sync_scope
+    
+    scope = _loop_scopes.get(loop)
+    if scope is None:
+        scope = _Scope(loop)
+        _loop_scopes[loop] = scope
+    return scope
+
+
+def _all_scopes() -> list:
+    """Return every live scope. Must hold _lock."""
+    return [_sync_scope, *_loop_scopes.values()]
+
+
+def _close_entries(scope: _Scope, entries: List[_ClientEntry]) -> None:
+    """
+    Close dropped client entries from sync code.
+    
+    Async pools bound to the scope's loop are left open and queued for
+    aclose_registry() on that loop.
+    """
+    for entry in entries:
+        entry.close()
+    
+    if scope.loop is None or not entries:
+        return
+    
+    if scope.loop.is_closed():
+        logger.warning(f"Dropped {len(entries)} async HTTP connection pool(s) of a closed event loop unclosed")
+        return
+    
+    with _lock:
+        scope.unclosed.extend(entries)
+    logger.warning(
+        f"Left {len(entries)} async HTTP connection pool(s) open: they belong to an event loop; "
+        f"await aclose_registry() on that loop to close them"
+    )
+
+
+def get_llm_client(config: DebateConfig) -> ChatOpenAI:
+    """
+    Get the shared LLM client for a configuration, creating it if needed.
+    
+    Args:
+        config: Debate configuration with API settings
+    
+    Returns:
+        ChatOpenAI instance shared by every graph with the same client settings
+    """
+    key = config_fingerprint(config, include=CLIENT_KEY_FIELDS)
+    
+    with _lock:
+        scope = _current_scope()
+        entry = scope.clients.get(key)
+        if entry is None:
+            logger.info(f"Creating shared LLM client for {config.model_name} ({key})")
+            entry = _ClientEntry(config, scope.loop)
+            scope.clients[key] = entry
+        return entry.llm
+
+
+def get_debate_graph(config: DebateConfig):
+    """
+    Get the compiled debate graph for a configuration, compiling it once.
+    
+    Args:
+        config: Debate configuration
+    
+    Returns:
+        Compiled LangGraph StateGraph shared across debates
+    """
+    # Imported here: graph.py depends on this module for shared clients
+    from .graph import create_checkpointer, create_debate_graph
+    
+    key = config_fingerprint(config, exclude=GRAPH_KEY_EXCLUDE)
+    
+    with _lock:
+        scope = _current_scope()
+        graph = scope.graphs.get(key)
+        if graph is None:
+            checkpointer = None
+            if config.checkpoint_enabled:
+                checkpointer = scope.checkpointers.get(config.checkpoint_path)
+                if checkpointer is None:
+                    checkpointer = create_checkpointer(config)
+                    scope.checkpointers[config.checkpoint_path] = checkpointer
+            
+            graph = create_debate_graph(config, checkpointer=checkpointer)
+            scope.graphs[key] = graph
+            scope.graph_client_keys[key] = {
+                config_fingerprint(graph_config, include=CLIENT_KEY_FIELDS)
+                for graph_config in [
+                    config,
+                    *(config.model_copy(update={"model_name": m}) for m in config.judge_models),
+                    config.model_copy(update={"model_name": config.scorer_model or config.model_name}),
+                ]
+            }
+        return graph
+
+
+@contextlib.asynccontextmanager
+async def checkpoint_lease(config: DebateConfig) -> AsyncIterator[None]:
+    """
+    Keep the running loop's async checkpointer open while a debate uses it.
+    
+    aiosqlite runs each connection on a non-daemon worker thread, so a
+    saver left open would keep the interpreter from exiting after
+    asyncio.run(). Async entry points hold a lease around their run; when
+    the last lease on a checkpoint path is released, its saver is closed
+    and the graphs compiled with it are dropped. The next run on the loop
+    opens a new one.
+    
+    Args:
+        config: Configuration of the run (a no-op without checkpointing)
+    """
+    if not config.checkpoint_enabled:
+        yield
+        return
+    
+    path = config.checkpoint_path
+    with _lock:
+        scope = _current_scope()
+        scope.checkpoint_leases[path] = scope.checkpoint_leases.get(path, 0) + 1
+    
+    try:
+        yield
+    finally:
+        saver = None
+        with _lock:
+            scope.checkpoint_leases[path] -= 1
+            if not scope.checkpoint_leases[path]:
+                del scope.checkpoint_leases[path]
+                saver = scope.checkpointers.pop(path, None)
+                for key, graph in list(scope.graphs.items()):
+                    if saver is not None and graph.checkpointer is saver:
+                        del scope.graphs[key]
+                        scope.graph_client_keys.pop(key, None)
+        
+        if saver is not None:
+            await saver.conn.close()
+
+
+def evict(config: DebateConfig) -> None:
+    """
+    Drop the cached graph and client for a configuration.
+    
+    The client's connection pools are closed, except async pools bound to
+    an event loop, which are left for aclose_registry() on that loop.
+    Graphs built on that client are evicted as well, since they would
+    otherwise hold a closed client.
+    
+    Args:
+        config: Configuration whose entries should be removed
+    """
+    client_key = config_fingerprint(config, include=CLIENT_KEY_FIELDS)
+    graph_key = config_fingerprint(config, exclude=GRAPH_KEY_EXCLUDE)
+    entries = []
+    
+    with _lock:
+        for scope in _all_scopes():
+            scope.graphs.pop(graph_key, None)
+            scope.graph_client_keys.pop(graph_key, None)
+            entry = scope.clients.pop(client_key, None)
+            if entry is not None:
+                entries.append((scope, entry))
+            
+            # Any other graph sharing this client must go too
+            for key, graph_client_keys in list(scope.graph_client_keys.items()):
+                if client_key in graph_client_keys:
+                    scope.graphs.pop(key, None)
+                    del scope.graph_client_keys[key]
+    
+    for scope, entry in entries:
+        _close_entries(scope, [entry])
+
+
+def close_registry() -> None:
+    """
+    Drop every cached graph and close every shared client.
+    
+    Async connection pools and checkpointers owned by event loops cannot
+    be closed from here: the pools are left for aclose_registry() on
+    their loop (with a warning), and the checkpointers are dropped
+    without closing. Call aclose_registry() from inside each loop to
+    close them cleanly.
+    """
+    with _lock:
+        scopes = _all_scopes()
+        popped = [scope.pop_all() for scope in scopes]
+    
+    for scope, (entries, savers) in zip(scopes, popped):
+        _close_entries(scope, entries)
+        for saver in savers:
+            if isinstance(saver.conn, sqlite3.Connection):
+                saver.conn.close()
+
+
+async def aclose_registry() -> None:
+    """
+    Drop and close the entries owned by the running event loop.
+    
+    Call this before the loop shuts down (e.g. at the end of the coroutine
+    passed to asyncio.run) so async connection pools are closed cleanly.
+    """
+    with _lock:
+        entries, savers = _current_scope().pop_all()
+    
+    for entry in entries:
+        await entry.aclose()
+    for saver in savers:
+        if isinstance(saver.conn, sqlite3.Connection):
+            saver.conn.close()
+        else:
+            await saver.conn.close()
+
+
+def registry_stats() -> Dict[str, int]:
+    """Return the number of cached graphs and clients across all scopes."""
+    with _lock:
+        scopes = _all_scopes()
+        return {
+            "graphs": sum(len(scope.graphs) for scope in scopes),
+            "clients": sum(len(scope.clients) for scope in scopes),
+        }
@@ -0,0 +1,311 @@
+"""
+Bulk re-judging for the Multi-Agent Debate System.
+
+Re-runs only the judging step over archived transcripts (e.g. the JSONL
+written by `main.py batch`), for a new judge model or a revised judge
+prompt, without regenerating any debate turn. Verdicts are cached by
+(transcript hash, judge model, judge prompt version): a transcript that
+was already judged the same way is served from the cache, and the rest
+run in parallel with bounded concurrency, like a tournament.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from .agents import aggregate_panel_node, create_judge_node, create_panel_judge_node
+from .cache import ResponseCache
+from .config import DebateConfig, get_default_config
+from .metrics import get_metrics
+from .models import DebateResult, DebateTurn, TournamentReport
+from .prompts import judge_system_prompt
+from .registry import aclose_registry, get_llm_client
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Verdict Cache Keys
+# ============================================================================
+
+def transcript_hash(topic: str, history: List[DebateTurn]) -> str:
+    """
+    Fingerprint a debate transcript.
+    
+    Only what the judge reads counts: the topic and each debater turn's
+    role, phase, round and content. Earlier judge turns are ignored.
+    
+    Args:
+        topic: The debate proposition
+        history: Debate turns in order
+    
+    Returns:
+        Hex digest identifying the transcript
+    """
+    turns = [
+        [turn.role, turn.phase, turn.round_number, turn.content]
+        for turn in history
+        if turn.role != "judge"
+    ]
+    payload = json.dumps([topic, turns], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def judge_prompt_version(config: DebateConfig) -> str:
+    """
+    Version of the judge prompt a configuration uses.
+    
+    Derived from the judge system prompt itself, so editing the prompt
+    (or switching judge_output_format) invalidates cached verdicts.
+    """
+    prompt = judge_system_prompt(config.judge_output_format)
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:12]
+
+
+def judge_label(config: DebateConfig) -> str:
+    """The judge model, or the comma-joined panel, of a configuration."""
+    return ",".join(config.judge_models) or config.model_name
+
+
+def make_verdict_key(topic: str, history: List[DebateTurn], config: DebateConfig) -> str:
+    """
+    Verdict cache key for judging a transcript with a configuration.
+    
+    Args:
+        topic: The debate proposition
+        history: Debate turns in order
+        config: Judge configuration
+    
+    Returns:
+        Hex digest of (transcript hash, judge model, prompt version)
+    """
+    payload = json.dumps([transcript_hash(topic, history), judge_label(config), judge_prompt_version(config)])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def open_verdict_cache(config: DebateConfig) -> ResponseCache:
+    """Open the verdict cache at config.verdict_cache_path (memory only if None)."""
+    return ResponseCache(
+        path=config.verdict_cache_path,
+        max_entries=config.cache_max_entries,
+        max_disk_entries=config.verdict_cache_max_entries,
+    )
+
+
+# ============================================================================
+# Transcript Loading
+# ============================================================================
+
+def load_transcripts(path: str) -> Iterator[DebateResult]:
+    """
+    Read archived debates from a JSONL file of DebateResult objects.
+    
+    Args:
+        path: Path to the transcripts file (e.g. `main.py batch` output)
+    
+    Yields:
+        Debate results in file order
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield DebateResult.model_validate_json(line)
+
+
+# ============================================================================
+# Judging
+# ============================================================================
+
+def create_transcript_judge(config: DebateConfig) -> Callable[[str, List[DebateTurn]], Any]:
+    """
+    Build an async function that judges one transcript.
+    
+    Uses the same judge (or judge panel) nodes as the debate graph, with
+    LLM clients shared through the registry.
+    
+    Args:
+        config: Judge configuration (model_name or judge_models)
+    
+    Returns:
+        Coroutine function (topic, debater turns) -> judge node state update
+    """
+    if config.judge_models:
+        panel = [
+            create_panel_judge_node(
+                config, index, model_name, get_llm_client(config.model_copy(update={"model_name": model_name}))
+            )
+            for index, model_name in enumerate(config.judge_models, start=1)
+        ]
+    else:
+        judge = create_judge_node(config, get_llm_client(config))
+    
+    async def judge_transcript(topic: str, history: List[DebateTurn]) -> Dict[str, Any]:
+        state = {
+            "topic": topic,
+            "history": history,
+            "current_phase": "verdict",
+            "round_scorecards": [],
+            "panel_verdicts": [],
+        }
+        if not config.judge_models:
+            return await judge.ainvoke(state)
+        
+        updates = await asyncio.gather(*(node.ainvoke(state) for node in panel))
+        state["panel_verdicts"] = [ballot for update in updates for ballot in update["panel_verdicts"]]
+        return aggregate_panel_node(state)
+    
+    return judge_transcript
+
+
+async def _rejudge_one(
+    transcript: DebateResult,
+    judge_transcript: Callable[[str, List[DebateTurn]], Any],
+    cache: ResponseCache,
+    config: DebateConfig,
+    force: bool,
+) -> DebateResult:
+    """Judge one transcript, or serve its verdict from the cache."""
+    start = time.perf_counter()
+    history = [turn for turn in transcript.history if turn.role != "judge"]
+    base = {"index": transcript.index, "topic": transcript.topic, "debate_id": transcript.debate_id}
+    
+    if not history:
+        return DebateResult(**base, error="no debate turns to judge")
+    
+    key = make_verdict_key(transcript.topic, history, config)
+    cached = None if force else await cache.aget(key)
+    metrics = get_metrics(config)
+    if metrics is not None and not force:
+        metrics.record_cache("verdict", cached is not None)
+    if cached is not None:
+        entry = json.loads(cached)
+        verdict, judge_turns = entry["verdict"], [DebateTurn.model_validate(turn) for turn in entry["turns"]]
+    else:
+        try:
+            update = await judge_transcript(transcript.topic, history)
+        except Exception as e:
+            logger.error(f"Re-judging {transcript.index} failed ('{transcript.topic}'): {e}")
+            return DebateResult(**base, elapsed_seconds=time.perf_counter() - start, error=str(e))
+        verdict, judge_turns = update["verdict"], update["history"]
+        await cache.aset(key, json.dumps({
+            "verdict": verdict,
+            "turns": [turn.model_dump(mode="json") for turn in judge_turns],
+        }))
+    
+    return DebateResult(
+        **base,
+        winner=verdict["winner"],
+        confidence=verdict["confidence"],
+        history=history + judge_turns,
+        verdict=verdict,
+        elapsed_seconds=time.perf_counter() - start,
+        cached=cached is not None,
+    )
+
+
+async def arejudge(
+    transcripts: Iterable[DebateResult],
+    judge_config: DebateConfig | None = None,
+    concurrency: int = 4,
+    force: bool = False,
+    on_result: Optional[Callable[[DebateResult], None]] = None,
+) -> TournamentReport:
+    """
+    Re-judge archived debates with bounded concurrency.
+    
+    Args:
+        transcripts: Archived debates (consumed lazily); any judge turns in
+            their history are replaced
+        judge_config: Judge configuration (model_name, or judge_models for
+            a panel, and judge_output_format)
+        concurrency: Maximum transcripts being judged at once
+        force: Re-judge even when a cached verdict exists (and replace it)
+        on_result: Called with each re-judged DebateResult as soon as it is ready
+    
+    Returns:
+        TournamentReport with completion counts, cache hits and throughput
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    
+    if judge_config is None:
+        judge_config = get_default_config()
+    
+    judge_transcript = create_transcript_judge(judge_config)
+    cache = open_verdict_cache(judge_config)
+    report = TournamentReport(concurrency=concurrency)
+    pending = enumerate(transcripts)
+    start = time.perf_counter()
+    
+    async def worker() -> None:
+        # Workers share one iterator; next() never yields control, so no lock
+        for _, transcript in pending:
+            report.total += 1
+            result = await _rejudge_one(transcript, judge_transcript, cache, judge_config, force)
+            
+            if result.error is None:
+                report.completed += 1
+                report.total_turns += len(result.history)
+                report.cached += result.cached
+            else:
+                report.failed += 1
+            
+            if on_result is not None:
+                on_result(result)
+    
+    logger.info(f"Re-judging with {judge_label(judge_config)} (prompt {judge_prompt_version(judge_config)})")
+    
+    try:
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    finally:
+        cache.close()
+    
+    report.elapsed_seconds = time.perf_counter() - start
+    
+    logger.info(
+        f"Re-judging complete: {report.completed}/{report.total} transcripts "
+        f"({report.cached} cached)"
+    )
+    
+    return report
+
+
+def rejudge(
+    transcripts: Iterable[DebateResult],
+    judge_config: DebateConfig | None = None,
+    concurrency: int = 4,
+    force: bool = False,
+    on_result: Optional[Callable[[DebateResult], None]] = None,
+) -> TournamentReport:
+    """
+    Re-judge archived debates with bounded concurrency.
+    
+    Synchronous wrapper around arejudge that owns its event loop.
+    
+    Args:
+        transcripts: Archived debates (consumed lazily)
+        judge_config: Judge configuration
+        concurrency: Maximum transcripts being judged at once
+        force: Re-judge even when a cached verdict exists
+        on_result: Called with each re-judged DebateResult as soon as it is ready
+    
+    Returns:
+        TournamentReport with completion counts, cache hits and throughput
+    """
+    async def _main() -> TournamentReport:
+        try:
+            return await arejudge(
+                transcripts,
+                judge_config=judge_config,
+                concurrency=concurrency,
+                force=force,
+                on_result=on_result,
+            )
+        finally:
+            # Async connection pools belong to this loop; close them with it
+            await aclose_registry()
+    
+    return asyncio.run(_main())
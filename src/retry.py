@@ -0,0 +1,317 @@
+"""
+Retry policy engine for LLM calls.
+
+Decides, per failed attempt, whether and when to retry:
+- Classifies OpenAI/OpenRouter errors (non-retryable 4xx, 429, 5xx,
+  timeouts, connection failures)
+- Computes full-jitter exponential backoff so concurrent debates don't
+  retry in lockstep
+- Honours Retry-After style hints sent with 429/503 responses
+- Trips a per-model circuit breaker after sustained failures so calls to
+  an unhealthy model fail fast instead of queueing more retries
+"""
+
+import datetime
+import email.utils
+import logging
+import random
+import threading
+import time
+from typing import Dict, Literal, Optional
+
+import openai
+from pydantic import BaseModel, Field
+
+from .config import DebateConfig
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Error Classification
+# ============================================================================
+
+ErrorCategory = Literal[
+    "non_retryable",  # 4xx: auth, validation, unknown model, no credits
+    "rate_limited",   # 429
+    "server_error",   # 5xx
+    "timeout",        # request or gateway timeout
+    "connection",     # network failure before a response
+    "unknown",        # anything else; retried as before
+]
+
+
+class RetryDecision(BaseModel):
+    """How the retry engine should treat a failed attempt."""
+    category: ErrorCategory = Field(
+        description="Classified error category"
+    )
+    retryable: bool = Field(
+        description="Whether another attempt may succeed"
+    )
+    retry_after: Optional[float] = Field(
+        default=None,
+        description="Server-requested delay in seconds, if any"
+    )
+    
+    @property
+    def counts_toward_breaker(self) -> bool:
+        """Whether this failure indicates an unhealthy model/provider."""
+        return self.category in ("server_error", "timeout", "connection", "unknown")
+
+
+# Statuses worth retrying; every other 4xx is a problem with the request
+_RETRYABLE_STATUS = {408: "timeout", 409: "server_error", 429: "rate_limited"}
+
+
+def parse_retry_after(headers) -> Optional[float]:
+    """
+    Extract a server-requested delay from response headers.
+    
+    Understands Retry-After (seconds or HTTP date), retry-after-ms, and
+    OpenRouter's X-RateLimit-Reset (epoch milliseconds).
+    
+    Args:
+        headers: Response headers mapping (case-insensitive)
+    
+    Returns:
+        Delay in seconds, or None if no usable hint is present
+    """
+    if not headers:
+        return None
+    
+    value = headers.get("retry-after-ms")
+    if value:
+        try:
+            return max(0.0, float(value) / 1000.0)
+        except ValueError:
+            pass
+    
+    value = headers.get("retry-after")
+    if value:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            parsed = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            # Not an HTTP date either; ignore the hint
+            parsed = None
+        if parsed is not None:
+            if parsed.tzinfo is None:
+                # HTTP dates are always GMT
+                parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+            return max(0.0, parsed.timestamp() - time.time())
+    
+    value = headers.get("x-ratelimit-reset")
+    if value:
+        try:
+            return max(0.0, float(value) / 1000.0 - time.time())
+        except ValueError:
+            pass
+    
+    return None
+
+
+def classify_error(error: BaseException) -> RetryDecision:
+    """
+    Classify an exception raised by an LLM call.
+    
+    Args:
+        error: The exception to classify
+    
+    Returns:
+        RetryDecision describing category, retryability and any delay hint
+    """
+    if isinstance(error, openai.APITimeoutError):
+        return RetryDecision(category="timeout", retryable=True)
+    
+    if isinstance(error, openai.APIConnectionError):
+        return RetryDecision(category="connection", retryable=True)
+    
+    if isinstance(error, openai.APIStatusError):
+        status = error.status_code
+        headers = getattr(error.response, "headers", None)
+        
+        if status >= 500:
+            return RetryDecision(
+                category="server_error",
+                retryable=True,
+                retry_after=parse_retry_after(headers),
+            )
+        if status in _RETRYABLE_STATUS:
+            return RetryDecision(
+                category=_RETRYABLE_STATUS[status],
+                retryable=True,
+                retry_after=parse_retry_after(headers),
+            )
+        return RetryDecision(category="non_retryable", retryable=False)
+    
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        category = "timeout" if isinstance(error, TimeoutError) else "connection"
+        return RetryDecision(category=category, retryable=True)
+    
+    # Programming and validation errors won't fix themselves on retry
+    if isinstance(error, (TypeError, ValueError, KeyError, AttributeError)):
+        return RetryDecision(category="non_retryable", retryable=False)
+    
+    return RetryDecision(category="unknown", retryable=True)
+
+
+def compute_backoff(
+    attempt: int,
+    decision: RetryDecision,
+    base_delay: float,
+    max_delay: float,
+    exponential_base: float = 2.0,
+    jitter: bool = True,
+) -> float:
+    """
+    Delay before the next attempt.
+    
+    Uses full jitter (uniform between 0 and the exponential ceiling), and
+    never waits less than a server-provided Retry-After, up to max_delay:
+    a longer hint (or a garbled one) must not stall a debate for an hour.
+    
+    Args:
+        attempt: Zero-based index of the attempt that just failed
+        decision: Classification of the failure
+        base_delay: Initial delay (seconds)
+        max_delay: Cap on the delay, Retry-After included (seconds)
+        exponential_base: Growth factor per attempt
+        jitter: Randomize the delay (disable for deterministic tests)
+    
+    Returns:
+        Seconds to wait
+    """
+    ceiling = min(base_delay * (exponential_base ** attempt), max_delay)
+    delay = random.uniform(0, ceiling) if jitter else ceiling
+    
+    if decision.retry_after is not None:
+        delay = min(max(delay, decision.retry_after), max_delay)
+    
+    return delay
+
+
+# ============================================================================
+# Circuit Breaker
+# ============================================================================
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a model whose circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for one model.
+    
+    closed    -> calls pass; `failure_threshold` consecutive failures open it
+    open      -> calls fail fast with CircuitOpenError for `cooldown_seconds`
+    half-open -> one trial call passes; success closes, failure reopens
+    """
+    
+    def __init__(self, name: str, failure_threshold: int = 5, cooldown_seconds: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+    
+    @property
+    def state(self) -> Literal["closed", "open", "half_open"]:
+        """Current breaker state."""
+        with self._lock:
+            return self._state(time.monotonic())
+    
+    def _state(self, now: float) -> Literal["closed", "open", "half_open"]:
+        """Compute state. Must hold _lock."""
+        if self._opened_at is None:
+            return "closed"
+        if now - self._opened_at < self.cooldown_seconds:
+            return "open"
+        return "half_open"
+    
+    def before_call(self) -> None:
+        """
+        Check the breaker before an attempt.
+        
+        Raises:
+            CircuitOpenError: If the breaker is open, or half-open with a
+                trial call already in flight
+        """
+        with self._lock:
+            state = self._state(time.monotonic())
+            if state == "closed":
+                return
+            if state == "half_open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+            
+            remaining = self.cooldown_seconds - (time.monotonic() - self._opened_at)
+            raise CircuitOpenError(
+                f"Circuit open for {self.name} after {self._failures} consecutive failures; "
+                f"retry in {max(remaining, 0):.0f}s"
+            )
+    
+    def record_success(self) -> None:
+        """Close the breaker after a successful call."""
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info(f"Circuit closed for {self.name}")
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+    
+    def record_failure(self) -> None:
+        """Count a failure, opening the breaker at the threshold."""
+        with self._lock:
+            self._failures += 1
+            half_open_trial = self._trial_in_flight
+            self._trial_in_flight = False
+            
+            if half_open_trial or self._failures >= self.failure_threshold:
+                if self._opened_at is None or half_open_trial:
+                    logger.warning(
+                        f"Circuit opened for {self.name} after {self._failures} consecutive failures"
+                    )
+                self._opened_at = time.monotonic()
+    
+    def release(self) -> None:
+        """Release a half-open trial slot without recording an outcome."""
+        with self._lock:
+            self._trial_in_flight = False
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(config: DebateConfig) -> Optional[CircuitBreaker]:
+    """
+    Get the process-wide circuit breaker for the configured model.
+    
+    Args:
+        config: Debate configuration with breaker settings
+    
+    Returns:
+        CircuitBreaker shared by every call to this model, or None if disabled
+    """
+    if not config.circuit_breaker_threshold:
+        return None
+    
+    key = f"{config.llm_base_url()}|{config.model_name}"
+    
+    with _breakers_lock:
+        breaker = _breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                name=config.model_name,
+                failure_threshold=config.circuit_breaker_threshold,
+                cooldown_seconds=config.circuit_breaker_cooldown,
+            )
+            _breakers[key] = breaker
+        return breaker
@@ -0,0 +1,239 @@
+"""
+Latency, token and cost instrumentation for the Multi-Agent Debate System.
+
+invoke_agent times every LLM call with a CallTimer (rate-limiter queue
+wait, time to first token, total latency, retries) and records the
+provider's token usage in the reply's TurnMetrics. Agent nodes are
+wrapped with timed_node, which adds the node's own wall time, and attach
+the metrics to the DebateTurn they produce. debate_report aggregates a
+finished debate into a per-node table with totals.
+"""
+
+import asyncio
+import functools
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from .config import DebateConfig
+from .metrics import get_metrics
+from .models import DebateTurn, LLMReply, TurnMetrics
+from .utils import estimate_tokens
+
+
+# ============================================================================
+# Cost
+# ============================================================================
+
+def estimate_cost(config: DebateConfig, prompt_tokens: int, completion_tokens: int) -> Optional[float]:
+    """
+    Estimate the cost of a call from config.model_prices.
+    
+    Args:
+        config: Configuration of the call (its model_name is priced)
+        prompt_tokens: Prompt tokens sent
+        completion_tokens: Completion tokens generated, reasoning included
+    
+    Returns:
+        Cost in USD; 0 for ':free' models, None if the model has no price
+    """
+    price = config.model_prices.get(config.model_name)
+    if price is None:
+        return 0.0 if config.model_name.endswith(":free") else None
+    prompt_price, completion_price = price
+    return (prompt_tokens * prompt_price + completion_tokens * completion_price) / 1_000_000
+
+
+# ============================================================================
+# LLM Call Timing
+# ============================================================================
+
+class CallTimer:
+    """
+    Times one invoke_agent call across all of its attempts.
+    
+    Time to first token is measured from when the successful attempt was
+    sent (after the rate limiter) to its first content chunk, reasoning
+    included; it is only known for streamed calls.
+    """
+    
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.attempts = 0
+        self.queue_wait = 0.0
+        self._sent = 0.0
+        self._first_token: Optional[float] = None
+    
+    def queued(self, since: float) -> None:
+        """Add a rate-limiter wait that began at `since` (perf_counter)."""
+        self.queue_wait += time.perf_counter() - since
+    
+    def send(self) -> None:
+        """Mark the start of an attempt's request."""
+        self.attempts += 1
+        self._sent = time.perf_counter()
+        self._first_token = None
+    
+    def first_token(self) -> None:
+        """Mark a streamed content chunk; only the first of an attempt counts."""
+        if self._first_token is None:
+            self._first_token = time.perf_counter()
+    
+    def finish(self, reply: LLMReply, config: DebateConfig, prompt: str) -> LLMReply:
+        """
+        Record the call's timing, retries and cost in the reply's metrics.
+        
+        Args:
+            reply: Reply of the successful attempt
+            config: Configuration of the call
+            prompt: Prompt text, to estimate prompt tokens the provider didn't report
+        
+        Returns:
+            The same reply
+        """
+        metrics = reply.metrics
+        metrics.llm_calls = self.attempts
+        metrics.retries = max(self.attempts - 1, 0)
+        metrics.queue_wait_ms = self.queue_wait * 1000
+        if self._first_token is not None:
+            metrics.ttft_ms = (self._first_token - self._sent) * 1000
+        metrics.llm_latency_ms = (time.perf_counter() - self.started) * 1000
+        if not metrics.prompt_tokens:
+            metrics.prompt_tokens = estimate_tokens(prompt)
+        metrics.cost_usd = estimate_cost(config, metrics.prompt_tokens, metrics.completion_tokens)
+        return reply
+    
+    def cached(self, reply: LLMReply) -> LLMReply:
+        """Record a response cache hit: no request, no tokens, no cost."""
+        reply.metrics = TurnMetrics(
+            cache_hits=1,
+            llm_latency_ms=(time.perf_counter() - self.started) * 1000,
+            cost_usd=0.0,
+        )
+        return reply
+
+
+def merge_metrics(parts: Sequence[TurnMetrics], parallel: bool = False) -> TurnMetrics:
+    """
+    Combine the metrics of several calls or turns.
+    
+    Counts, tokens and costs add up. Latencies add up for sequential work
+    (a turn and its section repair) and take the maximum for parallel work
+    (a judge panel); TTFT is the first call's, or the fastest in parallel.
+    
+    Args:
+        parts: Metrics to combine
+        parallel: Whether the parts ran concurrently
+    
+    Returns:
+        Combined metrics; the cost is None if any part's is unknown
+    """
+    def combine(values: Iterable[float]) -> float:
+        return max(values, default=0.0) if parallel else sum(values)
+    
+    ttfts = [part.ttft_ms for part in parts if part.ttft_ms is not None]
+    costs = [part.cost_usd for part in parts]
+    
+    return TurnMetrics(
+        llm_calls=sum(part.llm_calls for part in parts),
+        cache_hits=sum(part.cache_hits for part in parts),
+        retries=sum(part.retries for part in parts),
+        queue_wait_ms=combine(part.queue_wait_ms for part in parts),
+        ttft_ms=(min(ttfts) if parallel else ttfts[0]) if ttfts else None,
+        llm_latency_ms=combine(part.llm_latency_ms for part in parts),
+        node_latency_ms=combine(part.node_latency_ms for part in parts),
+        prompt_tokens=sum(part.prompt_tokens for part in parts),
+        completion_tokens=sum(part.completion_tokens for part in parts),
+        reasoning_tokens=sum(part.reasoning_tokens for part in parts),
+        usage_reported=bool(parts) and all(part.usage_reported for part in parts),
+        cost_usd=None if None in costs else sum(costs),
+    )
+
+
+# ============================================================================
+# Node Timing
+# ============================================================================
+
+def stamp_node_latency(update: Dict[str, Any], name: str, started: float) -> Dict[str, Any]:
+    """Record a node's wall time on the turns and panel ballots in its update."""
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    metrics = get_metrics()
+    if metrics is not None:
+        metrics.node_latency.observe(name, value=elapsed_ms / 1000)
+    for turn in update.get("history", []):
+        turn.metrics.node_latency_ms = elapsed_ms
+    for ballot in update.get("panel_verdicts", []):
+        if "metrics" in ballot:
+            ballot["metrics"]["node_latency_ms"] = elapsed_ms
+    return update
+
+
+def timed_node(node: Callable, name: str) -> Callable:
+    """
+    Wrap a sync or async node body so its output carries its wall time.
+    
+    The time is also observed in the node latency metric, under `name`.
+    
+    Round scorecards are not stamped: one scorer run can score several
+    exchanges, and it runs beside the debate rather than on its critical
+    path, so its calls' own latency is what counts.
+    """
+    if asyncio.iscoroutinefunction(node):
+        @functools.wraps(node)
+        async def async_wrapper(state: Dict[str, Any]) -> Dict[str, Any]:
+            started = time.perf_counter()
+            return stamp_node_latency(await node(state), name, started)
+        
+        return async_wrapper
+    
+    @functools.wraps(node)
+    def wrapper(state: Dict[str, Any]) -> Dict[str, Any]:
+        started = time.perf_counter()
+        return stamp_node_latency(node(state), name, started)
+    
+    return wrapper
+
+
+# ============================================================================
+# Debate Report
+# ============================================================================
+
+def turn_label(turn: DebateTurn) -> str:
+    """Short name of the node run that produced a turn, e.g. 'opposition rebuttal 2'."""
+    label = f"{turn.role} {turn.phase}"
+    if turn.phase == "rebuttal":
+        label += f" {turn.round_number}"
+    return label
+
+
+def debate_report(
+    history: Sequence[DebateTurn],
+    scorecards: Sequence[Dict[str, Any]] = (),
+) -> Dict[str, Any]:
+    """
+    Aggregate a debate's instrumentation per node.
+    
+    Args:
+        history: Debate turns in order
+        scorecards: Round scorecards (incremental judging), if any
+    
+    Returns:
+        Dict with "nodes" (one row per turn or scorecard: "node" label plus
+        its TurnMetrics fields) and "totals" (the sum over all rows, with
+        ttft_ms as the mean over streamed calls)
+    """
+    rows: List[tuple[str, TurnMetrics]] = [(turn_label(turn), turn.metrics) for turn in history]
+    for card in scorecards:
+        if "metrics" in card:
+            label = f"scorer {card['phase']}"
+            if card["phase"] == "rebuttal":
+                label += f" {card['round_number']}"
+            rows.append((label, TurnMetrics.model_validate(card["metrics"])))
+    
+    totals = merge_metrics([metrics for _, metrics in rows]).model_dump()
+    ttfts = [metrics.ttft_ms for _, metrics in rows if metrics.ttft_ms is not None]
+    totals["ttft_ms"] = sum(ttfts) / len(ttfts) if ttfts else None
+    
+    return {
+        "nodes": [{"node": label, **metrics.model_dump()} for label, metrics in rows],
+        "totals": totals,
+    }
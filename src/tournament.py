@@ -0,0 +1,198 @@
+"""
+Bounded-concurrency batch runner for the Multi-Agent Debate System.
+
+Runs many debates on one event loop using the async graph path. A fixed
+pool of workers pulls topics from the input, so at most `concurrency`
+debates are in flight and memory stays flat for very long topic lists.
+Each finished debate is handed to a callback as soon as it completes.
+"""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from typing import Callable, Iterable, Iterator, Optional
+
+from .config import DebateConfig, get_default_config
+from .graph import arun_debate
+from .models import DebateResult, TournamentReport
+from .registry import aclose_registry
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Topic Loading
+# ============================================================================
+
+def load_topics(path: str) -> Iterator[str]:
+    """
+    Read debate topics from a JSONL file.
+    
+    Each non-empty line is either a JSON string or an object with a
+    "topic" key.
+    
+    Args:
+        path: Path to the topics file
+    
+    Yields:
+        Topic strings in file order
+    
+    Raises:
+        ValueError: If a line is not a string or an object with "topic"
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            
+            entry = json.loads(line)
+            if isinstance(entry, dict):
+                entry = entry.get("topic")
+            if not isinstance(entry, str) or not entry.strip():
+                raise ValueError(f"{path}:{line_number}: expected a topic string or {{\"topic\": ...}}")
+            
+            yield entry.strip()
+
+
+# ============================================================================
+# Tournament Execution
+# ============================================================================
+
+async def _run_one(
+    index: int,
+    topic: str,
+    max_rounds: int,
+    config: DebateConfig,
+) -> DebateResult:
+    """Run a single debate, capturing failures in the result."""
+    start = time.perf_counter()
+    debate_id = uuid.uuid4().hex
+    
+    try:
+        state = await arun_debate(
+            topic=topic,
+            max_rounds=max_rounds,
+            config=config,
+            debate_id=debate_id,
+        )
+    except Exception as e:
+        logger.error(f"Debate {index} failed ('{topic}'): {e}")
+        return DebateResult(
+            index=index,
+            topic=topic,
+            debate_id=debate_id,
+            elapsed_seconds=time.perf_counter() - start,
+            error=str(e),
+        )
+    
+    verdict = state.get("verdict") or {}
+    return DebateResult(
+        index=index,
+        topic=topic,
+        debate_id=debate_id,
+        winner=verdict.get("winner"),
+        confidence=verdict.get("confidence"),
+        history=state.get("history", []),
+        verdict=verdict or None,
+        elapsed_seconds=time.perf_counter() - start,
+    )
+
+
+async def arun_tournament(
+    topics: Iterable[str],
+    concurrency: int = 4,
+    max_rounds: int = 3,
+    config: DebateConfig | None = None,
+    on_result: Optional[Callable[[DebateResult], None]] = None,
+) -> TournamentReport:
+    """
+    Run debates over many topics with bounded concurrency.
+    
+    Args:
+        topics: Debate propositions (consumed lazily)
+        concurrency: Maximum debates in flight at once
+        max_rounds: Number of rebuttal rounds per debate
+        config: Optional configuration override
+        on_result: Called with each DebateResult as soon as it finishes
+    
+    Returns:
+        TournamentReport with completion counts and throughput
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    
+    if config is None:
+        config = get_default_config()
+    
+    report = TournamentReport(concurrency=concurrency)
+    pending = enumerate(topics)
+    start = time.perf_counter()
+    
+    async def worker() -> None:
+        # Workers share one iterator; next() never yields control, so no lock
+        for index, topic in pending:
+            report.total += 1
+            result = await _run_one(index, topic, max_rounds, config)
+            
+            if result.error is None:
+                report.completed += 1
+                report.total_turns += len(result.history)
+            else:
+                report.failed += 1
+            
+            if on_result is not None:
+                on_result(result)
+    
+    logger.info(f"Starting tournament with concurrency {concurrency}")
+    
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    
+    report.elapsed_seconds = time.perf_counter() - start
+    
+    logger.info(
+        f"Tournament complete: {report.completed}/{report.total} debates, "
+        f"{report.debates_per_minute:.1f} debates/min"
+    )
+    
+    return report
+
+
+def run_tournament(
+    topics: Iterable[str],
+    concurrency: int = 4,
+    max_rounds: int = 3,
+    config: DebateConfig | None = None,
+    on_result: Optional[Callable[[DebateResult], None]] = None,
+) -> TournamentReport:
+    """
+    Run debates over many topics with bounded concurrency.
+    
+    Synchronous wrapper around arun_tournament that owns its event loop.
+    
+    Args:
+        topics: Debate propositions (consumed lazily)
+        concurrency: Maximum debates in flight at once
+        max_rounds: Number of rebuttal rounds per debate
+        config: Optional configuration override
+        on_result: Called with each DebateResult as soon as it finishes
+    
+    Returns:
+        TournamentReport with completion counts and throughput
+    """
+    async def _main() -> TournamentReport:
+        try:
+            return await arun_tournament(
+                topics,
+                concurrency=concurrency,
+                max_rounds=max_rounds,
+                config=config,
+                on_result=on_result,
+            )
+        finally:
+            # Async connection pools belong to this loop; close them with it
+            await aclose_registry()
+    
+    return asyncio.run(_main())
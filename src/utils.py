@@ -4,15 +4,19 @@ Utility functions for the Multi-Agent Debate System.
 Provides production safeguards:
 - Output validation and format enforcement
 - Response length truncation
-- Retry logic with exponential backoff
+- Error-aware retry logic with jittered exponential backoff
 - History formatting for context windows
 """
 
 import re
 import time
+import asyncio
 import logging
-from typing import Callable, TypeVar, Any, Optional
-from functools import wraps
+from typing import Callable, TypeVar, Any, List, Optional, Sequence, Tuple
+from functools import lru_cache, wraps
+
+from .models import SectionSpan, TurnStats
+from .retry import CircuitBreaker, RetryDecision, classify_error, compute_backoff
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -30,10 +34,17 @@ def retry_with_backoff(
     base_delay: float = 1.0,
     max_delay: float = 30.0,
     exponential_base: float = 2.0,
-    retryable_exceptions: tuple = (Exception,)
+    retryable_exceptions: tuple = (Exception,),
+    circuit_breaker: Optional[CircuitBreaker] = None,
+    jitter: bool = True,
+    on_failure: Optional[Callable[[RetryDecision, bool], None]] = None,
 ) -> Callable:
     """
-    Decorator for retrying functions with exponential backoff.
+    Decorator for retrying functions with error-aware exponential backoff.
+    
+    Each failure is classified first: non-retryable errors (auth, bad
+    request, unknown model) are raised immediately, the rest are retried
+    after a full-jitter delay that honours any Retry-After hint.
     
     Args:
         max_retries: Maximum number of retry attempts
@@ -41,7 +52,12 @@ def retry_with_backoff(
         max_delay: Maximum delay cap (seconds)
         exponential_base: Base for exponential backoff calculation
         retryable_exceptions: Tuple of exception types to retry
-        
+        circuit_breaker: Optional breaker checked before and updated after
+            every attempt
+        jitter: Randomize delays so concurrent callers don't retry in lockstep
+        on_failure: Optional callback for every failed attempt, with its
+            classification and whether it will be retried (e.g. for metrics)
+    
     Returns:
         Decorated function with retry logic
     """
@@ -51,32 +67,215 @@ def retry_with_backoff(
             last_exception = None
             
             for attempt in range(max_retries + 1):
+                if circuit_breaker is not None:
+                    circuit_breaker.before_call()
                 try:
-                    return func(*args, **kwargs)
+                    result = func(*args, **kwargs)
                 except retryable_exceptions as e:
                     last_exception = e
-                    
-                    if attempt == max_retries:
-                        logger.error(f"Max retries ({max_retries}) exceeded for {func.__name__}")
-                        raise
-                    
-                    delay = min(base_delay * (exponential_base ** attempt), max_delay)
-                    logger.warning(
-                        f"Attempt {attempt + 1}/{max_retries + 1} failed for {func.__name__}: {e}. "
-                        f"Retrying in {delay:.1f}s..."
+                    delay = _next_delay(
+                        func.__name__, e, attempt, max_retries, base_delay,
+                        max_delay, exponential_base, circuit_breaker, jitter, on_failure,
                     )
                     time.sleep(delay)
+                except BaseException:
+                    if circuit_breaker is not None:
+                        circuit_breaker.release()
+                    raise
+                else:
+                    if circuit_breaker is not None:
+                        circuit_breaker.record_success()
+                    return result
             
             raise last_exception  # Should never reach here
+        
+        return wrapper
+    return decorator
+
+
+def async_retry_with_backoff(
+    max_retries: int = 3,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+    exponential_base: float = 2.0,
+    retryable_exceptions: tuple = (Exception,),
+    circuit_breaker: Optional[CircuitBreaker] = None,
+    jitter: bool = True,
+    on_failure: Optional[Callable[[RetryDecision, bool], None]] = None,
+) -> Callable:
+    """
+    Async counterpart of retry_with_backoff for coroutine functions.
+    
+    Waits with asyncio.sleep so other coroutines on the event loop
+    keep running while this call backs off.
+    
+    Args:
+        max_retries: Maximum number of retry attempts
+        base_delay: Initial delay between retries (seconds)
+        max_delay: Maximum delay cap (seconds)
+        exponential_base: Base for exponential backoff calculation
+        retryable_exceptions: Tuple of exception types to retry
+        circuit_breaker: Optional breaker checked before and updated after
+            every attempt
+        jitter: Randomize delays so concurrent callers don't retry in lockstep
+        on_failure: Optional callback for every failed attempt, with its
+            classification and whether it will be retried (e.g. for metrics)
+    
+    Returns:
+        Decorated coroutine function with retry logic
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> Any:
+            last_exception = None
             
+            for attempt in range(max_retries + 1):
+                if circuit_breaker is not None:
+                    circuit_breaker.before_call()
+                try:
+                    result = await func(*args, **kwargs)
+                except retryable_exceptions as e:
+                    last_exception = e
+                    delay = _next_delay(
+                        func.__name__, e, attempt, max_retries, base_delay,
+                        max_delay, exponential_base, circuit_breaker, jitter, on_failure,
+                    )
+                    await asyncio.sleep(delay)
+                except BaseException:
+                    # Cancellation says nothing about the model's health
+                    if circuit_breaker is not None:
+                        circuit_breaker.release()
+                    raise
+                else:
+                    if circuit_breaker is not None:
+                        circuit_breaker.record_success()
+                    return result
+            
+            raise last_exception  # Should never reach here
+        
         return wrapper
     return decorator
 
 
+def _next_delay(
+    name: str,
+    error: Exception,
+    attempt: int,
+    max_retries: int,
+    base_delay: float,
+    max_delay: float,
+    exponential_base: float,
+    circuit_breaker: Optional[CircuitBreaker],
+    jitter: bool,
+    on_failure: Optional[Callable[[RetryDecision, bool], None]] = None,
+) -> float:
+    """
+    Record a failed attempt and decide how long to wait before the next.
+    
+    Raises the error instead when it is non-retryable or retries are used up.
+    """
+    decision = classify_error(error)
+    if on_failure is not None:
+        on_failure(decision, decision.retryable and attempt < max_retries)
+    
+    if circuit_breaker is not None:
+        if decision.counts_toward_breaker:
+            circuit_breaker.record_failure()
+        else:
+            # 4xx/429 mean the model is up; just free any half-open trial slot
+            circuit_breaker.release()
+    
+    if not decision.retryable:
+        logger.error(f"Non-retryable error in {name}: {error}")
+        raise error
+    
+    if attempt == max_retries:
+        logger.error(f"Max retries ({max_retries}) exceeded for {name}")
+        raise error
+    
+    delay = compute_backoff(
+        attempt,
+        decision,
+        base_delay=base_delay,
+        max_delay=max_delay,
+        exponential_base=exponential_base,
+        jitter=jitter,
+    )
+    logger.warning(
+        f"Attempt {attempt + 1}/{max_retries + 1} failed for {name} "
+        f"({decision.category}): {error}. Retrying in {delay:.1f}s..."
+    )
+    return delay
+
+
 # ============================================================================
 # Output Validation
 # ============================================================================
 
+class HeaderMatcher:
+    """
+    Precompiled matcher for a set of required markdown headers.
+    
+    One case-insensitive regex finds every header in a single scan, as
+    "## Header" (any number of #) or "**Header**", and reports where each
+    header's section starts and ends so callers can slice sections without
+    scanning again.
+    """
+    
+    def __init__(self, headers: Sequence[str]):
+        self.headers = tuple(headers)
+        self._canonical = {header.lower(): header for header in self.headers}
+        # Longest first, so a header that prefixes another can't shadow it
+        names = "|".join(re.escape(header) for header in sorted(self.headers, key=len, reverse=True))
+        # The leading [#*] class lets the regex engine skip ahead to candidate
+        # characters instead of attempting a match at every position
+        self._pattern = re.compile(
+            rf"[#*](?:(?<=#)#*[ \t]*(?P<hash>{names}):?|(?<=\*)\*(?P<bold>{names}):?\*\*:?)",
+            re.IGNORECASE,
+        )
+    
+    def scan(self, content: str) -> List[SectionSpan]:
+        """
+        Find every required header and the section it opens.
+        
+        Args:
+            content: Response text
+        
+        Returns:
+            Sections in order of appearance; each ends where the next
+            required header begins, the last at the end of the text
+        """
+        matches = list(self._pattern.finditer(content)) if self.headers else []
+        return [
+            SectionSpan(
+                header=self._canonical[(match.group("hash") or match.group("bold")).lower()],
+                start=match.start(),
+                body_start=match.end(),
+                end=matches[index + 1].start() if index + 1 < len(matches) else len(content),
+            )
+            for index, match in enumerate(matches)
+        ]
+    
+    def missing(self, sections: Sequence[SectionSpan]) -> List[str]:
+        """Required headers that have no section, in format order."""
+        found = {span.header for span in sections}
+        return [header for header in self.headers if header not in found]
+
+
+@lru_cache(maxsize=32)
+def get_header_matcher(headers: Tuple[str, ...]) -> HeaderMatcher:
+    """
+    Get the shared compiled matcher for a header set.
+    
+    Args:
+        headers: Required headers (a tuple, so it can be cached)
+    
+    Returns:
+        HeaderMatcher compiled once per header set
+    """
+    return HeaderMatcher(headers)
+
+
 def validate_structured_output(
     content: str,
     required_headers: list[str],
@@ -89,22 +288,12 @@ def validate_structured_output(
         content: The response content to validate
         required_headers: List of header strings that must be present
         strict: If True, raise exception on validation failure
-        
+    
     Returns:
         Tuple of (is_valid, list of missing headers)
     """
-    missing = []
-    content_lower = content.lower()
-    
-    for header in required_headers:
-        # Check for markdown header format (## Header or # Header)
-        header_patterns = [
-            f"## {header.lower()}",
-            f"# {header.lower()}",
-            f"**{header.lower()}**",
-        ]
-        if not any(pattern in content_lower for pattern in header_patterns):
-            missing.append(header)
+    matcher = get_header_matcher(tuple(required_headers))
+    missing = matcher.missing(matcher.scan(content))
     
     is_valid = len(missing) == 0
     
@@ -114,22 +303,25 @@ def validate_structured_output(
     return is_valid, missing
 
 
+# Headers each agent's output format requires
+PROPONENT_HEADERS = ("Main Argument", "Supporting Evidence", "Key Takeaway")
+OPPOSITION_HEADERS = ("Counter-Argument", "Critical Analysis", "Key Takeaway")
+JUDGE_HEADERS = ("Argument Analysis", "Scores", "Verdict", "Reasoning")
+
+
 def validate_proponent_output(content: str) -> tuple[bool, list[str]]:
     """Validate proponent response format."""
-    required = ["Main Argument", "Supporting Evidence", "Key Takeaway"]
-    return validate_structured_output(content, required)
+    return validate_structured_output(content, list(PROPONENT_HEADERS))
 
 
 def validate_opposition_output(content: str) -> tuple[bool, list[str]]:
     """Validate opposition response format."""
-    required = ["Counter-Argument", "Critical Analysis", "Key Takeaway"]
-    return validate_structured_output(content, required)
+    return validate_structured_output(content, list(OPPOSITION_HEADERS))
 
 
 def validate_judge_output(content: str) -> tuple[bool, list[str]]:
     """Validate judge response format."""
-    required = ["Argument Analysis", "Scores", "Verdict", "Reasoning"]
-    return validate_structured_output(content, required)
+    return validate_structured_output(content, list(JUDGE_HEADERS))
 
 
 # ============================================================================
@@ -143,7 +335,7 @@ def truncate_response(content: str, max_words: int) -> str:
     Args:
         content: Response content to truncate
         max_words: Maximum allowed word count
-        
+    
     Returns:
         Truncated content (may be unchanged if under limit)
     """
@@ -166,6 +358,57 @@ def truncate_response(content: str, max_words: int) -> str:
     return truncated_content
 
 
+# End of a sentence (with any closing quote/bracket/emphasis) or of a paragraph
+_SENTENCE_BOUNDARY = re.compile(r"[.!?][\"')\]*_]*\s|\n\s*\n")
+
+
+class WordBudget:
+    """
+    Incremental word counter for a streamed response.
+    
+    Signals that generation should stop once the response has reached
+    `max_words` and then finished a sentence, or has run `grace_words`
+    past the budget without finishing one. Words are counted like
+    truncate_response counts them (whitespace-separated).
+    """
+    
+    def __init__(self, max_words: int, grace_words: int = 0):
+        self.max_words = max_words
+        self.grace_words = grace_words
+        self.words = 0
+        self._in_word = False
+        self._tail = ""
+    
+    def feed(self, delta: str) -> bool:
+        """
+        Count a streamed text delta.
+        
+        Args:
+            delta: Newly generated text
+        
+        Returns:
+            True once generation should stop
+        """
+        if not delta:
+            return False
+        
+        new_words = len(delta.split())
+        if self._in_word and not delta[0].isspace():
+            new_words -= 1  # The delta continues the previous word
+        self.words += new_words
+        self._in_word = not delta[-1].isspace()
+        
+        # Keep a little of the previous delta so boundaries split across chunks match
+        window = self._tail + delta
+        self._tail = window[-8:]
+        
+        if self.words < self.max_words:
+            return False
+        if self.words >= self.max_words + self.grace_words:
+            return True
+        return bool(_SENTENCE_BOUNDARY.search(window))
+
+
 def clean_response(content: str) -> str:
     """
     Clean up response content for consistency.
@@ -184,6 +427,136 @@ def clean_response(content: str) -> str:
     return content.strip()
 
 
+def analyze_turn(
+    content: str,
+    max_words: Optional[int] = None,
+    required_headers: Sequence[str] = (),
+) -> TurnStats:
+    """
+    Clean, truncate, validate and count an agent response in one pass.
+    
+    Equivalent to clean_response, truncate_response, validate_structured_output
+    and a word count, but walks the text once line by line instead of
+    copying and splitting the whole response at every step; headers are then
+    located in one scan by the role's precompiled HeaderMatcher. Truncation
+    keeps the line structure instead of joining the kept words with spaces.
+    
+    Args:
+        content: Raw response text
+        max_words: Word limit (None = no limit)
+        required_headers: Headers the response must contain
+    
+    Returns:
+        TurnStats with the processed text, word count, sections and missing headers
+    """
+    if "\r" in content:
+        content = content.replace("\r\n", "\n")
+    
+    kept = []
+    words = 0
+    blank_run = 0
+    truncated = False
+    
+    for line in content.split("\n"):
+        if not kept:
+            line = line.lstrip()
+            if not line:
+                continue
+        
+        # Collapse runs of blank lines to one (clean_response's \n{3,} -> \n\n)
+        if not line:
+            blank_run += 1
+            if blank_run > 1:
+                continue
+        else:
+            blank_run = 0
+        
+        line_words = len(line.split())
+        if max_words is not None and words + line_words > max_words:
+            keep = max_words - words
+            cut = 0
+            for index, match in enumerate(re.finditer(r"\S+", line)):
+                if index == keep - 1:
+                    cut = match.end()
+                    break
+            line = line[:cut]
+            line_words = keep
+            truncated = True
+        
+        kept.append(line)
+        words += line_words
+        if truncated:
+            break
+    
+    text = "\n".join(kept).rstrip()
+    
+    if truncated:
+        # Try to end at a sentence boundary
+        last_period = text.rfind(".")
+        if last_period > len(text) * 0.7:
+            tail = text[last_period + 1:]
+            words -= len(tail.split())
+            if tail and not tail[0].isspace():
+                words += 1  # The period ended mid-word; its first half stays
+            text = text[:last_period + 1]
+        logger.info(f"Response truncated to {words} words")
+    
+    matcher = get_header_matcher(tuple(required_headers))
+    sections = matcher.scan(text)
+    
+    return TurnStats(
+        content=text,
+        word_count=words,
+        truncated=truncated,
+        missing_headers=matcher.missing(sections),
+        sections=sections,
+    )
+
+
+def splice_sections(
+    content: str,
+    sections: Sequence[SectionSpan],
+    required_headers: Sequence[str],
+    additions: dict,
+) -> str:
+    """
+    Insert sections into a response at their place in the format.
+    
+    Each added section goes right before the next required header that is
+    present, or at the end when none follows it.
+    
+    Args:
+        content: Response text
+        sections: Header spans of content (from analyze_turn)
+        required_headers: Headers of the format, in order
+        additions: Section bodies to insert, keyed by header
+    
+    Returns:
+        Response text with the sections inserted
+    """
+    present = {}
+    for span in sections:
+        present.setdefault(span.header, span.start)
+    
+    inserts = []
+    for index, header in enumerate(required_headers):
+        if header not in additions:
+            continue
+        following = [present[later] for later in required_headers[index + 1:] if later in present]
+        offset = min(following) if following else len(content)
+        inserts.append((offset, f"## {header}\n{additions[header].strip()}"))
+    
+    parts = []
+    last = 0
+    for offset, section in sorted(inserts, key=lambda insert: insert[0]):
+        parts.append(content[last:offset].strip())
+        parts.append(section)
+        last = offset
+    parts.append(content[last:].strip())
+    
+    return "\n\n".join(part for part in parts if part)
+
+
 # ============================================================================
 # History Formatting
 # ============================================================================
@@ -200,7 +573,7 @@ def format_history_for_context(
         history: List of DebateTurn objects
         max_turns: Maximum recent turns to include
         max_chars_per_turn: Character limit per turn summary
-        
+    
     Returns:
         Formatted history string
     """
@@ -229,6 +602,16 @@ def count_words(text: str) -> int:
     return len(text.split())
 
 
+def estimate_tokens(text: str) -> int:
+    """
+    Cheaply estimate the token count of text.
+    
+    Uses the common ~4 characters per token heuristic; good enough for
+    quota accounting without loading a tokenizer.
+    """
+    return (len(text) + 3) // 4
+
+
 # ============================================================================
 # Output Formatting
 # ============================================================================
@@ -239,7 +622,7 @@ def format_debate_output(state: Any) -> str:
     
     Args:
         state: DebateState object
-        
+    
     Returns:
         Formatted string for display
     """
@@ -278,7 +661,7 @@ def extract_winner_from_text(content: str) -> Optional[str]:
     
     Args:
         content: Judge's response text
-        
+    
     Returns:
         'proponent', 'opposition', 'tie', or None if not found
     """
@@ -306,7 +689,7 @@ def extract_confidence_from_text(content: str) -> Optional[str]:
     
     Args:
         content: Judge's response text
-        
+    
     Returns:
         'high', 'medium', 'low', or None if not found
     """
@@ -323,3 +706,23 @@ def extract_confidence_from_text(content: str) -> Optional[str]:
             return match.group(1)
     
     return "medium"  # Default if not found
+
+
+def extract_round_scores(content: str) -> tuple[Optional[int], Optional[int]]:
+    """
+    Extract per-side scores from a round scorer's response text.
+    
+    Args:
+        content: Round scorer's response text
+    
+    Returns:
+        Tuple of (proponent score, opposition score); None where not found
+    """
+    content_lower = content.lower()
+    scores = []
+    
+    for side in ("proponent", "opposition"):
+        match = re.search(rf"{side}\W*?:[\s*]*(\d{{1,2}})\s*/\s*10", content_lower)
+        scores.append(min(int(match.group(1)), 10) if match else None)
+    
+    return scores[0], scores[1]
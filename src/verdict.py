@@ -0,0 +1,363 @@
+"""
+Structured judge verdict parsing for the Multi-Agent Debate System.
+
+Judges answer in the markdown format of JUDGE_SYSTEM_PROMPT or, with
+judge_output_format="json", as one JSON object (JUDGE_JSON_SYSTEM_PROMPT).
+Either way the response is parsed once, when the verdict is rendered, into
+a full JudgeVerdict: winner, confidence, per-dimension scores with their
+justifications, each side's strongest arguments, ignored counterarguments,
+reasoning and summary. Stored verdicts can then be analysed directly
+instead of re-parsing the judge's text.
+"""
+
+import json
+import logging
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from .models import ArgumentScore, JudgeVerdict
+from .utils import extract_confidence_from_text, extract_winner_from_text
+
+logger = logging.getLogger(__name__)
+
+WINNERS = ("proponent", "opposition", "tie")
+CONFIDENCES = ("high", "medium", "low")
+
+# Markdown section (lowercased header) -> the part of the verdict it fills;
+# headers not listed here (e.g. the weaknesses) are skipped
+SECTION_FIELDS = {
+    "proponent strengths": "key_arguments_proponent",
+    "opposition strengths": "key_arguments_opposition",
+    "ignored counterarguments": "ignored_counterarguments",
+    "scores": "scores",
+    "verdict": "verdict",
+    "reasoning": "reasoning",
+    "summary": "summary",
+}
+
+LIST_FIELDS = ("key_arguments_proponent", "key_arguments_opposition", "ignored_counterarguments")
+
+_BULLET = re.compile(r"^\s*(?:[-*•+]|\d+[.)])\s+")
+_SCORE = re.compile(r"(\d+(?:\.\d+)?)")
+_NOTHING = re.compile(r"^(?:none|n/?a|nothing)\b", re.IGNORECASE)
+
+
+# ============================================================================
+# Field Parsing
+# ============================================================================
+
+def parse_score(value: Any) -> Optional[int]:
+    """
+    Read a 1-10 score from a table cell or JSON value.
+    
+    Args:
+        value: e.g. 8, "8", "8/10" or "**7.5/10**"
+    
+    Returns:
+        The score rounded and clamped to 1-10, or None if there is none
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        number = float(value)
+    else:
+        match = _SCORE.search(str(value or ""))
+        if not match:
+            return None
+        number = float(match.group(1))
+    return min(max(round(number), 1), 10)
+
+
+def dimension_key(name: str) -> str:
+    """Normalize a scoring dimension name, e.g. '**Logic**' -> 'logic'."""
+    return name.strip().strip("*_ ").lower()
+
+
+def header_name(line: str) -> Optional[str]:
+    """
+    The lowercased name of a markdown header line, or None.
+    
+    '#' headers of any level count. A line that is entirely bold counts
+    only when it names a verdict section, so that '**WINNER: Proponent**'
+    inside the Verdict section is not mistaken for a header.
+    """
+    stripped = line.strip()
+    if stripped.startswith("#"):
+        return stripped.lstrip("#").strip().strip("*:").strip().lower()
+    if stripped.startswith("**") and stripped.rstrip(":").endswith("**"):
+        name = stripped.strip("*:").strip().lower()
+        if name in SECTION_FIELDS:
+            return name
+    return None
+
+
+def table_cells(line: str) -> List[str]:
+    """Cells of a markdown table row, without the outer pipes."""
+    return [cell.strip() for cell in line.strip().strip("|").split("|")]
+
+
+# ============================================================================
+# Markdown Verdicts
+# ============================================================================
+
+def parse_markdown_verdict(content: str) -> JudgeVerdict:
+    """
+    Parse a markdown judge response into a JudgeVerdict in one pass.
+    
+    Lines are routed to the section they appear under: bullets become list
+    items (unbulleted lines continue the item above them), rows of the
+    Scores table become ArgumentScores keyed by lowercased dimension, and
+    the Verdict, Reasoning and Summary sections are kept as text. Winner
+    and confidence are read from the Verdict section, falling back to the
+    whole response when it doesn't name a winner.
+    
+    Args:
+        content: Judge response, cleaned of reasoning
+    
+    Returns:
+        The verdict; fields whose section is missing are left empty
+    """
+    lists: Dict[str, List[str]] = {field: [] for field in LIST_FIELDS}
+    texts: Dict[str, List[str]] = {"verdict": [], "reasoning": [], "summary": []}
+    proponent_scores: Dict[str, ArgumentScore] = {}
+    opposition_scores: Dict[str, ArgumentScore] = {}
+    field = None
+    item_open = False
+    
+    for line in content.splitlines():
+        name = header_name(line)
+        if name is not None:
+            field = SECTION_FIELDS.get(name)
+            item_open = False
+            continue
+        if field is None:
+            continue
+        
+        if field in texts:
+            texts[field].append(line)
+        elif field == "scores":
+            if "|" not in line:
+                continue
+            cells = table_cells(line)
+            if len(cells) < 3:
+                continue
+            dimension = dimension_key(cells[0])
+            if dimension in ("", "dimension", "total") or set(cells[0]) <= set("-: "):
+                continue
+            justification = cells[3] if len(cells) > 3 else ""
+            for cell, scores in ((cells[1], proponent_scores), (cells[2], opposition_scores)):
+                score = parse_score(cell)
+                if score is not None:
+                    scores[dimension] = ArgumentScore(score=score, justification=justification)
+        else:
+            stripped = line.strip()
+            if not stripped:
+                item_open = False
+                continue
+            bullet = _BULLET.match(line)
+            if bullet or not item_open:
+                item = line[bullet.end():].strip() if bullet else stripped
+                if not _NOTHING.match(item):
+                    lists[field].append(item)
+                    item_open = True
+            else:
+                lists[field][-1] += " " + stripped
+    
+    verdict_text = "\n".join(texts["verdict"]).strip()
+    if not extract_winner_from_text(verdict_text):
+        verdict_text = content
+    winner = extract_winner_from_text(verdict_text) or "tie"
+    confidence = extract_confidence_from_text(verdict_text) or "medium"
+    
+    return JudgeVerdict(
+        winner=winner,
+        confidence=confidence,
+        proponent_scores=proponent_scores,
+        opposition_scores=opposition_scores,
+        reasoning="\n".join(texts["reasoning"]).strip() or content,
+        summary=" ".join("\n".join(texts["summary"]).split()) or default_summary(winner, confidence),
+        **lists,
+    )
+
+
+def default_summary(winner: str, confidence: str) -> str:
+    """Summary used when the judge didn't write one."""
+    if winner == "tie":
+        return f"The debate is a tie ({confidence} confidence)."
+    return f"The {winner} wins with {confidence} confidence."
+
+
+# ============================================================================
+# JSON Verdicts
+# ============================================================================
+
+def extract_json_object(content: str) -> Optional[Dict[str, Any]]:
+    """
+    The JSON object in a response, tolerating code fences and stray prose.
+    
+    Args:
+        content: Judge response, cleaned of reasoning
+    
+    Returns:
+        The decoded object, or None if there is no valid one
+    """
+    start, end = content.find("{"), content.rfind("}")
+    if start < 0 or end < start:
+        return None
+    try:
+        data = json.loads(content[start:end + 1])
+    except json.JSONDecodeError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def string_list(value: Any) -> List[str]:
+    """A JSON list of strings, dropping blanks and 'none' placeholders."""
+    if isinstance(value, str):
+        value = [value]
+    if not isinstance(value, list):
+        return []
+    items = [str(item).strip() for item in value if item is not None]
+    return [item for item in items if item and not _NOTHING.match(item)]
+
+
+def parse_json_verdict(content: str) -> Optional[JudgeVerdict]:
+    """
+    Parse a JSON judge response (see JUDGE_JSON_SYSTEM_PROMPT).
+    
+    Args:
+        content: Judge response, cleaned of reasoning
+    
+    Returns:
+        The verdict, or None if the response holds no usable JSON object
+    """
+    data = extract_json_object(content)
+    if data is None:
+        return None
+    
+    winner = str(data.get("winner", "")).strip().lower()
+    if winner not in WINNERS:
+        winner = next((side for side in WINNERS if side in winner), "tie")
+    confidence = str(data.get("confidence", "")).strip().lower()
+    if confidence not in CONFIDENCES:
+        confidence = "medium"
+    
+    proponent_scores: Dict[str, ArgumentScore] = {}
+    opposition_scores: Dict[str, ArgumentScore] = {}
+    scores = data.get("scores")
+    if isinstance(scores, dict):
+        for name, row in scores.items():
+            if not isinstance(row, dict) or dimension_key(name) == "total":
+                continue
+            justification = str(row.get("notes") or row.get("justification") or "")
+            for side, side_scores in (("proponent", proponent_scores), ("opposition", opposition_scores)):
+                score = parse_score(row.get(side))
+                if score is not None:
+                    side_scores[dimension_key(name)] = ArgumentScore(score=score, justification=justification)
+    
+    reasoning = str(data.get("reasoning") or "").strip()
+    summary = str(data.get("summary") or "").strip()
+    return JudgeVerdict(
+        winner=winner,
+        confidence=confidence,
+        proponent_scores=proponent_scores,
+        opposition_scores=opposition_scores,
+        key_arguments_proponent=string_list(data.get("proponent_strengths")),
+        key_arguments_opposition=string_list(data.get("opposition_strengths")),
+        ignored_counterarguments=string_list(data.get("ignored_counterarguments")),
+        reasoning=reasoning or summary or default_summary(winner, confidence),
+        summary=summary or default_summary(winner, confidence),
+    )
+
+
+def render_verdict(verdict: JudgeVerdict) -> str:
+    """
+    Render a verdict in the markdown judge format.
+    
+    Used as the judge's transcript entry when it answered in JSON, so
+    transcripts read the same whichever format the judge used.
+    
+    Args:
+        verdict: Parsed verdict
+    
+    Returns:
+        Markdown with the JUDGE_SYSTEM_PROMPT headers
+    """
+    def bullets(items: List[str]) -> str:
+        return "\n".join(f"- {item}" for item in items) or "- None"
+    
+    lines = [
+        "## Argument Analysis",
+        "",
+        "### Proponent Strengths",
+        bullets(verdict.key_arguments_proponent),
+        "",
+        "### Opposition Strengths",
+        bullets(verdict.key_arguments_opposition),
+        "",
+        "## Ignored Counterarguments",
+        bullets(verdict.ignored_counterarguments),
+        "",
+        "## Scores",
+        "",
+        "| Dimension | Proponent | Opposition | Notes |",
+        "|-----------|-----------|------------|-------|",
+    ]
+    dimensions = list(dict.fromkeys([*verdict.proponent_scores, *verdict.opposition_scores]))
+    for dimension in dimensions:
+        proponent = verdict.proponent_scores.get(dimension)
+        opposition = verdict.opposition_scores.get(dimension)
+        notes = (proponent or opposition).justification.replace("|", "/")
+        lines.append(
+            f"| {dimension.title()} | {f'{proponent.score}/10' if proponent else '-'} "
+            f"| {f'{opposition.score}/10' if opposition else '-'} | {notes} |"
+        )
+    if dimensions:
+        total = len(dimensions) * 10
+        lines.append(
+            f"| **TOTAL** | {score_total(verdict.proponent_scores)}/{total} "
+            f"| {score_total(verdict.opposition_scores)}/{total} | |"
+        )
+    lines += [
+        "",
+        "## Verdict",
+        "",
+        f"**WINNER: {verdict.winner.capitalize()}**",
+        f"**CONFIDENCE: {verdict.confidence.capitalize()}**",
+        "",
+        "## Reasoning",
+        verdict.reasoning,
+        "",
+        "## Summary",
+        verdict.summary,
+    ]
+    return "\n".join(lines)
+
+
+def score_total(scores: Dict[str, ArgumentScore]) -> int:
+    """Sum of a side's dimension scores."""
+    return sum(score.score for score in scores.values())
+
+
+# ============================================================================
+# Entry Point
+# ============================================================================
+
+def parse_verdict(content: str, output_format: str = "markdown") -> Tuple[JudgeVerdict, bool]:
+    """
+    Parse a judge response in the configured format.
+    
+    A JSON response that can't be decoded is parsed as markdown instead,
+    since judges asked for JSON sometimes answer in the markdown format.
+    
+    Args:
+        content: Judge response, cleaned of reasoning
+        output_format: "markdown" or "json" (DebateConfig.judge_output_format)
+    
+    Returns:
+        Tuple of (verdict, whether it was parsed from JSON)
+    """
+    if output_format == "json":
+        verdict = parse_json_verdict(content)
+        if verdict is not None:
+            return verdict, True
+        logger.warning("Judge response is not valid JSON; parsing it as markdown")
+    return parse_markdown_verdict(content), False